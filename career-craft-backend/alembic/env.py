@@ -10,7 +10,7 @@ from dotenv import load_dotenv
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from app.database import Base
-from app.models import User, Resume  # Import all models here
+from app.models import User, Resume, ParseJob  # Import all models here
 
 # Load environment variables
 load_dotenv()
@@ -1,5 +1,5 @@
 from .database import Base, engine, get_db
-from .models import User, Resume
+from .models import User, Resume, ParseJob
 from .schemas import (
     UserBase, UserCreate, User,
     ResumeBase, ResumeCreate, Resume, 
@@ -16,6 +16,7 @@ __all__ = [
     "get_db",
     "User",
     "Resume",
+    "ParseJob",
     "UserBase",
     "UserCreate",
     "ResumeBase",
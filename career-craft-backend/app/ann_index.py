@@ -0,0 +1,221 @@
+from typing import List, Optional, Tuple
+import json
+import os
+import numpy as np
+from scipy import sparse
+from .job_recommender import top_k
+from .storage import atomic_directory
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length (zero rows stay zero), as float32."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+def spherical_kmeans(vectors: np.ndarray, clusters: int, iterations: int = 10, seed: int = 0) -> np.ndarray:
+    """Unit-length centroids that partition unit vectors by cosine similarity."""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = _nearest(vectors, centroids)
+        members = sparse.csr_matrix(
+            (np.ones(len(vectors), dtype=np.float32), (assignment, np.arange(len(vectors)))),
+            shape=(clusters, len(vectors))
+        )
+        sums = np.asarray(members @ vectors)
+        empty = np.flatnonzero(np.diff(members.indptr) == 0)
+        # Restart empty clusters from random points so every list gets used
+        sums[empty] = vectors[rng.choice(len(vectors), len(empty), replace=False)]
+        centroids = normalize_rows(sums)
+    return centroids
+
+def _nearest(vectors: np.ndarray, centroids: np.ndarray, batch: int = 65536) -> np.ndarray:
+    """Index of the most similar centroid for each vector, in batches to bound memory."""
+    return np.concatenate([
+        np.argmax(vectors[start:start + batch] @ centroids.T, axis=1)
+        for start in range(0, len(vectors), batch)
+    ]) if len(vectors) else np.empty(0, dtype=np.int64)
+
+class IVFIndex:
+    """Approximate nearest-neighbour search over unit vectors by inverted file (IVF).
+
+    Vectors are partitioned into `nlist` lists by spherical k-means. A search
+    scores the `nprobe` centroids closest to the query and then only the
+    vectors in those lists, so work is about nprobe / nlist of an exact scan.
+    Raising `nprobe` trades latency for recall; nprobe == nlist is exact.
+
+    Compiled vectors are stored grouped by list, each list contiguous, so a
+    probe is a slice. Vectors added later go to per-list buffers that are
+    searched alongside, and are folded in once more than `compact_after` have
+    built up (and by `compact`). A saved index is memory-mapped when loaded;
+    its mapping is shared by every worker, so compacting it only merges each
+    list's buffers into one block and leaves the mapping alone. `save` writes
+    everything out compacted.
+
+    Scores are inner products, i.e. cosine similarity for unit vectors.
+    """
+
+    def __init__(self, centroids: np.ndarray, nprobe: int = 16, compact_after: int = 4096):
+        self.centroids = np.asarray(centroids, dtype=np.float32)
+        self.nprobe = nprobe
+        self.compact_after = compact_after
+        self.vectors = np.empty((0, self.dim), dtype=np.float32)
+        self.ids = np.empty(0, dtype=np.int64)
+        self.offsets = np.zeros(self.nlist + 1, dtype=np.int64)
+        # Added since compiling: per list, blocks of vectors and their ids
+        self._pending_vectors: List[List[np.ndarray]] = [[] for _ in range(self.nlist)]
+        self._pending_ids: List[List[np.ndarray]] = [[] for _ in range(self.nlist)]
+        self._pending = 0
+        # Added since the last compaction
+        self._uncompacted = 0
+        self.next_id = 0
+
+    @property
+    def nlist(self) -> int:
+        return len(self.centroids)
+
+    @property
+    def dim(self) -> int:
+        return self.centroids.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.ids) + self._pending
+
+    @classmethod
+    def train(
+        cls,
+        vectors: np.ndarray,
+        nlist: Optional[int] = None,
+        nprobe: int = 16,
+        iterations: int = 10,
+        max_training_points: int = 256,
+        seed: int = 0
+    ) -> "IVFIndex":
+        """Fit centroids to a sample of `vectors` (at most max_training_points per list).
+
+        `nlist` defaults to about sqrt(n), the usual balance between scanning
+        centroids and scanning lists.
+        """
+        vectors = normalize_rows(vectors)
+        nlist = nlist or max(1, int(np.sqrt(len(vectors))))
+        nlist = min(nlist, len(vectors))
+        sample = vectors
+        if len(vectors) > nlist * max_training_points:
+            rng = np.random.default_rng(seed)
+            sample = vectors[rng.choice(len(vectors), nlist * max_training_points, replace=False)]
+        return cls(spherical_kmeans(sample, nlist, iterations, seed), nprobe)
+
+    def add(self, vectors: np.ndarray, ids: Optional[np.ndarray] = None) -> np.ndarray:
+        """Add vectors (normalized here); returns their ids, numbered from `next_id` unless given."""
+        vectors = normalize_rows(np.atleast_2d(vectors))
+        if ids is None:
+            ids = np.arange(self.next_id, self.next_id + len(vectors), dtype=np.int64)
+        ids = np.asarray(ids, dtype=np.int64)
+        if len(ids):
+            self.next_id = max(self.next_id, int(ids.max()) + 1)
+
+        assignment = _nearest(vectors, self.centroids)
+        order = np.argsort(assignment, kind="stable")
+        list_ids, starts = np.unique(assignment[order], return_index=True)
+        for list_id, members in zip(list_ids, np.split(order, starts[1:])):
+            self._pending_vectors[list_id].append(vectors[members])
+            self._pending_ids[list_id].append(ids[members])
+        self._pending += len(vectors)
+        self._uncompacted += len(vectors)
+        if self._uncompacted > self.compact_after:
+            self.compact()
+        return ids
+
+    def compact(self):
+        """Fold added vectors into the contiguous per-list storage.
+
+        A memory-mapped index keeps its mapping and only merges each list's
+        added vectors into one block, rather than copying the whole mapping
+        into this process.
+        """
+        self._uncompacted = 0
+        if not self._pending:
+            return
+        if isinstance(self.vectors, np.memmap):
+            for list_id in range(self.nlist):
+                if len(self._pending_ids[list_id]) > 1:
+                    self._pending_vectors[list_id] = [np.concatenate(self._pending_vectors[list_id])]
+                    self._pending_ids[list_id] = [np.concatenate(self._pending_ids[list_id])]
+            return
+        self.vectors, self.ids, self.offsets = self._merged()
+        self._pending_vectors = [[] for _ in range(self.nlist)]
+        self._pending_ids = [[] for _ in range(self.nlist)]
+        self._pending = 0
+
+    def _merged(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(vectors, ids, offsets) of the per-list storage with the added vectors folded in."""
+        if not self._pending:
+            return self.vectors, self.ids, self.offsets
+        vectors, ids, sizes = [], [], []
+        for list_id in range(self.nlist):
+            start, end = self.offsets[list_id], self.offsets[list_id + 1]
+            vectors.append(np.asarray(self.vectors[start:end]))
+            ids.append(np.asarray(self.ids[start:end]))
+            vectors.extend(self._pending_vectors[list_id])
+            ids.extend(self._pending_ids[list_id])
+            sizes.append(end - start + sum(len(block) for block in self._pending_ids[list_id]))
+        return (
+            np.concatenate(vectors).astype(np.float32, copy=False),
+            np.concatenate(ids),
+            np.concatenate(([0], np.cumsum(sizes))).astype(np.int64)
+        )
+
+    def _blocks(self, list_ids: np.ndarray):
+        """(vectors, ids) blocks stored in the given lists."""
+        for list_id in list_ids:
+            start, end = self.offsets[list_id], self.offsets[list_id + 1]
+            if end > start:
+                yield self.vectors[start:end], self.ids[start:end]
+            yield from zip(self._pending_vectors[list_id], self._pending_ids[list_id])
+
+    def _search_lists(self, query: np.ndarray, list_ids: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        scores, ids = [], []
+        for block_vectors, block_ids in self._blocks(list_ids):
+            scores.append(block_vectors @ query)
+            ids.append(block_ids)
+        if not ids:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        scores, ids = np.concatenate(scores), np.concatenate(ids)
+        best = top_k(scores, k)
+        return ids[best], scores[best]
+
+    def search(self, query: np.ndarray, k: int = 10, nprobe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(ids, scores) of about the k most similar vectors, best first."""
+        query = normalize_rows(query)
+        nprobe = min(nprobe or self.nprobe, self.nlist)
+        probes = top_k(self.centroids @ query, nprobe)
+        return self._search_lists(query, probes, k)
+
+    def search_exact(self, query: np.ndarray, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """(ids, scores) of the k most similar vectors by scanning every list."""
+        return self._search_lists(normalize_rows(query), np.arange(self.nlist), k)
+
+    def save(self, directory: str):
+        """Write the index (compacted) to `directory`, replacing any index already there."""
+        vectors, ids, offsets = self._merged()
+        arrays = {"centroids": self.centroids, "vectors": vectors, "ids": ids, "offsets": offsets}
+        with atomic_directory(directory, prefix=".ivf_index-") as staging:
+            for name, array in arrays.items():
+                np.save(os.path.join(staging, f"{name}.npy"), np.asarray(array))
+            with open(os.path.join(staging, "meta.json"), 'w') as f:
+                json.dump({"nprobe": self.nprobe, "compact_after": self.compact_after, "next_id": self.next_id}, f)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "IVFIndex":
+        """Open a saved index; vectors and ids are memory-mapped read-only unless `mmap` is False."""
+        # Read every file from one version, even if a writer swaps the link meanwhile
+        directory = os.path.realpath(directory)
+        with open(os.path.join(directory, "meta.json"), 'r') as f:
+            meta = json.load(f)
+        mode = 'r' if mmap else None
+        index = cls(np.load(os.path.join(directory, "centroids.npy")), meta["nprobe"], meta["compact_after"])
+        index.vectors = np.load(os.path.join(directory, "vectors.npy"), mmap_mode=mode)
+        index.ids = np.load(os.path.join(directory, "ids.npy"), mmap_mode=mode)
+        index.offsets = np.load(os.path.join(directory, "offsets.npy"))
+        index.next_id = meta["next_id"]
+        return index
@@ -0,0 +1,88 @@
+from typing import Callable, Dict, List, Optional
+from calendar import monthrange
+from datetime import datetime
+from functools import lru_cache
+from dateutil import parser as date_parser
+import re
+
+# Month lookup keyed by the first three letters of the month name
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# One alternation covering the date formats common in resumes. Branches are
+# tried left to right, so "Jan 2020" is read as a month and year rather than
+# also yielding a bare "2020".
+DATE_PATTERN = re.compile(
+    r'(?P<month>Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|'
+    r'Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|'
+    r'Dec(?:ember)?)[,\s]+(?P<month_year>\d{4})'
+    r'|(?P<numeric_month>\d{1,2})/(?P<numeric_year>\d{4})'
+    r'|(?<!\d)(?P<year>(?:19|20)\d{2})(?!\d)'
+)
+
+def _fill(default: datetime, year: int, month: int) -> datetime:
+    """Fill a partial date from `default` the way dateutil does, clamping the day."""
+    day = min(default.day, monthrange(year, month)[1])
+    return default.replace(year=year, month=month, day=day)
+
+@lru_cache(maxsize=4096)
+def _parse_token(token: str, default: datetime) -> Optional[datetime]:
+    """Fallback for tokens the fast path cannot resolve (memoized)."""
+    try:
+        return date_parser.parse(token, default=default)
+    except (ValueError, OverflowError):
+        return None
+
+class DateScanner:
+    """Single-pass date extraction for resume entries.
+
+    Matches are converted with a month lookup table; only tokens the table
+    cannot resolve (e.g. "13/2020") go through dateutil, and those results are
+    memoized. Partial dates are filled from today's date, matching dateutil.
+    """
+
+    def __init__(self, now: Callable[[], datetime] = datetime.now):
+        self.now = now
+
+    def scan(self, text: str) -> List[datetime]:
+        """Return every date found in the text, in text order."""
+        default = self.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        dates = []
+        for match in DATE_PATTERN.finditer(text):
+            date = self._convert(match, default)
+            if date is not None:
+                dates.append(date)
+        return dates
+
+    def extract(self, text: str) -> Dict[str, Optional[datetime]]:
+        """Return the earliest date as start_date and the latest as end_date."""
+        dates = self.scan(text)
+
+        # If no dates found, use current date as default
+        if not dates:
+            default_date = self.now().replace(month=1, day=1)
+            return {
+                'start_date': default_date,
+                'end_date': None
+            }
+
+        start_date = min(dates)
+        end_date = max(dates)
+        return {
+            'start_date': start_date,
+            'end_date': end_date if len(dates) > 1 else None
+        }
+
+    def _convert(self, match: re.Match, default: datetime) -> Optional[datetime]:
+        try:
+            if match.lastgroup == 'year':
+                return _fill(default, int(match.group('year')), default.month)
+            if match.lastgroup == 'month_year':
+                month = MONTHS[match.group('month')[:3].lower()]
+                return _fill(default, int(match.group('month_year')), month)
+            return _fill(default, int(match.group('numeric_year')), int(match.group('numeric_month')))
+        except ValueError:
+            # Out-of-range month or year; let dateutil decide
+            return _parse_token(match.group(), default)
@@ -0,0 +1,275 @@
+from typing import Callable, Iterable, Iterator, Optional, Tuple
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from functools import partial
+from sqlalchemy.orm import Session
+import os
+import socket
+import uuid
+from .database import SessionLocal
+from .metrics import ParseTimings
+from .parse_preload import PRELOAD_MODEL_VAR, PRELOAD_PROFILE_VAR
+from .parse_sandbox import SandboxPool
+from .nlp_registry import DEFAULT_MODEL, DEFAULT_PROFILE, get_nlp
+from .parse_cache import ParseCache
+from .resume_parser import ResumeParser, resume_title
+from .schemas import ResumeCreate
+from . import models
+
+JOB_PENDING = "pending"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+INTERRUPTED = "Parsing was interrupted by a server restart. Please upload the file again."
+
+def _process_running(pid: int) -> bool:
+    """Whether a process with this pid exists on this host."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+# Parser instance owned by each worker process
+_worker_parser: Optional[ResumeParser] = None
+
+def _init_worker(parser_kwargs: dict):
+    """Build the per-process parser once, when the worker starts."""
+    global _worker_parser
+    _worker_parser = ResumeParser(**parser_kwargs)
+    # Load the model now rather than on the first job; this is free when the
+    # fork server preloaded it (ParseJobQueue's `preload_nlp`)
+    get_nlp(_worker_parser.model_name, _worker_parser.nlp_profile)
+
+def _parse_in_worker(data: bytes, filename: str) -> Tuple[ResumeCreate, ParseTimings]:
+    """Parse one uploaded file inside a worker process.
+
+    Stage timings go back to the parent with the result, since metrics are
+    served from the parent process.
+    """
+    timings = ParseTimings()
+    return _worker_parser.parse_resume(data, filename, timings), timings
+
+class ParseJobQueue:
+    """Parse uploaded resumes in sandboxed worker processes, tracking each upload in the parse_jobs table.
+
+    `persist` receives a session, the job row and the parsed resume, and returns
+    the saved `models.Resume`; the queue commits and records the resume id.
+    `sandbox_limits` are passed to SandboxPool (cpu_seconds, max_job_rss_mb,
+    wall_seconds, max_jobs_per_worker); a file that exceeds them fails its job
+    without affecting others. With `preload_nlp` the parse pipeline is loaded
+    once in the workers' fork server and shared by every worker, instead of
+    loaded by each.
+
+    Each job records its owner (host, pid and a per-queue boot id), so that
+    recover() in one web process leaves jobs that sibling processes are still
+    parsing alone. Jobs whose owner can't be checked from here (another host,
+    or no owner) are only failed once older than `stale_after_seconds`.
+    """
+
+    def __init__(
+        self,
+        persist: Callable[[Session, models.ParseJob, ResumeCreate], models.Resume],
+        max_workers: Optional[int] = None,
+        parser_kwargs: Optional[dict] = None,
+        cache: Optional[ParseCache] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        sandbox_limits: Optional[dict] = None,
+        preload_nlp: bool = False,
+        stale_after_seconds: float = 3600
+    ):
+        self.persist = persist
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Workers parse one file each, so they extract PDF pages serially
+        self.parser_kwargs = {"pdf_workers": 1, **(parser_kwargs or {})}
+        self.cache = cache
+        self.session_factory = session_factory
+        self.sandbox_limits = sandbox_limits or {}
+        self.preload_nlp = preload_nlp
+        self.stale_after_seconds = stale_after_seconds
+        self.host = socket.gethostname()
+        self.owner = f"{self.host}:{os.getpid()}:{uuid.uuid4().hex}"
+        self._executor = None
+
+    def submit(self, db: Session, user_id: int, data: bytes, filename: str, job_description: str) -> models.ParseJob:
+        """Record a parse job for an uploaded file's bytes and hand it to the pool."""
+        job = models.ParseJob(
+            id=uuid.uuid4().hex,
+            user_id=user_id,
+            status=JOB_PENDING,
+            filename=filename,
+            job_description=job_description,
+            owner=self.owner
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.key_for(data)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                # Repeat upload: finish inline without touching the pool
+                cached.title = resume_title(filename)
+                timings = ParseTimings(os.path.splitext(filename or "")[1].lower(), len(data))
+                self._finish(job.id, cached, None, timings)
+                db.refresh(job)
+                return job
+
+        self._dispatch(job.id, data, filename, cache_key)
+        return job
+
+    def parse_many(
+        self,
+        files: Iterable[Tuple[bytes, str]],
+        on_error: Optional[Callable[[str, Exception], None]] = None
+    ) -> Iterator[ResumeCreate]:
+        """Parse a batch of (bytes, filename) uploads in the worker pool, yielding resumes in input order.
+
+        Nothing is recorded in the parse_jobs table. Each file is its own
+        sandboxed job under the same limits as a single upload, so a file that
+        breaks them fails alone. Failed files are skipped and passed to
+        `on_error` with their exception, or printed when no callback is given.
+        """
+        pending = []
+        for data, filename in files:
+            cache_key = self.cache.key_for(data) if self.cache is not None else None
+            cached = self.cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                cached.title = resume_title(filename)
+                future = Future()
+                future.set_result((cached, None))
+            else:
+                future = self._get_executor().submit(_parse_in_worker, data, filename)
+            pending.append((filename, cache_key, cached is not None, future))
+
+        for filename, cache_key, from_cache, future in pending:
+            try:
+                resume_data, timings = future.result()
+            except Exception as e:
+                if on_error is not None:
+                    on_error(filename, e)
+                else:
+                    print(f"Error parsing {filename}: {str(getattr(e, 'detail', e))}")
+                continue
+            if not from_cache:
+                if cache_key is not None:
+                    self.cache.put(cache_key, resume_data)
+                timings.record()
+            yield resume_data
+
+    def get(self, db: Session, job_id: str, user_id: int) -> Optional[models.ParseJob]:
+        """Look up a job belonging to the given user."""
+        return db.query(models.ParseJob).filter(
+            models.ParseJob.id == job_id,
+            models.ParseJob.user_id == user_id
+        ).first()
+
+    def recover(self):
+        """Fail jobs left pending by a process that is gone, e.g. after a restart.
+
+        Uploads are only held in memory, so their bytes did not survive. Run
+        from every web process at start-up, so it must not touch jobs that a
+        sibling process is still parsing.
+        """
+        db = self.session_factory()
+        try:
+            pending = db.query(models.ParseJob).filter(models.ParseJob.status == JOB_PENDING).all()
+            for job in pending:
+                if self._is_stale(job):
+                    job.status = JOB_FAILED
+                    job.error = INTERRUPTED
+            db.commit()
+        finally:
+            db.close()
+
+    def _is_stale(self, job: models.ParseJob) -> bool:
+        """Whether a pending job's owner can no longer finish it."""
+        host, pid, boot_id = (job.owner or "::").rsplit(":", 2)
+        if host == self.host and pid.isdigit():
+            if job.owner == self.owner:
+                return False
+            # Same pid with another boot id is an earlier run of this process
+            # (e.g. pid 1 in a restarted container)
+            return int(pid) == os.getpid() or not _process_running(int(pid))
+        created_at = job.created_at
+        if created_at is None:
+            return True
+        if created_at.tzinfo is None:
+            # SQLite returns server timestamps naive, in UTC
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return (datetime.now(timezone.utc) - created_at).total_seconds() > self.stale_after_seconds
+
+    def shutdown(self):
+        """Stop the worker pool. Unfinished jobs stay pending until a later recover() fails them."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> SandboxPool:
+        if self._executor is None:
+            preload = ()
+            if self.preload_nlp:
+                # The fork server inherits this environment when the pool starts it
+                os.environ[PRELOAD_MODEL_VAR] = self.parser_kwargs.get("model_name", DEFAULT_MODEL)
+                os.environ[PRELOAD_PROFILE_VAR] = self.parser_kwargs.get("nlp_profile", DEFAULT_PROFILE)
+                preload = (f"{__package__}.parse_preload",)
+            self._executor = SandboxPool(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.parser_kwargs,),
+                preload=preload,
+                **self.sandbox_limits
+            )
+        return self._executor
+
+    def _dispatch(self, job_id: str, data: bytes, filename: str, cache_key: Optional[str]):
+        future = self._get_executor().submit(_parse_in_worker, data, filename)
+        future.add_done_callback(partial(self._on_done, job_id, cache_key))
+
+    def _on_done(self, job_id: str, cache_key: Optional[str], future: Future):
+        """Persist the result of a finished parse (runs on the pool's callback thread)."""
+        if future.cancelled():
+            return
+        error = future.exception()
+        resume_data, timings = (None, None) if error else future.result()
+        if resume_data is not None and cache_key is not None:
+            self.cache.put(cache_key, resume_data)
+        self._finish(job_id, resume_data, error, timings)
+
+    def _finish(
+        self,
+        job_id: str,
+        resume_data: Optional[ResumeCreate],
+        error: Optional[BaseException],
+        timings: Optional[ParseTimings] = None
+    ):
+        timings = timings or ParseTimings()
+        db = self.session_factory()
+        try:
+            job = db.get(models.ParseJob, job_id)
+            if error is None:
+                try:
+                    with timings.stage("persist"):
+                        db_resume = self.persist(db, job, resume_data)
+                        db.flush()
+                    job.resume_id = db_resume.id
+                    job.status = JOB_COMPLETED
+                except Exception as e:
+                    db.rollback()
+                    job = db.get(models.ParseJob, job_id)
+                    error = e
+            if error is not None:
+                print(f"Error parsing resume for job {job_id}: {str(error)}")
+                job.status = JOB_FAILED
+                # HTTP exceptions (e.g. FileProcessingException) carry their message in `detail`
+                job.error = str(getattr(error, "detail", error))
+            with timings.stage("persist"):
+                db.commit()
+        finally:
+            db.close()
+        if error is None:
+            timings.record()
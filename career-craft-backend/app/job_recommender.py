@@ -0,0 +1,240 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import json
+import threading
+import numpy as np
+from scipy import sparse
+from .skill_bitset import SkillInterner, intersection_counts, normalize_skill, pack, pack_many, words_for
+from .skill_matcher import JOBS_PATH
+
+# Weights of the two match scores in a job's overall score
+SKILL_MATCH_WEIGHT = 0.7
+TARGET_MATCH_WEIGHT = 0.3
+
+class JobRecommender:
+    """Scores a job catalog against a resume through a skill -> jobs inverted index.
+
+    The catalog is compiled into a sparse matrix with a row per job and two
+    blocks of columns per distinct required skill, numbered by `vocabulary`:
+
+        [ 0.7 / |job| where the job needs the skill | 1 where it does ]
+
+    Stored by column, each column is the posting list of the jobs needing that
+    skill. A query is a sparse vector with 1 for each resume skill in the first
+    block and 0.3 / |target| for each target skill in the second, so one
+    matrix-vector product gives
+
+        0.7 * |resume ∩ job| / |job| + 0.3 * |target ∩ job| / |target|
+
+    while reading only the posting lists of the query's skills: only jobs that
+    share a skill with the query are scored, every other job scores 0. The
+    top k are found with a partial selection rather than a full sort, ties
+    broken by job id (catalog order).
+
+    Jobs can be added and removed without recompiling. Added jobs go to small
+    in-memory posting lists scored alongside the matrix, removed ones are
+    masked out, and the matrix is recompiled once `compact_after` changes
+    have built up. Job ids are positions in `jobs` and stay stable; a removed
+    job's slot is None.
+
+    To rank many resumes for one job, `score_resumes` packs their skill sets
+    into uint64 bitsets and counts overlaps with popcounts.
+    """
+
+    # Scores are compared at this many decimals, so jobs whose ratios are equal
+    # (1/2 and 2/4) tie however the floating point sums were rounded
+    SCORE_DECIMALS = 12
+
+    def __init__(self, jobs: List[dict], compact_after: int = 1024):
+        self.jobs: List[Optional[dict]] = list(jobs)
+        self.compact_after = compact_after
+        self.vocabulary = SkillInterner()
+        self._lock = threading.Lock()
+        self._compile()
+
+    @classmethod
+    def from_file(cls, path: str = JOBS_PATH) -> "JobRecommender":
+        with open(path, 'r') as f:
+            return cls(json.load(f))
+
+    def add_job(self, job: dict) -> int:
+        """Add a job to the catalog and return its id."""
+        with self._lock:
+            skill_ids = {self.vocabulary.intern(skill) for skill in job["requiredSkills"]}
+            job_id = len(self.jobs)
+            self.jobs.append(job)
+            self._added[job_id] = len(skill_ids)
+            for skill_id in skill_ids:
+                self._added_postings.setdefault(skill_id, set()).add(job_id)
+            self._maybe_compact()
+        return job_id
+
+    def remove_job(self, job_id: int):
+        """Remove a job from the catalog; its id is not reused."""
+        with self._lock:
+            if not 0 <= job_id < len(self.jobs) or self.jobs[job_id] is None:
+                raise KeyError(job_id)
+            if job_id in self._added:
+                del self._added[job_id]
+                for skill_id in self.vocabulary.ids(self.jobs[job_id]["requiredSkills"]):
+                    postings = self._added_postings[skill_id]
+                    postings.discard(job_id)
+                    if not postings:
+                        del self._added_postings[skill_id]
+            else:
+                self._removed.add(job_id)
+            self.jobs[job_id] = None
+            self._maybe_compact()
+
+    def compact(self):
+        """Fold added and removed jobs into the compiled matrix."""
+        with self._lock:
+            self._compile()
+
+    def _maybe_compact(self):
+        """Caller holds the lock."""
+        if len(self._added) + len(self._removed) > self.compact_after:
+            self._compile()
+
+    def _compile(self):
+        """Build the matrix from the live jobs. Caller holds the lock (or is __init__)."""
+        row_ids, indptr, indices = [], [0], []
+        for job_id, job in enumerate(self.jobs):
+            if job is None:
+                continue
+            columns = {self.vocabulary.intern(skill) for skill in job["requiredSkills"]}
+            row_ids.append(job_id)
+            indices.extend(sorted(columns))
+            indptr.append(len(indices))
+
+        indices = np.array(indices, dtype=np.int32)
+        indptr = np.array(indptr, dtype=np.int64)
+        sizes = np.diff(indptr)
+        shape = (len(row_ids), len(self.vocabulary))
+        required = sparse.csr_matrix((np.ones(len(indices)), indices, indptr), shape=shape)
+        weighted = sparse.csr_matrix((np.repeat(SKILL_MATCH_WEIGHT / np.maximum(sizes, 1), sizes), indices, indptr), shape=shape)
+        self.matrix = sparse.hstack([weighted, required], format="csc")
+        # Matrix row -> job id, increasing
+        self._row_ids = np.array(row_ids, dtype=np.int64)
+        # Skills the matrix has columns for; later skills only occur in added jobs
+        self._width = len(self.vocabulary)
+        # Changes since compiling: added job id -> skill count, skill id -> added jobs, removed ids
+        self._added: Dict[int, int] = {}
+        self._added_postings: Dict[int, Set[int]] = {}
+        self._removed: Set[int] = set()
+
+    def _query(self, resume_ids: List[int], target_ids: List[int], target_count: int) -> sparse.csc_matrix:
+        # Skills interned after compiling have no column; only added jobs can match them
+        resume_columns = [i for i in resume_ids if i < self._width]
+        target_columns = [self._width + i for i in target_ids if i < self._width]
+        target_weight = TARGET_MATCH_WEIGHT / target_count if target_count else 0.0
+        data = [1.0] * len(resume_columns) + [target_weight] * len(target_columns)
+        rows = resume_columns + target_columns
+        return sparse.csc_matrix((data, (rows, [0] * len(rows))), shape=(2 * self._width, 1))
+
+    def _matches(self, resume_skills: Iterable[str], target_skills: Iterable[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """(job ids in catalog order, their scores) for jobs sharing a skill with the query."""
+        target_count = len({normalize_skill(skill) for skill in target_skills})
+        with self._lock:
+            resume_ids = self.vocabulary.ids(resume_skills)
+            target_ids = self.vocabulary.ids(target_skills)
+            product = self.matrix @ self._query(resume_ids, target_ids, target_count)
+            product.sort_indices()
+            job_ids = self._row_ids[product.indices]
+            scores = product.data
+            if self._removed:
+                live = ~np.isin(job_ids, np.fromiter(self._removed, dtype=np.int64))
+                job_ids, scores = job_ids[live], scores[live]
+            if self._added:
+                added_ids, added_scores = self._score_added(resume_ids, target_ids, target_count)
+                job_ids = np.concatenate((job_ids, added_ids))
+                scores = np.concatenate((scores, added_scores))
+        return job_ids, np.round(scores, self.SCORE_DECIMALS)
+
+    def _score_added(self, resume_ids: List[int], target_ids: List[int], target_count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Score jobs added since compiling from their posting lists. Caller holds the lock."""
+        resume_hits: Dict[int, int] = {}
+        target_hits: Dict[int, int] = {}
+        for skill_ids, hits in ((resume_ids, resume_hits), (target_ids, target_hits)):
+            for skill_id in skill_ids:
+                for job_id in self._added_postings.get(skill_id, ()):
+                    hits[job_id] = hits.get(job_id, 0) + 1
+
+        # Added ids are all above the compiled ones, so sorting keeps catalog order
+        job_ids = sorted(resume_hits.keys() | target_hits.keys())
+        target_weight = TARGET_MATCH_WEIGHT / target_count if target_count else 0.0
+        scores = [
+            SKILL_MATCH_WEIGHT * resume_hits.get(job_id, 0) / self._added[job_id]
+            + target_weight * target_hits.get(job_id, 0)
+            for job_id in job_ids
+        ]
+        return np.array(job_ids, dtype=np.int64), np.array(scores, dtype=np.float64)
+
+    def scores(self, resume_skills: Iterable[str], target_skills: Iterable[str]) -> np.ndarray:
+        """Score of every job id (0-1; 0 for removed jobs)."""
+        result = np.zeros(len(self.jobs))
+        job_ids, scores = self._matches(resume_skills, target_skills)
+        result[job_ids] = scores
+        return result
+
+    def top(self, resume_skills: Iterable[str], target_skills: Iterable[str], k: int = 5) -> List[Tuple[dict, float]]:
+        """The k best (job, score) pairs, best first."""
+        job_ids, scores = self._matches(resume_skills, target_skills)
+        ranked = [(int(job_ids[i]), float(scores[i])) for i in top_k(scores, k)]
+        # Too few matches: pad with the earliest unmatched jobs, which score 0
+        if len(ranked) < k:
+            matched = set(job_ids.tolist())
+            for job_id, job in enumerate(self.jobs):
+                if len(ranked) >= k:
+                    break
+                if job is not None and job_id not in matched:
+                    ranked.append((job_id, 0.0))
+        return [(self.jobs[job_id], score) for job_id, score in ranked]
+
+    def score_resumes(self, job_id: int, resumes: Iterable[Iterable[str]], target_skills: Iterable[str] = ()) -> np.ndarray:
+        """Score many resumes' skill sets against one job, in the order given."""
+        target_count = len({normalize_skill(skill) for skill in target_skills})
+        with self._lock:
+            if not 0 <= job_id < len(self.jobs) or self.jobs[job_id] is None:
+                raise KeyError(job_id)
+            job_skills = self.vocabulary.ids(self.jobs[job_id]["requiredSkills"])
+            target_hits = len(set(self.vocabulary.ids(target_skills)).intersection(job_skills))
+            words = words_for(len(self.vocabulary))
+            # Resume skills no job needs have no id, and could not match anyway
+            resume_bits = pack_many((self.vocabulary.ids(skills) for skills in resumes), words)
+
+        scores = np.full(len(resume_bits), TARGET_MATCH_WEIGHT * target_hits / target_count if target_count else 0.0)
+        if job_skills:
+            counts = intersection_counts(resume_bits, pack(job_skills, words))
+            scores += SKILL_MATCH_WEIGHT * counts / len(job_skills)
+        return np.round(scores, self.SCORE_DECIMALS)
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, highest first, ties in index order.
+
+    Runs in O(n + k log k): argpartition finds the k-th highest score, then
+    only the candidates at or above it are sorted.
+    """
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.int64)
+    if k >= n:
+        return np.lexsort((np.arange(n), -scores))
+
+    threshold = scores[np.argpartition(scores, n - k)[n - k]]
+    above = np.flatnonzero(scores > threshold)
+    # Scores equal to the threshold may be more than the free places; keep the earliest
+    tied = np.flatnonzero(scores == threshold)[:k - len(above)]
+    candidates = np.concatenate((above, tied))
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+_default_recommender: Optional[JobRecommender] = None
+_default_lock = threading.Lock()
+
+def get_job_recommender() -> JobRecommender:
+    """Return the process-wide recommender over data/jobs.json, compiling it on first use."""
+    global _default_recommender
+    if _default_recommender is None:
+        with _default_lock:
+            if _default_recommender is None:
+                _default_recommender = JobRecommender.from_file()
+    return _default_recommender
@@ -0,0 +1,99 @@
+from typing import Any, Optional
+import json
+import re
+
+# Typographic quotes models sometimes emit in place of JSON's straight quotes
+_SMART_DOUBLE = "“”"
+_CODE_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+_PYTHON_LITERALS = re.compile(r"\b(True|False|None)\b")
+_LITERAL_JSON = {"True": "true", "False": "false", "None": "null"}
+
+class JSONRepairError(ValueError):
+    """The text does not contain a JSON object, even after repair."""
+
+def _first_object(text: str) -> Optional[str]:
+    """The first balanced {...} in text, closing any brackets left open at the end."""
+    start = text.find("{")
+    if start == -1:
+        return None
+    stack = []
+    in_string = escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]":
+            if stack and stack[-1] == char:
+                stack.pop()
+            if not stack:
+                return text[start:i + 1]
+    # Truncated output (e.g. the completion hit max_tokens): close what is open
+    tail = text[start:].rstrip().rstrip(",")
+    if in_string:
+        tail += '"'
+    return tail + "".join(reversed(stack))
+
+def _straighten_quotes(text: str) -> str:
+    """Replace typographic double quotes used as string delimiters with straight ones.
+
+    Typographic quotes inside a straight-quoted string are text and are kept
+    ("Use “action verbs”"); straight quotes inside a typographically quoted
+    string are escaped.
+    """
+    out = []
+    closer = None  # the quote that ends the current string, if inside one
+    escaped = False
+    for char in text:
+        if closer is None:
+            if char == '"':
+                closer = '"'
+            elif char in _SMART_DOUBLE:
+                closer, char = _SMART_DOUBLE, '"'
+        elif escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in closer:
+            closer, char = None, '"'
+        elif char == '"':
+            char = '\\"'
+        out.append(char)
+    return "".join(out)
+
+def repair_json(text: str) -> Any:
+    """Parse a JSON object from model output, fixing common defects locally.
+
+    Handles prose or markdown code fences around the object, typographic
+    quotes, trailing commas, Python literals and output truncated mid-object.
+    Raises JSONRepairError if no object can be recovered.
+    """
+    try:
+        return json.loads(text)
+    except (TypeError, ValueError):
+        pass
+    if not text:
+        raise JSONRepairError("empty response")
+
+    fenced = _CODE_FENCE.search(text)
+    candidate = _first_object(fenced.group(1) if fenced else text)
+    if candidate is None:
+        raise JSONRepairError("no JSON object in response")
+
+    candidate = _straighten_quotes(candidate)
+    candidate = _TRAILING_COMMA.sub(r"\1", candidate)
+    for attempt in (candidate, _PYTHON_LITERALS.sub(lambda m: _LITERAL_JSON[m.group(1)], candidate)):
+        try:
+            return json.loads(attempt)
+        except ValueError:
+            continue
+    raise JSONRepairError("response is not valid JSON")
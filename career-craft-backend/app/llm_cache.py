@@ -0,0 +1,228 @@
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from .metrics import REGISTRY
+
+# Bump when prompts or response handling change so stale entries are never served
+LLM_CACHE_VERSION = "2"
+
+LLM_CACHE_LOOKUPS = REGISTRY.counter(
+    "llm_cache_lookups",
+    "LLM response cache lookups by the tier that answered (memory, disk or miss).",
+    ("result",)
+)
+
+def prompt_fingerprint(
+    model: str,
+    messages: List[Dict[str, str]],
+    max_tokens: int,
+    temperature: float,
+    json_mode: bool = False,
+    version: str = LLM_CACHE_VERSION
+) -> str:
+    """Hash identifying a completion request: same fingerprint, same request."""
+    fingerprint = json.dumps(
+        [version, model, messages, max_tokens, temperature, json_mode],
+        sort_keys=True,
+        separators=(",", ":")
+    )
+    return hashlib.sha256(fingerprint.encode()).hexdigest()
+
+class LLMResponseCache:
+    """Cache of LLM completions keyed by a fingerprint of model, prompt and parameters.
+
+    Responses are kept in a bounded in-memory LRU and, if `db_path` is set, in a
+    SQLite file so they survive restarts and are shared between workers. Entries
+    expire `ttl_seconds` after they were stored. The disk tier is kept under
+    `max_disk_bytes` of response text by evicting the least recently used rows.
+
+    `get` and `put` use both tiers. Async callers can use the `*_memory` and
+    `*_disk` halves separately, keeping SQLite I/O off the event loop; the two
+    tiers have separate locks, so memory lookups never wait on disk I/O.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: Optional[float] = 7 * 24 * 3600,
+        db_path: Optional[str] = None,
+        max_disk_bytes: Optional[int] = 64 << 20,
+        version: str = LLM_CACHE_VERSION,
+        clock: Callable[[], float] = time.time
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self.max_disk_bytes = max_disk_bytes
+        self.version = version
+        self.clock = clock
+        # key -> (response, expires_at)
+        self._entries: "OrderedDict[str, Tuple[str, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if db_path:
+            self._db = self._open(db_path)
+
+    def key_for(self, model: str, messages: List[Dict[str, str]], max_tokens: int, temperature: float, json_mode: bool = False) -> str:
+        """Return the cache key for a completion request."""
+        return prompt_fingerprint(model, messages, max_tokens, temperature, json_mode, self.version)
+
+    @property
+    def persistent(self) -> bool:
+        """Whether responses are also kept in SQLite."""
+        return self._db is not None
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a response, checking memory first and then disk."""
+        response = self.get_from_memory(key)
+        return response if response is not None else self.get_from_disk(key)
+
+    def get_from_memory(self, key: str) -> Optional[str]:
+        """Look up a response in the in-memory LRU only; a miss here is not counted."""
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            response, expires_at = entry
+            if expires_at is not None and expires_at <= now:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        LLM_CACHE_LOOKUPS.inc(result="memory")
+        return response
+
+    def get_from_disk(self, key: str) -> Optional[str]:
+        """Look up a response on disk after a memory miss, counting a miss if it isn't there."""
+        now = self.clock()
+        with self._db_lock:
+            entry = self._read_from_disk(key, now)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.disk_hits += 1
+                self._remember(key, *entry)
+        LLM_CACHE_LOOKUPS.inc(result="miss" if entry is None else "disk")
+        return None if entry is None else entry[0]
+
+    def put(self, key: str, response: str):
+        """Store a response in memory and, if configured, on disk."""
+        self.put_in_memory(key, response)
+        self.put_on_disk(key, response)
+
+    def put_in_memory(self, key: str, response: str):
+        with self._lock:
+            self._remember(key, response, self._expires_at(self.clock()))
+
+    def put_on_disk(self, key: str, response: str):
+        now = self.clock()
+        with self._db_lock:
+            self._write_to_disk(key, response, self._expires_at(now), now)
+
+    def stats(self) -> Dict[str, float]:
+        """Return hit/miss counters, the hit rate and the current in-memory size."""
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries
+            }
+
+    def close(self):
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _expires_at(self, now: float) -> Optional[float]:
+        return now + self.ttl_seconds if self.ttl_seconds else None
+
+    def _remember(self, key: str, response: str, expires_at: Optional[float]):
+        """Insert into the LRU, evicting the least recently used entries. Caller holds the lock."""
+        self._entries[key] = (response, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _open(self, path: str) -> sqlite3.Connection:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        db = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+        # WAL lets several server processes read while one writes
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, size INTEGER NOT NULL, "
+            "expires_at REAL, accessed_at REAL NOT NULL)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        return db
+
+    def _read_from_disk(self, key: str, now: float) -> Optional[Tuple[str, Optional[float]]]:
+        """Caller holds the database lock."""
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT response, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] is not None and row[1] <= now:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            return row[0], row[1]
+        except sqlite3.Error as e:
+            print(f"Error reading LLM cache entry {key}: {str(e)}")
+            return None
+
+    def _write_to_disk(self, key: str, response: str, expires_at: Optional[float], now: float):
+        """Caller holds the database lock."""
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, response, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, response, len(response.encode()), expires_at, now)
+            )
+            self._evict(now)
+        except sqlite3.Error as e:
+            print(f"Error writing LLM cache entry {key}: {str(e)}")
+
+    def _evict(self, now: float):
+        """Drop expired rows, then least recently used rows until under the size limit."""
+        self._db.execute("DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+        if not self.max_disk_bytes:
+            return
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+        excess = total - self.max_disk_bytes
+        freed = 0
+        victims = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._db.executemany("DELETE FROM responses WHERE key = ?", victims)
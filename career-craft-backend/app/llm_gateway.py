@@ -0,0 +1,300 @@
+from typing import Callable, Dict, List, Optional, Union
+import asyncio
+import json
+import time
+from .llm_cache import LLMResponseCache, prompt_fingerprint
+from .metrics import REGISTRY
+
+Messages = List[Dict[str, str]]
+
+LLM_COALESCED_REQUESTS = REGISTRY.counter(
+    "llm_coalesced_requests",
+    "LLM requests answered by sharing an identical request already in flight.",
+    ()
+)
+
+class LLMUnavailable(Exception):
+    """The LLM call failed, timed out, or was refused because the provider is degraded."""
+
+class OpenAIProvider:
+    """Chat completions from OpenAI through the async client."""
+
+    def __init__(self, client, model: str):
+        self.client = client
+        self.model = model
+
+    async def complete(self, messages: Messages, max_tokens: int, temperature: float, json_mode: bool = False) -> str:
+        options = {"response_format": {"type": "json_object"}} if json_mode else {}
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **options
+        )
+        return response.choices[0].message.content
+
+# Canned answers for the fake provider, keyed by a phrase from the system prompt
+FAKE_RESPONSES = {
+    "JSON": json.dumps({
+        "overall_score": 50.0,
+        "suggestions": ["Quantify the impact of your experience."],
+        "missing_skills": [],
+        "improvement_areas": {"experience": ["Add measurable results."]}
+    }),
+    "Extract key skills": "communication\nproblem-solving",
+}
+
+class FakeProvider:
+    """Local, offline stand-in for the LLM provider (tests and development).
+
+    Answers from `responses` by the first key found in the system prompt, else
+    `default`. `latency` (seconds, or a function of the call number) and
+    `fail` (a function of the call number) simulate slow or failing providers.
+    """
+
+    model = "fake"
+
+    def __init__(
+        self,
+        responses: Optional[Dict[str, str]] = None,
+        default: str = "The resume is a reasonable match for the role.",
+        latency: Union[float, Callable[[int], float]] = 0.0,
+        fail: Optional[Callable[[int], bool]] = None
+    ):
+        self.responses = FAKE_RESPONSES if responses is None else responses
+        self.default = default
+        self.latency = latency
+        self.fail = fail
+        self.calls = 0
+        self.prompts: List[str] = []
+
+    async def complete(self, messages: Messages, max_tokens: int, temperature: float, json_mode: bool = False) -> str:
+        call = self.calls
+        self.calls += 1
+        system = messages[0]["content"] if messages else ""
+        self.prompts.append(system)
+
+        await asyncio.sleep(self.latency(call) if callable(self.latency) else self.latency)
+        if self.fail is not None and self.fail(call):
+            raise RuntimeError("fake provider error")
+        for key, response in self.responses.items():
+            if key in system:
+                return response
+        return self.default
+
+class CircuitBreaker:
+    """Stop calling a failing provider for a while, then let one probe call through.
+
+    Opens after `failure_threshold` consecutive failures. After `reset_timeout`
+    seconds it half-opens: a single call is allowed, and its outcome closes
+    the breaker again or re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    def allow(self) -> bool:
+        """Whether a call may go to the provider now."""
+        if self.state == self.OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self):
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def release(self):
+        """Forget an in-flight probe whose outcome is unknown (e.g. it was cancelled)."""
+        self._probing = False
+
+    def record_failure(self):
+        self.failures += 1
+        self._probing = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = self.clock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == self.OPEN and self.clock() - self._opened_at < self.reset_timeout
+
+class LLMGateway:
+    """Async front door to the LLM provider.
+
+    Every call has a deadline (`timeout` seconds). If an attempt hasn't answered
+    after `hedge_after` seconds, another is started alongside it, and the first
+    answer wins; an attempt that fails is retried at once. At most
+    `max_attempts` attempts are made per call. Calls that fail count towards
+    the circuit breaker, and while it is open calls fail immediately with
+    LLMUnavailable so callers can fall back without waiting.
+
+    With a `cache`, identical requests (same model, messages and parameters)
+    are answered from it without calling the provider, even while degraded.
+    Identical requests made while one is already in flight wait for and share
+    its result instead of calling the provider again. At most `max_concurrency`
+    provider calls run at once; further calls queue (within their deadline),
+    and slow attempts are only hedged while a slot is free.
+    """
+
+    def __init__(
+        self,
+        provider,
+        timeout: float = 30.0,
+        hedge_after: Optional[float] = 10.0,
+        max_attempts: int = 2,
+        breaker: Optional[CircuitBreaker] = None,
+        cache: Optional[LLMResponseCache] = None,
+        max_concurrency: Optional[int] = 16
+    ):
+        self.provider = provider
+        self.timeout = timeout
+        self.hedge_after = hedge_after
+        self.max_attempts = max_attempts
+        self.breaker = breaker or CircuitBreaker()
+        self.cache = cache
+        self.max_concurrency = max_concurrency
+        # fingerprint -> the shared task for an identical request in flight
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # asyncio primitives belong to one event loop, so the limiter is made per loop
+        self._limiters: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    @property
+    def is_degraded(self) -> bool:
+        return self.breaker.is_open
+
+    async def complete(
+        self,
+        messages: Messages,
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        timeout: Optional[float] = None,
+        json_mode: bool = False
+    ) -> str:
+        """Return the completion text, or raise LLMUnavailable.
+
+        With `json_mode` the provider is asked to answer with a single JSON object.
+        """
+        key = prompt_fingerprint(getattr(self.provider, "model", ""), messages, max_tokens, temperature, json_mode)
+        if self.cache is not None:
+            cached = self.cache.get_from_memory(key)
+            if cached is None:
+                # SQLite reads block, so they run in a thread rather than on the event loop
+                cached = (
+                    await asyncio.to_thread(self.cache.get_from_disk, key) if self.cache.persistent
+                    else self.cache.get_from_disk(key)
+                )
+            if cached is not None:
+                return cached
+
+        shared = self._inflight.get(key)
+        if shared is None:
+            shared = asyncio.ensure_future(self._call(key, messages, max_tokens, temperature, json_mode, timeout or self.timeout))
+            self._inflight[key] = shared
+            shared.add_done_callback(lambda task: self._settle(key, task))
+        else:
+            LLM_COALESCED_REQUESTS.inc()
+        # One caller giving up must not cancel the call for the others
+        return await asyncio.shield(shared)
+
+    def _settle(self, key: str, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the error retrieved even if every waiter was cancelled
+            task.exception()
+
+    async def _call(self, key: str, messages: Messages, max_tokens: int, temperature: float, json_mode: bool, timeout: float) -> str:
+        if not self.breaker.allow():
+            raise LLMUnavailable("LLM provider is degraded; try again later")
+        try:
+            result = await self._hedged(messages, max_tokens, temperature, json_mode, timeout)
+        except asyncio.CancelledError:
+            # The call was abandoned; that says nothing about the provider
+            self.breaker.release()
+            raise
+        except Exception as e:
+            self.breaker.record_failure()
+            raise LLMUnavailable(str(e) or e.__class__.__name__) from e
+        self.breaker.record_success()
+        if self.cache is not None:
+            self.cache.put_in_memory(key, result)
+            if self.cache.persistent:
+                # Written in the background; nobody waits on the disk copy
+                asyncio.get_running_loop().run_in_executor(None, self.cache.put_on_disk, key, result)
+        return result
+
+    def _limiter(self) -> Optional[asyncio.Semaphore]:
+        if not self.max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        limiter = self._limiters.get(loop)
+        if limiter is None:
+            # Drop limiters of loops that have finished (e.g. one asyncio.run per test)
+            self._limiters = {l: sem for l, sem in self._limiters.items() if not l.is_closed()}
+            limiter = self._limiters[loop] = asyncio.Semaphore(self.max_concurrency)
+        return limiter
+
+    async def _attempt(self, messages: Messages, max_tokens: int, temperature: float, json_mode: bool) -> str:
+        limiter = self._limiter()
+        if limiter is None:
+            return await self.provider.complete(messages, max_tokens, temperature, json_mode)
+        async with limiter:
+            return await self.provider.complete(messages, max_tokens, temperature, json_mode)
+
+    async def _hedged(self, messages: Messages, max_tokens: int, temperature: float, json_mode: bool, timeout: float) -> str:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        pending = set()
+        attempts = 0
+        last_error: Optional[BaseException] = None
+
+        def launch():
+            nonlocal attempts
+            attempts += 1
+            pending.add(asyncio.ensure_future(self._attempt(messages, max_tokens, temperature, json_mode)))
+
+        launch()
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(f"LLM call exceeded its {timeout:g}s deadline")
+                can_hedge = attempts < self.max_attempts and self.hedge_after is not None
+                wait = min(remaining, self.hedge_after) if can_hedge else remaining
+
+                done, _ = await asyncio.wait(pending, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    limiter = self._limiter()
+                    # Under saturation a hedge would only queue behind the attempt it backs up
+                    if can_hedge and (limiter is None or not limiter.locked()):
+                        launch()
+                    continue
+
+                for task in done:
+                    pending.discard(task)
+                    if task.exception() is None:
+                        return task.result()
+                    last_error = task.exception()
+                if not pending and attempts < self.max_attempts:
+                    launch()
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
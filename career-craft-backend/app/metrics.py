@@ -0,0 +1,176 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Sequence, Tuple
+import threading
+import time
+
+# Latency buckets in seconds, from sub-millisecond regexes to slow PDF extraction
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Bounds for the page count and byte size tags; a file is tagged with the
+# first bound it fits under, so label cardinality stays small
+PAGE_BOUNDS = (1, 2, 4, 8, 16, 32, 64)
+SIZE_BOUNDS = (64 << 10, 256 << 10, 1 << 20, 4 << 20, 16 << 20)
+
+def bound_label(value: Optional[int], bounds: Sequence[int]) -> str:
+    """Tag value for a count: the smallest bound >= value, "+Inf" above all, "" if unknown."""
+    if value is None:
+        return ""
+    index = bisect_left(bounds, value)
+    return str(bounds[index]) if index < len(bounds) else "+Inf"
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+class Histogram:
+    """A labelled histogram with cumulative buckets, rendered in Prometheus text format."""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str], buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> (per-bucket counts, +Inf count, sum)
+        self._series: Dict[Tuple[str, ...], List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str):
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0, 0.0]
+            if index < len(self.buckets):
+                series[0][index] += 1
+            series[1] += 1
+            series[2] += value
+
+    def snapshot(self) -> Dict[Tuple[str, ...], Dict]:
+        """Count, sum and cumulative bucket counts per label set."""
+        with self._lock:
+            series = {key: (list(counts), count, total) for key, (counts, count, total) in self._series.items()}
+        result = {}
+        for key, (counts, count, total) in series.items():
+            cumulative, running = [], 0
+            for bucket_count in counts:
+                running += bucket_count
+                cumulative.append(running)
+            result[key] = {"buckets": dict(zip(self.buckets, cumulative)), "count": count, "sum": total}
+        return result
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for key, data in sorted(self.snapshot().items()):
+            labels = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, key))
+            prefix = labels + "," if labels else ""
+            for bound, cumulative in data["buckets"].items():
+                lines.append(f'{self.name}_bucket{{{prefix}le="{_format_value(bound)}"}} {cumulative}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {data["count"]}')
+            suffix = f"{{{labels}}}" if labels else ""
+            lines.append(f"{self.name}_sum{suffix} {data['sum']!r}")
+            lines.append(f"{self.name}_count{suffix} {data['count']}")
+        return lines
+
+class Counter:
+    """A labelled monotonically increasing count, rendered in Prometheus text format."""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def snapshot(self) -> Dict[Tuple[str, ...], float]:
+        with self._lock:
+            return dict(self._values)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for key, value in sorted(self.snapshot().items()):
+            labels = ",".join(f'{name}="{_escape(label)}"' for name, label in zip(self.label_names, key))
+            suffix = f"{{{labels}}}" if labels else ""
+            lines.append(f"{self.name}_total{suffix} {_format_value(value)}")
+        return lines
+
+class MetricsRegistry:
+    """The process's metrics, exposed together for scraping."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, help_text: str, label_names: Sequence[str], buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Return the histogram called `name`, creating it on first use."""
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Histogram(name, help_text, label_names, buckets)
+            return self._metrics[name]
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str]) -> Counter:
+        """Return the counter called `name`, creating it on first use."""
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Counter(name, help_text, label_names)
+            return self._metrics[name]
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+REGISTRY = MetricsRegistry()
+
+PARSE_STAGE_SECONDS = REGISTRY.histogram(
+    "resume_parse_stage_seconds",
+    "Time spent in each resume parsing stage.",
+    ("stage", "file_type", "pages", "size_bytes")
+)
+
+class ParseTimings:
+    """Per-stage durations for parsing one file, plus the tags they are recorded under.
+
+    Plain data, so worker processes can time a parse and hand the result back
+    to the process that serves metrics.
+    """
+
+    def __init__(self, file_type: str = "", size: Optional[int] = None, pages: Optional[int] = None):
+        self.file_type = file_type
+        self.size = size
+        self.pages = pages
+        self.stages: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as `name` (repeated stages accumulate)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    def tags(self) -> Dict[str, str]:
+        return {
+            "file_type": self.file_type.lstrip('.'),
+            "pages": bound_label(self.pages, PAGE_BOUNDS),
+            "size_bytes": bound_label(self.size, SIZE_BOUNDS)
+        }
+
+    def record(self, histogram: Histogram = PARSE_STAGE_SECONDS):
+        """Observe every timed stage in the histogram."""
+        tags = self.tags()
+        for name, seconds in self.stages.items():
+            histogram.observe(seconds, stage=name, **tags)
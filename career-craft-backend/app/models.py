@@ -97,4 +97,18 @@ class Achievement(Base):
     description = Column(Text)
     date = Column(DateTime, nullable=True)
     
-    resume = relationship("Resume", back_populates="achievements")
\ No newline at end of file
+    resume = relationship("Resume", back_populates="achievements")
+
+class ParseJob(Base):
+    __tablename__ = "parse_jobs"
+
+    id = Column(String, primary_key=True, index=True)  # uuid4 hex
+    user_id = Column(Integer, ForeignKey("users.id"))
+    status = Column(String, default="pending", index=True)  # pending, completed, failed
+    filename = Column(String, nullable=True)  # Original upload name
+    job_description = Column(Text)
+    resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=True)
+    error = Column(Text, nullable=True)
+    owner = Column(String, nullable=True)  # host:pid:boot id of the process parsing it
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -0,0 +1,88 @@
+from typing import Dict, List, Tuple
+import gc
+import os
+import threading
+import spacy
+
+DEFAULT_MODEL = "en_core_web_sm"
+DEFAULT_PROFILE = "full"
+
+# Pipeline profiles: components to leave out of the loaded model, and whether
+# to add the rule-based sentencizer for sentence boundaries instead of the parser.
+PIPELINE_PROFILES = {
+    # Everything the model ships with (POS tags, lemmas, dependency parse, NER)
+    "full": {"exclude": [], "sentencizer": False},
+    # NER (GPE/LOC for contact details) plus rule-based sentences for summaries
+    "ner_sentencizer": {
+        "exclude": ["tagger", "parser", "attribute_ruler", "lemmatizer"],
+        "sentencizer": True
+    },
+    # Sentence boundaries only
+    "sentencizer": {
+        "exclude": ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "ner"],
+        "sentencizer": True
+    }
+}
+
+# One shared pipeline per (model name, profile) for the whole process
+_models: Dict[Tuple[str, str], "spacy.language.Language"] = {}
+_lock = threading.Lock()
+
+def _reset_lock_after_fork():
+    # A fork taken while another thread held the lock would leave it held forever
+    global _lock
+    _lock = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_lock_after_fork)
+
+def get_nlp(name: str = DEFAULT_MODEL, profile: str = DEFAULT_PROFILE) -> "spacy.language.Language":
+    """Return the shared pipeline for `name` and `profile`, loading it on first use."""
+    key = (name, profile)
+    nlp = _models.get(key)
+    if nlp is None:
+        with _lock:
+            nlp = _models.get(key)
+            if nlp is None:
+                nlp = _load(name, profile)
+                _models[key] = nlp
+    return nlp
+
+def _load(name: str, profile: str) -> "spacy.language.Language":
+    if profile not in PIPELINE_PROFILES:
+        raise ValueError(f"Unknown pipeline profile: {profile}")
+    settings = PIPELINE_PROFILES[profile]
+
+    nlp = spacy.load(name, exclude=settings["exclude"])
+
+    # Once its listeners are excluded, a shared tok2vec only burns CPU
+    if (
+        settings["exclude"]
+        and "tok2vec" in nlp.pipe_names
+        and not getattr(nlp.get_pipe("tok2vec"), "listening_components", True)
+    ):
+        nlp.remove_pipe("tok2vec")
+
+    if settings["sentencizer"] and "sentencizer" not in nlp.pipe_names:
+        nlp.add_pipe("sentencizer", first=True)
+    return nlp
+
+def preload(*names: str, profiles: Tuple[str, ...] = (DEFAULT_PROFILE,)):
+    """Load pipelines up front, e.g. in a pre-fork master process.
+
+    Loaded objects are moved to the garbage collector's permanent generation,
+    so collections in forked workers don't touch (and copy) their pages.
+    """
+    for name in names or (DEFAULT_MODEL,):
+        for profile in profiles:
+            get_nlp(name, profile)
+    gc.freeze()
+
+def loaded_models() -> List[Tuple[str, str]]:
+    """(model name, profile) pairs loaded in this process."""
+    return list(_models)
+
+def clear():
+    """Forget all loaded pipelines (mainly for tests)."""
+    with _lock:
+        _models.clear()
@@ -0,0 +1,117 @@
+from collections import OrderedDict
+from typing import BinaryIO, Dict, Optional
+import hashlib
+import os
+import tempfile
+import threading
+from .schemas import ResumeCreate
+
+# Bump when parser output changes so stale on-disk entries are never served
+PARSE_CACHE_VERSION = "4"
+
+class ParseCache:
+    """Content-addressed cache of parsed resumes.
+
+    Entries are keyed on a hash of the uploaded file bytes and kept in a bounded
+    in-memory LRU. If `cache_dir` is set, entries are also written to disk so
+    they survive restarts and can be shared between workers.
+    """
+
+    def __init__(self, max_entries: int = 256, cache_dir: Optional[str] = None, version: str = PARSE_CACHE_VERSION):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.version = version
+        self._entries: "OrderedDict[str, ResumeCreate]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def key_for(self, data: bytes) -> str:
+        """Return the cache key for a file's raw bytes."""
+        digest = hashlib.sha256(self.version.encode())
+        digest.update(data)
+        return digest.hexdigest()
+
+    def key_for_stream(self, stream: BinaryIO, chunk_size: int = 1 << 16) -> str:
+        """Return the cache key for a binary stream, hashing it in chunks."""
+        digest = hashlib.sha256(self.version.encode())
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[ResumeCreate]:
+        """Look up a parsed resume, checking memory first and then disk."""
+        with self._lock:
+            resume = self._entries.get(key)
+            if resume is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return resume.model_copy(deep=True)
+
+        resume = self._read_from_disk(key)
+        with self._lock:
+            if resume is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, resume)
+        return resume.model_copy(deep=True)
+
+    def put(self, key: str, resume: ResumeCreate):
+        """Store a parsed resume in memory and, if configured, on disk."""
+        resume = resume.model_copy(deep=True)
+        with self._lock:
+            self._remember(key, resume)
+        self._write_to_disk(key, resume)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current in-memory size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries
+            }
+
+    def _remember(self, key: str, resume: ResumeCreate):
+        """Insert into the LRU, evicting the least recently used entries. Caller holds the lock."""
+        self._entries[key] = resume
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _read_from_disk(self, key: str) -> Optional[ResumeCreate]:
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._disk_path(key), 'r') as f:
+                return ResumeCreate.model_validate_json(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Error reading parse cache entry {key}: {str(e)}")
+            return None
+
+    def _write_to_disk(self, key: str, resume: ResumeCreate):
+        if not self.cache_dir:
+            return
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file and rename so readers never see a partial entry
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                f.write(resume.model_dump_json())
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Error writing parse cache entry {key}: {str(e)}")
@@ -0,0 +1,19 @@
+"""Load the parse pipeline into the sandbox's fork server.
+
+Only the fork server imports this module, and only when ParseJobQueue is
+created with `preload_nlp`. The queue names the pipeline in the environment,
+which the fork server inherits. Loading it here means every parse worker
+forked from the server shares its pages copy-on-write instead of loading its
+own copy.
+"""
+import os
+from . import nlp_registry
+
+PRELOAD_MODEL_VAR = "PARSE_PRELOAD_MODEL"
+PRELOAD_PROFILE_VAR = "PARSE_PRELOAD_PROFILE"
+
+if os.getenv(PRELOAD_MODEL_VAR):
+    nlp_registry.preload(
+        os.environ[PRELOAD_MODEL_VAR],
+        profiles=(os.getenv(PRELOAD_PROFILE_VAR, nlp_registry.DEFAULT_PROFILE),)
+    )
@@ -0,0 +1,304 @@
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Optional, Tuple
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from .exceptions import FileProcessingException
+
+TOO_SLOW = "Parsing this file took too long and was stopped"
+TOO_LARGE = "Parsing this file used too much memory and was stopped"
+
+class ParseLimitExceeded(BaseException):
+    """Raised inside a worker when a job runs past its CPU-time budget.
+
+    A BaseException, like KeyboardInterrupt, so the `except Exception` blocks
+    parsers use to skip a bad entry don't swallow it and carry on unlimited.
+    """
+
+# Set when the CPU timer fires during the current job, even if the job catches the exception
+_cpu_limit_hit = False
+
+def _on_cpu_limit(signum, frame):
+    global _cpu_limit_hit
+    _cpu_limit_hit = True
+    raise ParseLimitExceeded(TOO_SLOW)
+
+def _cap_address_space(extra_bytes: int):
+    """Limit this process's address space to its current size plus `extra_bytes`.
+
+    Allocations past the cap fail at once with MemoryError, where the parent's
+    RSS poll only notices between polls.
+    """
+    try:
+        import resource
+        with open("/proc/self/statm", 'r') as f:
+            size = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (ImportError, OSError, ValueError, IndexError):
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    limit = size + extra_bytes
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+def _worker_main(
+    conn,
+    initializer: Optional[Callable],
+    initargs: Tuple,
+    cpu_seconds: Optional[float],
+    max_job_bytes: Optional[int] = None
+):
+    """Run jobs sent over `conn` until told to stop (runs in the sandboxed process)."""
+    global _cpu_limit_hit
+    if initializer is not None:
+        initializer(*initargs)
+    if max_job_bytes:
+        _cap_address_space(max_job_bytes)
+    # Tell the parent start-up is done, so start-up memory isn't billed to the first job
+    conn.send(("ready", None))
+    use_timer = cpu_seconds and hasattr(signal, "setitimer")
+    if use_timer:
+        signal.signal(signal.SIGPROF, _on_cpu_limit)
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if job is None:
+            break
+        fn, args = job
+        try:
+            # ITIMER_PROF counts this process's user + system CPU time
+            _cpu_limit_hit = False
+            started = time.process_time()
+            if use_timer:
+                signal.setitimer(signal.ITIMER_PROF, cpu_seconds)
+            try:
+                result = ("ok", fn(*args))
+            finally:
+                if use_timer:
+                    signal.setitimer(signal.ITIMER_PROF, 0)
+            # Code that swallowed the timer's exception (a bare except) still overran
+            if _cpu_limit_hit or (cpu_seconds and time.process_time() - started > cpu_seconds):
+                result = ("limit", TOO_SLOW)
+        except ParseLimitExceeded as e:
+            result = ("limit", str(e))
+        except MemoryError:
+            result = ("limit", TOO_LARGE)
+        except Exception as e:
+            result = ("error", e)
+
+        try:
+            conn.send(result)
+        except Exception:
+            # The exception itself may not pickle; its message always does
+            conn.send(("error", RuntimeError(str(result[1]))))
+
+def _rss_bytes(pid: int) -> Optional[int]:
+    """Resident set size of a process, or None where /proc is unavailable."""
+    try:
+        with open(f"/proc/{pid}/statm", 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+class _Worker:
+    """One sandboxed process and the parent's end of its pipe.
+
+    Waits at most `start_seconds` (None for no limit) for the worker to finish
+    its initializer; a worker that hangs or dies while starting is killed.
+    """
+
+    def __init__(
+        self, context, initializer, initargs, cpu_seconds,
+        start_seconds: Optional[float] = None, max_job_bytes: Optional[int] = None
+    ):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, initializer, initargs, cpu_seconds, max_job_bytes),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+        if not self.conn.poll(start_seconds):
+            self.kill()
+            raise FileProcessingException(TOO_SLOW)
+        try:
+            self.conn.recv()
+        except EOFError:
+            self.kill()
+            raise FileProcessingException("The parse worker failed to start")
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+class SandboxPool(Executor):
+    """Run jobs in worker processes with per-job CPU-time, memory and wall-clock limits.
+
+    Each worker runs one job at a time. A job that uses more than `cpu_seconds`
+    of CPU is interrupted inside the worker. Each worker's address space is
+    capped at its size after start-up plus `max_job_rss_mb`, so larger
+    allocations fail at once; a job whose resident memory still grows by more
+    than that, that outlives `wall_seconds`, or whose worker dies is killed
+    from the parent. Either way the job's future fails with
+    FileProcessingException, the worker is replaced and other jobs carry on.
+    Workers are also recycled after `max_jobs_per_worker` jobs, so slow leaks
+    in parsing libraries cannot build up. Starting a worker counts against the
+    wall-clock limit of the job that needed it.
+
+    Workers come from a fork server by default (`start_method`), since forking
+    the multi-threaded parent can copy a lock some other thread holds and hang
+    the worker. This module, the initializer's and any listed in `preload` are
+    imported once in the fork server, so workers start with them loaded and
+    share what they load copy-on-write. The fork server is shared by every
+    pool in the process and started by the first one, so only that pool's
+    `preload` takes effect.
+    "fork" shares what the parent loaded beforehand, but is only safe before
+    the parent starts threads.
+    """
+
+    # How often the parent checks a running job's memory and deadline
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        max_workers: int,
+        initializer: Optional[Callable] = None,
+        initargs: Tuple = (),
+        cpu_seconds: Optional[float] = 30,
+        max_job_rss_mb: Optional[int] = 512,
+        wall_seconds: Optional[float] = 60,
+        max_jobs_per_worker: Optional[int] = 100,
+        start_method: str = "forkserver",
+        preload: Tuple[str, ...] = ()
+    ):
+        self.max_workers = max_workers
+        self.initializer = initializer
+        self.initargs = initargs
+        self.cpu_seconds = cpu_seconds
+        self.max_job_rss = max_job_rss_mb * (1 << 20) if max_job_rss_mb else None
+        self.wall_seconds = wall_seconds
+        self.max_jobs_per_worker = max_jobs_per_worker
+
+        if start_method not in multiprocessing.get_all_start_methods():
+            start_method = "spawn"
+        self._context = multiprocessing.get_context(start_method)
+        if start_method == "forkserver":
+            modules = [__name__] + ([initializer.__module__] if initializer is not None else [])
+            self._context.set_forkserver_preload(modules + list(preload))
+        self._jobs: "queue.Queue" = queue.Queue()
+        self._slots = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn: Callable, *args: Any) -> Future:
+        """Queue `fn(*args)` for a worker; `fn` and the arguments must be picklable."""
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot submit after shutdown")
+            future = Future()
+            self._jobs.put((future, fn, args))
+            if len(self._slots) < self.max_workers:
+                slot = threading.Thread(target=self._run_slot, daemon=True)
+                slot.start()
+                self._slots.append(slot)
+            return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        future, _, _ = self._jobs.get_nowait()
+                    except queue.Empty:
+                        break
+                    future.cancel()
+            for _ in self._slots:
+                self._jobs.put(None)
+            slots = list(self._slots)
+        if wait:
+            for slot in slots:
+                slot.join()
+
+    def _run_slot(self):
+        """Feed queued jobs to this slot's worker, replacing the worker when needed."""
+        worker = None
+        try:
+            while True:
+                item = self._jobs.get()
+                if item is None:
+                    break
+                future, fn, args = item
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                if worker is not None and self.max_jobs_per_worker and worker.jobs >= self.max_jobs_per_worker:
+                    worker.stop()
+                    worker = None
+
+                deadline = time.monotonic() + self.wall_seconds if self.wall_seconds else None
+                try:
+                    if worker is None:
+                        worker = _Worker(
+                            self._context, self.initializer, self.initargs, self.cpu_seconds,
+                            None if deadline is None else max(0, deadline - time.monotonic()),
+                            self.max_job_rss
+                        )
+                    future.set_result(self._run_job(worker, fn, args, deadline))
+                except FileProcessingException as e:
+                    # A worker that hit a limit may be left in a bad state
+                    if worker is not None:
+                        worker.kill()
+                        worker = None
+                    future.set_exception(e)
+                except Exception as e:
+                    future.set_exception(e)
+        finally:
+            if worker is not None:
+                worker.stop()
+
+    def _run_job(self, worker: _Worker, fn: Callable, args: Tuple, deadline: Optional[float]) -> Any:
+        baseline = _rss_bytes(worker.process.pid)
+        worker.jobs += 1
+        try:
+            worker.conn.send((fn, args))
+        except OSError:
+            raise FileProcessingException("The parse worker crashed while processing this file")
+
+        while not worker.conn.poll(self.POLL_INTERVAL):
+            if not worker.process.is_alive():
+                raise FileProcessingException("The parse worker crashed while processing this file")
+            if deadline is not None and time.monotonic() > deadline:
+                raise FileProcessingException(TOO_SLOW)
+            if self.max_job_rss and baseline is not None:
+                rss = _rss_bytes(worker.process.pid)
+                if rss is not None and rss - baseline > self.max_job_rss:
+                    raise FileProcessingException(TOO_LARGE)
+
+        try:
+            status, value = worker.conn.recv()
+        except EOFError:
+            raise FileProcessingException("The parse worker crashed while processing this file")
+        if status == "ok":
+            return value
+        if status == "limit":
+            raise FileProcessingException(value)
+        raise value
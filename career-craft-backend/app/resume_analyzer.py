@@ -1,6 +1,11 @@
-from typing import List, Dict
-from openai import OpenAI  # Updated import
+from typing import List, Dict, Optional, Set
+from openai import AsyncOpenAI
 from .schemas import ResumeFeedback, Resume, JobRecommendation
+from .llm_gateway import LLMGateway, OpenAIProvider
+from .json_repair import JSONRepairError, repair_json
+from .job_recommender import SKILL_MATCH_WEIGHT, TARGET_MATCH_WEIGHT, JobRecommender, get_job_recommender
+from .semantic_index import SemanticJobIndex
+import asyncio
 import json
 import os
 from dotenv import load_dotenv
@@ -8,14 +13,34 @@ from dotenv import load_dotenv
 load_dotenv()
 
 class ResumeAnalyzer:
-    def __init__(self):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))  # Use OpenAI client
+    def __init__(
+        self,
+        gateway: Optional[LLMGateway] = None,
+        recommender: Optional[JobRecommender] = None,
+        semantic_index: Optional[SemanticJobIndex] = None
+    ):
         self.MAX_TOKENS = 2000
         self.MODEL = "gpt-3.5-turbo"
-        
-        # Load jobs data
-        with open('data/jobs.json', 'r') as f:
-            self.jobs_data = json.load(f)
+
+        # All LLM calls go through the async gateway (deadlines, hedging, circuit breaker)
+        self.llm = gateway or LLMGateway(
+            OpenAIProvider(AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY")), self.MODEL)
+        )
+
+        # With a semantic index, jobs are ranked by TF-IDF cosine similarity
+        # instead of exact skill string matches
+        self.semantic_index = semantic_index
+        self._recommender = recommender
+
+    @property
+    def recommender(self) -> JobRecommender:
+        """The exact skill-match recommender, compiled on first use.
+
+        Only used without a semantic index, so it is never built when one is configured.
+        """
+        if self._recommender is None:
+            self._recommender = get_job_recommender()
+        return self._recommender
 
     def _format_resume_for_analysis(self, resume: Resume) -> str:
         """Format resume data into a string for GPT analysis."""
@@ -44,8 +69,23 @@ class ResumeAnalyzer:
 
         return formatted_text
 
-    def analyze_resume(self, resume: Resume, job_description: str) -> ResumeFeedback:
-        """Analyze resume against job description using GPT and provide feedback."""
+    async def analyze_resume(self, resume: Resume, job_description: str) -> ResumeFeedback:
+        """Analyze resume against job description using GPT and provide feedback.
+
+        The structured feedback and the job skill extraction are independent
+        calls, so they run concurrently and latency is that of the slower one.
+        """
+        feedback, target_skills = await asyncio.gather(
+            self._get_feedback(resume, job_description),
+            self._extract_target_skills(job_description)
+        )
+
+        # Combine feedback with job recommendations
+        feedback.job_recommendations = self._rank_jobs(resume, target_skills)
+        return feedback
+
+    async def _get_feedback(self, resume: Resume, job_description: str) -> ResumeFeedback:
+        """Get structured feedback in a single JSON-mode completion."""
         # Prepare resume data for GPT
         resume_text = self._format_resume_for_analysis(resume)
         
@@ -66,34 +106,25 @@ class ResumeAnalyzer:
         4. Specific phrases or bullets that could be enhanced
         5. Additional certifications or skills that would be beneficial
 
-        Provide structured feedback with specific actionable suggestions.
+        Return the response in the following JSON format:
+        {{
+            "overall_score": float (0-100),
+            "suggestions": list[str],
+            "missing_skills": list[str],
+            "improvement_areas": dict[str, list[str]] (keyed by resume section)
+        }}
         """
 
         try:
-            # Get GPT analysis - Updated method call
-            response = self.client.chat.completions.create(
-                model=self.MODEL,
-                messages=[
-                    {"role": "system", "content": "You are an expert resume reviewer and career counselor."},
+            content = await self.llm.complete(
+                [
+                    {"role": "system", "content": "You are an expert resume reviewer and career counselor. Reply with a single JSON object."},
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=self.MAX_TOKENS,
-                temperature=0.7
+                temperature=0.7,
+                json_mode=True
             )
-            
-            # Parse GPT response - Updated access to response
-            analysis = response.choices[0].message.content
-            
-            # Extract structured feedback
-            feedback = self._parse_gpt_feedback(analysis)
-            
-            # Get job recommendations
-            job_recommendations = self._get_job_recommendations(resume, job_description)
-            
-            # Combine feedback with job recommendations
-            feedback.job_recommendations = job_recommendations
-            
-            return feedback
 
         except Exception as e:
             print(f"Error in GPT analysis: {str(e)}")
@@ -103,55 +134,29 @@ class ResumeAnalyzer:
                 suggestions=["Error analyzing resume. Please try again."],
                 missing_skills=[],
                 improvement_areas={},
-                job_recommendations=self._get_job_recommendations(resume, job_description)
+                job_recommendations=[]  # Filled in by analyze_resume
             )
 
-    def _parse_gpt_feedback(self, analysis: str) -> ResumeFeedback:
-        """Parse GPT response into structured feedback."""
-        # Use another GPT call to structure the feedback
-        structuring_prompt = f"""
-        Convert the following resume analysis into structured feedback with the following components:
-        1. Overall score (0-100)
-        2. List of specific suggestions
-        3. List of missing skills
-        4. Dictionary of improvement areas by section
-
-        Analysis:
-        {analysis}
-
-        Return the response in the following JSON format:
-        {{
-            "overall_score": float,
-            "suggestions": list[str],
-            "missing_skills": list[str],
-            "improvement_areas": dict[str, list[str]]
-        }}
-        """
+        return self._parse_feedback(content)
 
+    def _parse_feedback(self, content: str) -> ResumeFeedback:
+        """Validate the model's JSON as ResumeFeedback, repairing malformed output locally."""
         try:
-            # Updated method call
-            response = self.client.chat.completions.create(
-                model=self.MODEL,
-                messages=[
-                    {"role": "system", "content": "You are a JSON formatting assistant."},
-                    {"role": "user", "content": structuring_prompt}
-                ],
-                max_tokens=1000,
-                temperature=0.3
-            )
-            
-            # Updated access to response
-            feedback_dict = json.loads(response.choices[0].message.content)
-            
-            return ResumeFeedback(
+            feedback_dict = repair_json(content)
+            if not isinstance(feedback_dict, dict):
+                raise JSONRepairError("response is not a JSON object")
+            feedback = ResumeFeedback(
                 overall_score=feedback_dict["overall_score"],
-                suggestions=feedback_dict["suggestions"],
-                missing_skills=feedback_dict["missing_skills"],
-                improvement_areas=feedback_dict["improvement_areas"],
-                job_recommendations=[]  # Will be filled later
+                suggestions=feedback_dict.get("suggestions") or [],
+                missing_skills=feedback_dict.get("missing_skills") or [],
+                improvement_areas=feedback_dict.get("improvement_areas") or {},
+                job_recommendations=[]  # Filled in by analyze_resume
             )
+            feedback.overall_score = min(max(feedback.overall_score, 0.0), 100.0)
+            return feedback
 
-        except Exception as e:
+        except (KeyError, ValueError) as e:
+            # ValueError covers JSONRepairError and pydantic's ValidationError
             print(f"Error parsing GPT feedback: {str(e)}")
             return ResumeFeedback(
                 overall_score=50.0,
@@ -161,13 +166,14 @@ class ResumeAnalyzer:
                 job_recommendations=[]
             )
 
-    def _get_job_recommendations(self, resume: Resume, job_description: str) -> List[JobRecommendation]:
+    async def _get_job_recommendations(self, resume: Resume, job_description: str) -> List[JobRecommendation]:
         """Match resume against jobs database and return top 5 recommendations."""
+        target_skills = await self._extract_target_skills(job_description)
+        return self._rank_jobs(resume, target_skills)
+
+    async def _extract_target_skills(self, job_description: str) -> Optional[Set[str]]:
+        """Ask GPT for the key skills in a job description; None if the call fails."""
         try:
-            # Prepare input for skill matching
-            resume_skills = set(skill.name.lower() for skill in resume.skills)
-            resume_experience = " ".join([exp.description for exp in resume.experience])
-            
             # Get GPT to extract key skills from job description
             target_skills_prompt = f"""
             Extract key technical skills, soft skills, and requirements from this job description:
@@ -175,10 +181,8 @@ class ResumeAnalyzer:
             Return only the list of skills, one per line.
             """
             
-            # Updated method call
-            response = self.client.chat.completions.create(
-                model=self.MODEL,
-                messages=[
+            content = await self.llm.complete(
+                [
                     {"role": "system", "content": "Extract key skills and requirements."},
                     {"role": "user", "content": target_skills_prompt}
                 ],
@@ -186,34 +190,35 @@ class ResumeAnalyzer:
                 temperature=0.3
             )
             
-            # Updated access to response
-            target_skills = set(
+            return set(
                 skill.strip().lower() 
-                for skill in response.choices[0].message.content.split('\n')
+                for skill in content.split('\n')
                 if skill.strip()
             )
+
+        except Exception as e:
+            print(f"Error getting job recommendations: {str(e)}")
+            return None
+
+    def _rank_jobs(self, resume: Resume, target_skills: Optional[Set[str]]) -> List[JobRecommendation]:
+        """Score every job against the resume and target skills and return the top 5."""
+        if target_skills is None:
+            return []
+        try:
+            # Prepare input for skill matching
+            resume_skills = set(skill.name.lower() for skill in resume.skills)
             
-            # Rest of the method remains the same...
-            
-            # Score each job, sort, and get top recommendations
-            job_scores = []
-            for job in self.jobs_data:
-                job_skills = set(skill.lower() for skill in job["requiredSkills"])
-                
-                # Calculate match score
-                skill_match = len(resume_skills.intersection(job_skills)) / len(job_skills) if job_skills else 0
-                target_match = len(target_skills.intersection(job_skills)) / len(target_skills) if target_skills else 0
-                
-                # Combine scores (weighted average)
-                match_score = (skill_match * 0.7) + (target_match * 0.3)
-                
-                job_scores.append((job, match_score))
-            
-            # Sort and get top 5 recommendations
-            job_scores.sort(key=lambda x: x[1], reverse=True)
+            # Score every job in one sparse product and select the top 5
+            if self.semantic_index is not None:
+                ranked = self.semantic_index.top([
+                    ("\n".join(resume_skills), SKILL_MATCH_WEIGHT),
+                    ("\n".join(target_skills), TARGET_MATCH_WEIGHT)
+                ], k=5)
+            else:
+                ranked = self.recommender.top(resume_skills, target_skills, k=5)
+
             top_recommendations = []
-            
-            for job, score in job_scores[:5]:
+            for job, score in ranked:
                 recommendation = JobRecommendation(
                     title=job["title"],
                     key_responsibilities=job["keyResponsibilities"],
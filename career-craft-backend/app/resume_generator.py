@@ -4,7 +4,7 @@ from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from datetime import datetime
 from .schemas import Resume
-import spacy
+from .nlp_registry import get_nlp
 from difflib import SequenceMatcher
 import re
 
@@ -240,8 +240,8 @@ class ResumeGenerator:
 
 class ResumeOptimizer:
     def __init__(self):
-        # Load spaCy model for natural language processing
-        self.nlp = spacy.load('en_core_web_sm')
+        # Share the process-wide spaCy model instead of loading another copy
+        self.nlp = get_nlp()
 
     def optimize_resume(self, resume: Dict, job_description: str) -> Dict:
         """Optimize resume content while preserving original structure"""
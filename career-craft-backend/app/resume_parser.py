@@ -1,17 +1,200 @@
-from typing import Dict, Optional
-import docx2txt
-import PyPDF2
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+import io
 import re
-import spacy
-from dateutil import parser as date_parser
 import os
 from .schemas import ResumeCreate
+from .parse_cache import ParseCache
+from .date_scanner import DATE_PATTERN, DateScanner
+from .nlp_registry import DEFAULT_MODEL, DEFAULT_PROFILE, get_nlp
+from .skill_matcher import SkillMatcher, get_skill_matcher
+from .text_extraction import ExtractionPolicy, get_backend
+from .metrics import ParseTimings
 from datetime import datetime
 
+# A resume can be given as a path, an in-memory buffer or an open binary file
+ResumeSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+@contextmanager
+def _open_source(source: ResumeSource):
+    """Yield a binary stream over a path, bytes-like buffer or file-like object."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as file:
+            yield file
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        # BytesIO shares an immutable bytes buffer instead of copying it;
+        # bytearray and memoryview contents are copied
+        yield io.BytesIO(source)
+    else:
+        if source.seekable():
+            source.seek(0)
+        yield source
+
+def resume_title(filename: str) -> str:
+    """Title given to a resume parsed from an uploaded file."""
+    if not filename:
+        return "Uploaded Resume"
+    return f"Uploaded Resume - {filename}"
+
+def _stream_size(stream: BinaryIO) -> int:
+    """Size in bytes of a seekable stream, leaving it at the start."""
+    stream.seek(0, io.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    return size
+
+def _extract_page_range(source: Union[str, bytes], start: int, end: int, backend: str) -> str:
+    """Extract text from pages [start, end) of a PDF (runs in a worker process)."""
+    with _open_source(source) as file:
+        return get_backend(backend).extract(file, start, end)
+
+class SectionSegmenter:
+    """Find every section header in one pass and split the text into sections."""
+
+    def __init__(self, sections: Dict[str, str]):
+        # One alternation over all section patterns, tagged by section name
+        alternation = "|".join(f"(?P<{name}>{pattern})" for name, pattern in sections.items())
+
+        # When every alternative starts with a literal letter, a first-character
+        # lookahead lets the scan skip most positions without trying each branch
+        alternatives = [alt for pattern in sections.values() for alt in pattern.split('|')]
+        if all(alt[:1].isalpha() for alt in alternatives):
+            first_chars = "".join(sorted({alt[0].lower() for alt in alternatives}))
+            alternation = f"(?=[{first_chars}])(?:{alternation})"
+
+        self._header_regex = re.compile(alternation, re.IGNORECASE)
+
+    def header_offsets(self, text: str) -> List[Tuple[int, str]]:
+        """Return (offset, section name) for every section header, in text order."""
+        return [(match.start(), match.lastgroup) for match in self._header_regex.finditer(text)]
+
+    def segment(self, text: str) -> Dict[str, str]:
+        """Map each section name to its text, from its first header to the next header."""
+        headers = self.header_offsets(text)
+        section_map = {}
+        for i, (start, name) in enumerate(headers):
+            if name in section_map:
+                continue
+            end = headers[i + 1][0] if i + 1 < len(headers) else len(text)
+            section_map[name] = text[start:end].strip()
+        return section_map
+
+class ExperienceSplitter:
+    """Split an experience section into entries in one pass over its lines.
+
+    Each entry is a heading line (company), a position line and a body of
+    dates, bullets and description. Once the current entry has a bullet, or a
+    date and at least one line past the position, the next heading-like line
+    starts a new entry. Every line is
+    looked at once with bounded work, so the cost stays linear even for text
+    made of long runs of capitalized words.
+    """
+
+    BULLETS = ('•', '-', '●')
+    # Longer lines, or lines ending in a full stop, read as description
+    MAX_HEADING_WORDS = 8
+
+    def __init__(self, header_pattern: str):
+        self._header_regex = re.compile(rf'(?:{header_pattern})\s*:?', re.IGNORECASE)
+
+    def split(self, section: str) -> List[List[str]]:
+        """Return each entry as its list of non-blank, stripped lines."""
+        entries = []
+        current = None
+        dated = has_body = False
+        for i, line in enumerate(section.split('\n')):
+            line = line.strip()
+            if not line:
+                continue
+            # The section text starts with its own header line
+            if i == 0 and self._header_regex.fullmatch(line):
+                continue
+
+            if current is None or (has_body and self._is_heading(line)):
+                current = [line]
+                entries.append(current)
+                dated = DATE_PATTERN.search(line) is not None
+                has_body = False
+                continue
+
+            current.append(line)
+            dated = dated or DATE_PATTERN.search(line) is not None
+            # Past the company and position lines, with a date or bullet seen
+            has_body = has_body or line.startswith(self.BULLETS) or (dated and len(current) > 2)
+        return entries
+
+    def _is_heading(self, line: str) -> bool:
+        """Whether a line looks like a company name rather than body text."""
+        return (
+            len(line) > 1
+            and 'A' <= line[0] <= 'Z'
+            and 'a' <= line[1] <= 'z'
+            and not line.endswith('.')
+            and not DATE_PATTERN.match(line)
+            and len(line.split(None, self.MAX_HEADING_WORDS)) <= self.MAX_HEADING_WORDS
+        )
+
+class NLPContext:
+    """Run the spaCy pipeline once per parse and share its output across extractors."""
+
+    # Contact details live near the top; the summary draws on a slightly longer prefix
+    CONTACT_WINDOW = 1000
+    SUMMARY_WINDOW = 2000
+
+    def __init__(self, nlp, text: str, doc=None):
+        self._nlp = nlp
+        self._text = text[:self.SUMMARY_WINDOW]
+        self._doc = doc
+
+    @property
+    def doc(self):
+        """The processed Doc, created on first access."""
+        if self._doc is None:
+            self._doc = self._nlp(self._text)
+        return self._doc
+
+    @property
+    def entities(self) -> list:
+        """Named entities in the processed prefix."""
+        return list(self.doc.ents)
+
+    @property
+    def sentences(self) -> List[str]:
+        """Sentence texts in the processed prefix."""
+        return [sent.text for sent in self.doc.sents]
+
 class ResumeParser:
-    def __init__(self):
-        # Load SpaCy model for NER
-        self.nlp = spacy.load("en_core_web_sm")
+    def __init__(
+        self,
+        pdf_workers: Optional[int] = None,
+        max_pdf_pages: int = 100,
+        parallel_page_threshold: int = 8,
+        cache: Optional[ParseCache] = None,
+        model_name: str = DEFAULT_MODEL,
+        nlp_profile: str = DEFAULT_PROFILE,
+        skill_matcher: Optional[SkillMatcher] = None,
+        extraction_policy: Optional[ExtractionPolicy] = None
+    ):
+        # SpaCy model for NER and sentences, fetched lazily from the shared registry.
+        # The parser only needs GPE/LOC entities and sentence boundaries, so the
+        # "ner_sentencizer" profile is enough; see nlp_registry.PIPELINE_PROFILES.
+        self.model_name = model_name
+        self.nlp_profile = nlp_profile
+        self._nlp = None
+
+        # PDF extraction settings: documents with more pages than the threshold
+        # are split into page ranges and extracted in a process pool
+        self.pdf_workers = pdf_workers or os.cpu_count() or 1
+        self.max_pdf_pages = max_pdf_pages
+        self.parallel_page_threshold = parallel_page_threshold
+        self._pdf_pool = None
+
+        # Chooses the PDF/DOCX text extraction backend for each file
+        self.extraction_policy = extraction_policy or ExtractionPolicy()
+
+        # Optional content-addressed cache of parse results
+        self.cache = cache
         
         # Common section headers in resumes
         self.sections = {
@@ -21,24 +204,107 @@ class ResumeParser:
             'projects': r'projects|personal projects',
             'achievements': r'achievements|accomplishments|honors'
         }
+        self.section_segmenter = SectionSegmenter(self.sections)
+        self.experience_splitter = ExperienceSplitter(self.sections['experience'])
+        self.date_scanner = DateScanner()
+
+        # Skill taxonomy matched across the whole resume; defaults to the
+        # shared matcher over data/skills.txt and the skills jobs ask for
+        self._skill_matcher = skill_matcher
     
-    def extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text content from PDF file."""
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text()
-        return text
-
-    def extract_text_from_docx(self, file_path: str) -> str:
-        """Extract text content from DOCX file."""
-        return docx2txt.process(file_path)
-
-    def extract_contact_info(self, text: str) -> Dict[str, str]:
+    @property
+    def nlp(self):
+        """The shared spaCy pipeline, loaded on first use."""
+        if self._nlp is None:
+            self._nlp = get_nlp(self.model_name, self.nlp_profile)
+        return self._nlp
+
+    @nlp.setter
+    def nlp(self, nlp):
+        self._nlp = nlp
+
+    @property
+    def skill_matcher(self) -> SkillMatcher:
+        """The skill taxonomy matcher, built on first use."""
+        if self._skill_matcher is None:
+            self._skill_matcher = get_skill_matcher()
+        return self._skill_matcher
+
+    def extract_text_from_pdf(self, source: ResumeSource, timings: Optional[ParseTimings] = None) -> str:
+        """Extract text content from a PDF path, buffer or file-like object."""
+        with _open_source(source) as file:
+            size = _stream_size(file)
+            # Count pages with the reader that will extract them, so the file is parsed once
+            backend = self.extraction_policy.choose('.pdf', size)
+            document = backend.open(file)
+            page_count = min(backend.count_pages(document), self.max_pdf_pages)
+            if timings is not None:
+                timings.size, timings.pages = size, page_count
+            chosen = self.extraction_policy.choose('.pdf', size, page_count)
+            if chosen is not backend:
+                backend = chosen
+                file.seek(0)
+                document = backend.open(file)
+
+            # Short documents are cheaper to extract inline than to ship to the pool
+            if self.pdf_workers < 2 or page_count <= self.parallel_page_threshold:
+                return backend.extract_pages(document, 0, page_count)
+
+            # Workers reopen the document themselves, so they need a path or raw bytes
+            if isinstance(source, (str, os.PathLike)):
+                worker_source = os.fspath(source)
+            elif isinstance(source, bytes):
+                worker_source = source
+            else:
+                file.seek(0)
+                worker_source = file.read()
+
+        ranges = self._split_page_ranges(page_count, self.pdf_workers)
+        pool = self._get_pdf_pool()
+        chunks = pool.map(
+            _extract_page_range,
+            [worker_source] * len(ranges),
+            [start for start, _ in ranges],
+            [end for _, end in ranges],
+            [backend.name] * len(ranges)
+        )
+        # map() yields results in submission order, so pages stay in order
+        return "".join(chunks)
+
+    def _split_page_ranges(self, page_count: int, workers: int) -> List[Tuple[int, int]]:
+        """Split [0, page_count) into at most `workers` contiguous page ranges."""
+        chunk_size = -(-page_count // workers)  # ceiling division
+        return [
+            (start, min(start + chunk_size, page_count))
+            for start in range(0, page_count, chunk_size)
+        ]
+
+    def _get_pdf_pool(self) -> ProcessPoolExecutor:
+        """Lazily create the process pool used for parallel PDF extraction."""
+        if self._pdf_pool is None:
+            self._pdf_pool = ProcessPoolExecutor(max_workers=self.pdf_workers)
+        return self._pdf_pool
+
+    def close(self):
+        """Shut down the PDF extraction pool, if one was started."""
+        if self._pdf_pool is not None:
+            self._pdf_pool.shutdown()
+            self._pdf_pool = None
+
+    def extract_text_from_docx(self, source: ResumeSource, timings: Optional[ParseTimings] = None) -> str:
+        """Extract text content from a DOCX path, buffer or file-like object."""
+        with _open_source(source) as file:
+            size = _stream_size(file)
+            if timings is not None:
+                timings.size = size
+            backend = self.extraction_policy.choose('.docx', size)
+            return backend.extract(file)
+
+    def extract_contact_info(self, text: str, nlp_context: Optional[NLPContext] = None) -> Dict[str, str]:
         """Extract contact information using regex and SpaCy NER."""
-        doc = self.nlp(text[:1000])  # Process first 1000 chars for efficiency
-        
+        if nlp_context is None:
+            nlp_context = NLPContext(self.nlp, text)
+
         contact_info = {}
         
         # Extract email
@@ -53,17 +319,19 @@ class ResumeParser:
         if phone_match:
             contact_info['phone'] = phone_match.group()
 
-        # Extract location using SpaCy NER
-        for ent in doc.ents:
+        # Extract location using SpaCy NER (only entities near the top of the resume)
+        for ent in nlp_context.entities:
+            if ent.start_char >= NLPContext.CONTACT_WINDOW:
+                break
             if ent.label_ in ['GPE', 'LOC']:
                 contact_info['location'] = ent.text
                 break
 
         return contact_info
 
-    def extract_education(self, text: str) -> list:
+    def extract_education(self, text: str, sections: Optional[Dict[str, str]] = None) -> list:
         """Extract education information."""
-        education_section = self._extract_section(text, self.sections['education'])
+        education_section = self._get_section(text, 'education', sections)
         if not education_section:
             return []
 
@@ -104,28 +372,24 @@ class ResumeParser:
 
         return education_list
 
-    def extract_experience(self, text: str) -> list:
+    def extract_experience(self, text: str, sections: Optional[Dict[str, str]] = None) -> list:
         """Extract work experience information."""
-        experience_section = self._extract_section(text, self.sections['experience'])
+        experience_section = self._get_section(text, 'experience', sections)
         if not experience_section:
             return []
 
         experience_list = []
-        # Split into entries based on company/position patterns
-        entries = re.split(r'\n(?=[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*(?:Ltd\.?|Inc\.?|Corp\.?)?)', experience_section)
+        # Split into company/position entries line by line
+        entries = self.experience_splitter.split(experience_section)
         
-        for entry in entries:
+        for lines in entries:
             try:
-                lines = entry.split('\n')
-                if not lines:
-                    continue
-
                 # Extract company and position
-                company = lines[0].strip()
-                position = lines[1].strip() if len(lines) > 1 else ""
+                company = lines[0]
+                position = lines[1] if len(lines) > 1 else ""
 
                 # Extract dates
-                dates = self._extract_dates(entry)
+                dates = self._extract_dates('\n'.join(lines))
 
                 # Extract description and highlights
                 description = ""
@@ -152,84 +416,56 @@ class ResumeParser:
 
         return experience_list
 
-    def extract_skills(self, text: str) -> list:
-        """Extract skills information."""
-        skills_section = self._extract_section(text, self.sections['skills'])
-        if not skills_section:
-            return []
-
+    def extract_skills(self, text: str, sections: Optional[Dict[str, str]] = None) -> list:
+        """Extract skills from the skills section plus known skills mentioned anywhere."""
         skills_list = []
-        # Split by common delimiters
-        skills_text = re.sub(r'[•\-,|]', '\n', skills_section)
-        
-        for skill in skills_text.split('\n'):
-            skill = skill.strip()
-            if skill and len(skill) > 1:
-                skills_list.append({
-                    "name": skill,
-                    "category": "Technical",  # Default category
-                    "proficiency_level": None
-                })
+        skills_section = self._get_section(text, 'skills', sections)
+        if skills_section:
+            # Split by common delimiters
+            skills_text = re.sub(r'[•\-,|]', '\n', skills_section)
+
+            for skill in skills_text.split('\n'):
+                skill = skill.strip()
+                if skill and len(skill) > 1:
+                    skills_list.append({
+                        "name": skill,
+                        "category": "Technical",  # Default category
+                        "proficiency_level": None
+                    })
 
-        return skills_list
+        # Known skills from the taxonomy, e.g. those only named in experience entries.
+        # The block before the first section header holds the name and contact
+        # details ("Julia Ruby", "Swift Street"), so it is not scanned.
+        headers = self.section_segmenter.header_offsets(text)
+        body = text[headers[0][0]:] if headers else text
+        found = self.skill_matcher.find(body, include_ambiguous=False)
+        # Skills that are also common words are only taken from where skills are listed
+        for name in ('skills', 'experience'):
+            section = self._get_section(text, name, sections)
+            if section:
+                found.extend(self.skill_matcher.find(section))
+
+        listed = {skill["name"].lower() for skill in skills_list}
+        for skill in found:
+            if skill["name"].lower() not in listed:
+                listed.add(skill["name"].lower())
+                skills_list.append({**skill, "proficiency_level": None})
 
-    def _extract_section(self, text: str, section_pattern: str) -> Optional[str]:
-        """Extract a section from the resume text."""
-        pattern = re.compile(section_pattern, re.IGNORECASE)
-        matches = list(pattern.finditer(text))
-        
-        if not matches:
-            return None
+        return skills_list
 
-        start_idx = matches[0].start()
-        
-        # Find the start of the next section
-        next_section_start = len(text)
-        for section_pattern in self.sections.values():
-            pattern = re.compile(section_pattern, re.IGNORECASE)
-            matches = list(pattern.finditer(text[start_idx + 1:]))
-            if matches:
-                next_start = start_idx + 1 + matches[0].start()
-                next_section_start = min(next_section_start, next_start)
+    def segment_sections(self, text: str) -> Dict[str, str]:
+        """Split the resume text into a section map shared by all extractors."""
+        return self.section_segmenter.segment(text)
 
-        return text[start_idx:next_section_start].strip()
+    def _get_section(self, text: str, name: str, sections: Optional[Dict[str, str]]) -> Optional[str]:
+        """Look up a section, segmenting the text only if no section map was passed."""
+        if sections is None:
+            sections = self.segment_sections(text)
+        return sections.get(name)
 
     def _extract_dates(self, text: str) -> Dict[str, Optional[datetime]]:
         """Extract start and end dates from text."""
-
-        # Common date formats in resumes
-        date_patterns = [
-            r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|'
-            r'Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|'
-            r'Dec(?:ember)?)[,\s]+\d{4}',
-            r'\d{1,2}/\d{4}',
-            r'\d{4}'
-        ]
-    
-        dates = []
-        for pattern in date_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                try:
-                    date = date_parser.parse(match.group())
-                    dates.append(date)
-                except:
-                    continue
-
-        dates.sort()
-    
-        # If no dates found, use current date as default
-        if not dates:
-            default_date = datetime.now().replace(month=1, day=1)
-            return {
-                'start_date': default_date,
-                'end_date': None
-            }
-
-        return {
-            'start_date': dates[0],
-            'end_date': dates[-1] if len(dates) > 1 else None
-        }
+        return self.date_scanner.extract(text)
 
     def _extract_gpa(self, text: str) -> Optional[str]:
         """Extract GPA from text."""
@@ -237,48 +473,159 @@ class ResumeParser:
         match = re.search(gpa_pattern, text)
         return match.group(1) if match else None
 
-    def parse_resume(self, file_path: str) -> ResumeCreate:
+    def extract_text(self, source: ResumeSource, filename: Optional[str] = None, timings: Optional[ParseTimings] = None) -> str:
+        """Extract raw text from a resume based on its file type.
+
+        If `timings` is given, it is tagged with the file type, size and page count.
+        """
+        file_extension = self._detect_extension(source, filename)
+        if timings is not None:
+            timings.file_type = file_extension
+        if file_extension == '.pdf':
+            return self.extract_text_from_pdf(source, timings)
+        elif file_extension in ['.docx', '.doc']:
+            return self.extract_text_from_docx(source, timings)
+        else:
+            raise ValueError("Unsupported file format")
+
+    def parse_resume(self, source: ResumeSource, filename: Optional[str] = None, timings: Optional[ParseTimings] = None) -> ResumeCreate:
+        """Main method to parse a resume and return structured data.
+
+        `source` may be a path, bytes/memoryview or a binary file-like object such
+        as a spooled upload; `filename` names in-memory sources. Stage durations
+        are recorded in the metrics registry, or collected into `timings` when the
+        caller passes one (e.g. to report them from another process).
+        """
         try:
-            """Main method to parse resume file and return structured data."""
-            # Determine file type and extract text
-            file_extension = os.path.splitext(file_path)[1].lower()
-            if file_extension == '.pdf':
-                text = self.extract_text_from_pdf(file_path)
-            elif file_extension in ['.docx', '.doc']:
-                text = self.extract_text_from_docx(file_path)
-            else:
-                raise ValueError("Unsupported file format")
-
-            # Extract all components
-            contact_info = self.extract_contact_info(text)
-            education = self.extract_education(text)
-            experience = self.extract_experience(text)
-            skills = self.extract_skills(text)
-
-            # Create ResumeCreate object
-            resume_data = ResumeCreate(
-                title=f"Uploaded Resume - {os.path.basename(file_path)}",
-                summary=self._generate_summary(text),  # New method to generate summary
-                contact_info=contact_info,
-                created_manually=False,  # Mark as uploaded
-                is_uploaded_resume=True,
-                target_job_description="",
-                education=education,
-                experience=experience,
-                skills=skills,
-                projects=[],
-                achievements=[]
-            )
-
+            filename = self._source_name(source, filename)
+
+            cache_key = None
+            if self.cache is not None:
+                with _open_source(source) as stream:
+                    cache_key = self.cache.key_for_stream(stream)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    # Identical bytes parse identically; only the title reflects the file name
+                    cached.title = resume_title(filename)
+                    return cached
+
+            stage_timings = timings if timings is not None else ParseTimings()
+            with stage_timings.stage("extract_text"):
+                text = self.extract_text(source, filename, stage_timings)
+            resume_data = self._build_resume(filename, text, NLPContext(self.nlp, text), stage_timings)
+            if timings is None:
+                stage_timings.record()
+
+            if cache_key is not None:
+                self.cache.put(cache_key, resume_data)
             return resume_data
         except ValueError as ve:
             # Handle unsupported file formats
             print(f"ValueError: {ve}")
             raise
 
-    def _generate_summary(self, text: str) -> str:
+    def parse_many(
+        self,
+        sources: Iterable[ResumeSource],
+        filenames: Optional[Iterable[str]] = None,
+        batch_size: int = 32,
+        n_process: int = 1,
+        on_error: Optional[Callable[[str, Exception], None]] = None
+    ) -> Iterator[ResumeCreate]:
+        """Parse many resumes, streaming their text through nlp.pipe in batches.
+
+        Results are yielded in input order as each batch completes. A file that
+        cannot be read or parsed is skipped and reported to `on_error` (printed
+        if None) with its name, without affecting the rest of the batch.
+        """
+        def report(filename: str, error: Exception):
+            if on_error is not None:
+                on_error(filename, error)
+            else:
+                print(f"Error parsing {filename}: {str(error)}")
+
+        def texts():
+            names = iter(filenames) if filenames is not None else None
+            for source in sources:
+                filename = self._source_name(source, next(names) if names else None)
+                timings = ParseTimings()
+                try:
+                    with timings.stage("extract_text"):
+                        text = self.extract_text(source, filename, timings)
+                except Exception as e:
+                    # Raising here would end the generator and abort the whole batch
+                    report(filename, e)
+                    continue
+                yield text[:NLPContext.SUMMARY_WINDOW], (filename, text, timings)
+
+        docs = self.nlp.pipe(texts(), as_tuples=True, batch_size=batch_size, n_process=n_process)
+        for doc, (filename, text, timings) in docs:
+            try:
+                resume_data = self._build_resume(filename, text, NLPContext(self.nlp, text, doc=doc), timings)
+            except Exception as e:
+                report(filename, e)
+                continue
+            timings.record()
+            yield resume_data
+
+    def _build_resume(self, filename: str, text: str, nlp_context: NLPContext, timings: Optional[ParseTimings] = None) -> ResumeCreate:
+        """Run every extractor over the text and assemble the parsed resume."""
+        timings = timings or ParseTimings()
+        # Extract all components from a single section scan and NLP pass
+        # (contact runs the spaCy pipeline unless the Doc came from nlp.pipe)
+        with timings.stage("sections"):
+            sections = self.segment_sections(text)
+        with timings.stage("contact"):
+            contact_info = self.extract_contact_info(text, nlp_context)
+        with timings.stage("education"):
+            education = self.extract_education(text, sections)
+        with timings.stage("experience"):
+            experience = self.extract_experience(text, sections)
+        with timings.stage("skills"):
+            skills = self.extract_skills(text, sections)
+        with timings.stage("summary"):
+            summary = self._generate_summary(text, nlp_context)
+
+        return ResumeCreate(
+            title=resume_title(filename),
+            summary=summary,
+            contact_info=contact_info,
+            created_manually=False,  # Mark as uploaded
+            is_uploaded_resume=True,
+            target_job_description="",
+            education=education,
+            experience=experience,
+            skills=skills,
+            projects=[],
+            achievements=[]
+        )
+
+    def _source_name(self, source: ResumeSource, filename: Optional[str]) -> str:
+        """Name a resume source: the given filename, else the path's base name."""
+        if filename:
+            return os.path.basename(filename)
+        if isinstance(source, (str, os.PathLike)):
+            return os.path.basename(os.fspath(source))
+        name = getattr(source, "name", None)
+        return os.path.basename(name) if isinstance(name, str) else ""
+
+    def _detect_extension(self, source: ResumeSource, filename: Optional[str]) -> str:
+        """Use the file extension when there is one, otherwise sniff the magic bytes."""
+        file_extension = os.path.splitext(self._source_name(source, filename))[1].lower()
+        if file_extension:
+            return file_extension
+        with _open_source(source) as stream:
+            magic = stream.read(4)
+        if magic == b"%PDF":
+            return '.pdf'
+        if magic == b"PK\x03\x04":  # DOCX files are zip archives
+            return '.docx'
+        return ""
+
+
+    def _generate_summary(self, text: str, nlp_context: Optional[NLPContext] = None) -> str:
         """Generate a professional summary using extracted text."""
-        # Use NLP to create a concise summary
-        doc = self.nlp(text[:2000])  # Process first 2000 chars
-        summary_sentences = [sent.text for sent in doc.sents][:3]
-        return " ".join(summary_sentences)
+        if nlp_context is None:
+            nlp_context = NLPContext(self.nlp, text)
+        # Use the first few sentences as a concise summary
+        return " ".join(nlp_context.sentences[:3])
@@ -109,6 +109,17 @@ class Resume(ResumeBase):
     class Config:
         from_attributes = True
 
+class ParseJob(BaseModel):
+    id: str
+    status: str
+    resume_id: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+    class Config:
+        from_attributes = True
+
 class JobRecommendation(BaseModel):
     title: str
     key_responsibilities: List[str]
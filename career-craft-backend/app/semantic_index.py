@@ -0,0 +1,474 @@
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+import hashlib
+import json
+import math
+import os
+import numpy as np
+from scipy import sparse
+from .ann_index import IVFIndex, normalize_rows
+from .job_recommender import top_k
+from .skill_matcher import DATA_DIR, JOBS_PATH
+from .storage import atomic_directory, file_lock
+
+# Bump when document building or vectorizer settings change so stale indexes are rebuilt
+SEMANTIC_INDEX_VERSION = "1"
+SEMANTIC_INDEX_DIR = os.path.join(DATA_DIR, "semantic_index")
+
+# Keeps tokens such as "c++", "c#" and ".net" whole
+TOKEN_PATTERN = r"(?u)(?:(?<![\w.])\.\w+|\b\w[\w+#]*)"
+
+VECTORIZER_OPTIONS = {
+    "lowercase": True,
+    "stop_words": "english",
+    "token_pattern": TOKEN_PATTERN,
+    "ngram_range": (1, 2),
+    "sublinear_tf": True,
+    "norm": "l2",
+}
+
+def job_document(job: dict) -> str:
+    """The text a job is matched on: title, responsibilities and required skills."""
+    return "\n".join([job["title"], *job["keyResponsibilities"], *job["requiredSkills"]])
+
+def catalog_fingerprint(jobs_path: str) -> str:
+    """Hash of the jobs file's bytes and the index settings, so checking an index needn't parse the catalog."""
+    digest = hashlib.sha256(json.dumps([SEMANTIC_INDEX_VERSION, VECTORIZER_OPTIONS], sort_keys=True).encode())
+    with open(jobs_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+class MappedStrings(Sequence):
+    """Read-only strings stored as one UTF-8 blob plus offsets, both .npy files that can be memory-mapped."""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self.blob = blob
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, position: int) -> str:
+        return bytes(self.blob[self.offsets[position]:self.offsets[position + 1]]).decode()
+
+    @staticmethod
+    def save(directory: str, name: str, strings: Iterable[str]):
+        encoded = [string.encode() for string in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(item) for item in encoded], out=offsets[1:])
+        np.save(os.path.join(directory, f"{name}.npy"), np.frombuffer(b"".join(encoded), dtype=np.uint8))
+        np.save(os.path.join(directory, f"{name}_offsets.npy"), offsets)
+
+    @classmethod
+    def load(cls, directory: str, name: str) -> "MappedStrings":
+        return cls(
+            np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r'),
+            np.load(os.path.join(directory, f"{name}_offsets.npy"), mmap_mode='r')
+        )
+
+class MappedVocabulary(Mapping):
+    """Term -> column mapping over sorted mapped terms, looked up by binary search."""
+
+    def __init__(self, terms: MappedStrings, columns: np.ndarray):
+        self.terms = terms
+        self.columns = columns
+
+    def __getitem__(self, term: str) -> int:
+        terms = self.terms
+        low, high = 0, len(terms)
+        while low < high:
+            middle = (low + high) // 2
+            if terms[middle] < term:
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(terms) or terms[low] != term:
+            raise KeyError(term)
+        return int(self.columns[low])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.terms)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    @staticmethod
+    def save(directory: str, vocabulary: Mapping[str, int]):
+        # Sorted by UTF-8 bytes, which is the order str comparison uses
+        items = sorted(vocabulary.items(), key=lambda item: item[0].encode())
+        MappedStrings.save(directory, "terms", [term for term, _ in items])
+        np.save(os.path.join(directory, "term_columns.npy"), np.array([column for _, column in items], dtype=np.int64))
+
+    @classmethod
+    def load(cls, directory: str) -> "MappedVocabulary":
+        return cls(MappedStrings.load(directory, "terms"), np.load(os.path.join(directory, "term_columns.npy"), mmap_mode='r'))
+
+class MappedJobs(Sequence):
+    """Job postings stored as mapped JSON strings, decoded when accessed; appended jobs are kept in memory."""
+
+    def __init__(self, stored: MappedStrings):
+        self.stored = stored
+        self.added: List[dict] = []
+
+    def __len__(self) -> int:
+        return len(self.stored) + len(self.added)
+
+    def __getitem__(self, position: int) -> dict:
+        if position < 0:
+            position += len(self)
+        if position < len(self.stored):
+            return json.loads(self.stored[position])
+        return self.added[position - len(self.stored)]
+
+    def append(self, job: dict):
+        self.added.append(job)
+
+    @staticmethod
+    def save(directory: str, jobs: Iterable[dict]):
+        MappedStrings.save(directory, "jobs", (json.dumps(job) for job in jobs))
+
+    @classmethod
+    def load(cls, directory: str) -> "MappedJobs":
+        return cls(MappedStrings.load(directory, "jobs"))
+
+class SemanticJobIndex:
+    """TF-IDF index over job postings answering top-k cosine similarity queries.
+
+    Jobs are vectorized with scikit-learn's TfidfVectorizer (word unigrams and
+    bigrams, sublinear tf, L2-normalized rows), so a resume that lists
+    "python" matches a job asking for "Programming (e.g., Python, Java)".
+    Queries are vectorized locally from the stored vocabulary and idf weights,
+    so a loaded index needs no fitted vectorizer.
+
+    The job x term matrix is kept by column, so a query only reads the
+    postings of its own terms. `save` writes the arrays as .npy files and
+    `load` memory-maps them read-only, so every worker on a host shares one
+    copy through the page cache. The jobs and vocabulary are stored the same
+    way (MappedJobs, MappedVocabulary) rather than parsed into each worker.
+
+    For catalogs too large to score exactly per request, `attach_ann` projects
+    the job vectors to around a hundred dense dimensions (LSA) and indexes them
+    in an IVFIndex. `top` then takes `ann_candidates` jobs from the lists
+    nearest the query and ranks them by their exact tf-idf cosine, read from
+    a row-major copy of the matrix; the projection only has to get the right
+    jobs into the candidates, not order them. Such an index is saved by row
+    only, and the by-column matrix is derived if an exact query needs it.
+    Jobs can be added with `add_job` without refitting: they are vectorized
+    with the stored vocabulary and idf, scored alongside the matrix and added
+    to the ANN index, and folded into the matrix on `save`.
+    """
+
+    # Jobs taken from the ANN index per query and rescored exactly
+    ann_candidates = 512
+
+    def __init__(
+        self,
+        jobs: Union[List[dict], MappedJobs],
+        matrix: Optional[sparse.csc_matrix],
+        vocabulary: Mapping[str, int],
+        idf: np.ndarray,
+        fingerprint: str = "",
+        projection: Optional[np.ndarray] = None,
+        projected_terms: Optional[np.ndarray] = None,
+        ann: Optional[IVFIndex] = None,
+        rows: Optional[sparse.csr_matrix] = None
+    ):
+        self.jobs = jobs
+        # By column; None when loaded by row, until an exact query derives it
+        self._matrix = matrix
+        self.vocabulary = vocabulary
+        self.idf = idf
+        self.fingerprint = fingerprint
+        # LSA vectors of the terms in `projected_terms` (sorted columns), mapping
+        # tf-idf vectors into the ANN index's space; other terms project to zero
+        self.projection = projection
+        self.projected_terms = projected_terms
+        self.ann = ann
+        # The matrix by row, for rescoring ANN candidates
+        self.rows = rows
+        self.shape = (matrix if matrix is not None else rows).shape
+        # Rows of jobs added since the matrix was built: stacked, plus those
+        # added since they were last stacked
+        self._added = sparse.csr_matrix((0, self.shape[1]))
+        self._added_rows: List[sparse.csr_matrix] = []
+        self._analyzer = self._vectorizer().build_analyzer()
+
+    @property
+    def matrix(self) -> sparse.csc_matrix:
+        """The job x term matrix by column, converted from `rows` on first use if it was not loaded."""
+        if self._matrix is None:
+            self._matrix = self.rows.tocsc()
+        return self._matrix
+
+    @staticmethod
+    def _vectorizer():
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        return TfidfVectorizer(**VECTORIZER_OPTIONS)
+
+    @classmethod
+    def build(cls, jobs: List[dict], fingerprint: str = "") -> "SemanticJobIndex":
+        """Fit an index to `jobs`; `fingerprint` identifies the catalog it was built from."""
+        vectorizer = cls._vectorizer()
+        matrix = vectorizer.fit_transform([job_document(job) for job in jobs])
+        vocabulary = {term: int(column) for term, column in vectorizer.vocabulary_.items()}
+        return cls(jobs, matrix.tocsc(), vocabulary, vectorizer.idf_, fingerprint)
+
+    def vectorize(self, text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(term columns, L2-normalized tf-idf weights) for a query text."""
+        counts = Counter(self._analyzer(text))
+        found = [(self.vocabulary.get(term), count) for term, count in counts.items()]
+        found = [(column, count) for column, count in found if column is not None]
+        if not found:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        columns = np.array([column for column, _ in found], dtype=np.int64)
+        weights = np.array([1.0 + math.log(count) for _, count in found]) * self.idf[columns]
+        return columns, weights / np.linalg.norm(weights)
+
+    def _query(self, queries: Sequence[Tuple[str, float]]) -> sparse.csc_matrix:
+        """The (terms x 1) weighted sum of the queries' tf-idf vectors."""
+        rows, data = [], []
+        for text, weight in queries:
+            columns, weights = self.vectorize(text)
+            rows.append(columns)
+            data.append(weights * weight)
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+        data = np.concatenate(data) if data else np.empty(0)
+        # Cosine is linear in the normalized query, so all queries fold into one vector
+        return sparse.csc_matrix((data, (rows, np.zeros(len(rows), dtype=np.int64))), shape=(self.shape[1], 1))
+
+    def similarities(self, queries: Sequence[Tuple[str, float]]) -> np.ndarray:
+        """Weighted sum of each job's cosine similarity to each (text, weight) query."""
+        query = self._query(queries)
+        product = self.matrix @ query
+        scores = np.zeros(len(self.jobs))
+        scores[product.indices] = product.data
+        added = self._added_matrix()
+        if added.shape[0]:
+            scores[self.shape[0]:] = (added @ query).toarray().ravel()
+        return scores
+
+    def top(self, queries: Sequence[Tuple[str, float]], k: int = 5, nprobe: Optional[int] = None) -> List[Tuple[dict, float]]:
+        """The k jobs most similar to the weighted queries, best first.
+
+        With an ANN index attached the result is approximate: only jobs in the
+        `nprobe` lists nearest the query (the index's default if None) can be
+        returned. Their scores are exact.
+        """
+        if self.ann is None:
+            scores = self.similarities(queries)
+            return [(self.jobs[i], float(scores[i])) for i in top_k(scores, k)]
+
+        query = self._query(queries)
+        # Only the query's own terms contribute, so project just their rows
+        positions = np.searchsorted(self.projected_terms, query.indices)
+        found = positions < len(self.projected_terms)
+        found[found] = self.projected_terms[positions[found]] == query.indices[found]
+        embedded = query.data[found].astype(np.float32) @ self.projection[positions[found]]
+        candidates, _ = self.ann.search(embedded, max(k, self.ann_candidates), nprobe)
+        # In id order, so equal scores rank by catalog position as in the exact path
+        candidates = np.sort(candidates)
+        scores = self._row_scores(candidates, query)
+        return [(self.jobs[candidates[i]], float(scores[i])) for i in top_k(scores, k)]
+
+    def _row_scores(self, job_ids: np.ndarray, query: sparse.csc_matrix) -> np.ndarray:
+        """Exact similarities of the given jobs to a query vector."""
+        scores = np.zeros(len(job_ids))
+        compiled = job_ids < self.rows.shape[0]
+        scores[compiled] = (self.rows[job_ids[compiled]] @ query).toarray().ravel()
+        if not compiled.all():
+            added = self._added_matrix()
+            scores[~compiled] = (added[job_ids[~compiled] - self.rows.shape[0]] @ query).toarray().ravel()
+        return scores
+
+    def _embed(self, rows: sparse.spmatrix) -> np.ndarray:
+        """Project (n x terms) tf-idf rows to (n x dims) dense vectors."""
+        return np.asarray(rows[:, self.projected_terms] @ self.projection, dtype=np.float32)
+
+    def attach_ann(
+        self,
+        dims: int = 128,
+        nlist: Optional[int] = None,
+        nprobe: int = 16,
+        max_terms: int = 65536,
+        max_training_jobs: int = 100_000,
+        seed: int = 0
+    ):
+        """Fit an LSA projection of the job vectors and index them for approximate search.
+
+        `dims` bounds how much of the tf-idf similarity the projection keeps,
+        `nlist` how finely the catalog is partitioned (about sqrt(jobs) if
+        None), and `nprobe` how many partitions a query searches by default.
+        Only the `max_terms` terms in most jobs are projected, fitted on at
+        most `max_training_jobs` jobs, which bounds memory on large catalogs.
+        """
+        from sklearn.decomposition import TruncatedSVD
+        matrix = self._full_matrix()
+        # Columns are postings lists, so their lengths are document frequencies
+        self.projected_terms = np.sort(top_k(np.diff(matrix.indptr), max_terms))
+        sample = matrix[:, self.projected_terms].tocsr()
+        if sample.shape[0] > max_training_jobs:
+            rng = np.random.default_rng(seed)
+            sample = sample[np.sort(rng.choice(sample.shape[0], max_training_jobs, replace=False))]
+        dims = max(1, min(dims, sample.shape[0] - 1, sample.shape[1] - 1))
+        svd = TruncatedSVD(dims, random_state=seed).fit(sample)
+        self.projection = np.ascontiguousarray(svd.components_.T, dtype=np.float32)
+        self.rows = self.matrix.tocsr()
+        embedded = normalize_rows(self._embed(matrix))
+        self.ann = IVFIndex.train(embedded, nlist, nprobe, seed=seed)
+        self.ann.add(embedded)
+
+    def add_job(self, job: dict) -> int:
+        """Add a job without refitting and return its id (position in `jobs`).
+
+        Terms outside the stored vocabulary are ignored, so the index should be
+        rebuilt once the catalog has drifted far from what it was fitted on.
+        """
+        columns, weights = self.vectorize(job_document(job))
+        row = sparse.csr_matrix((weights, (np.zeros(len(columns), dtype=np.int64), columns)), shape=(1, self.shape[1]))
+        job_id = len(self.jobs)
+        self.jobs.append(job)
+        self._added_rows.append(row)
+        if self.ann is not None:
+            self.ann.add(self._embed(row), ids=[job_id])
+        return job_id
+
+    def _added_matrix(self) -> sparse.csr_matrix:
+        """Rows of the jobs added since the matrix was built.
+
+        Stacked once per batch of adds rather than per query, and kept apart
+        from the matrix so a memory-mapped one is not copied into this worker.
+        """
+        if self._added_rows:
+            self._added = sparse.vstack([self._added, *self._added_rows], format="csr")
+            self._added_rows = []
+        return self._added
+
+    def _full_matrix(self) -> sparse.csc_matrix:
+        """The job x term matrix including jobs added since it was built."""
+        added = self._added_matrix()
+        if not added.shape[0]:
+            return self.matrix
+        return sparse.vstack([self.matrix, added], format="csc")
+
+    def _full_rows(self) -> sparse.csr_matrix:
+        """`rows` including jobs added since it was built."""
+        added = self._added_matrix()
+        if not added.shape[0]:
+            return self.rows
+        return sparse.vstack([self.rows, added], format="csr")
+
+    def save(self, directory: str):
+        """Write the index to `directory`, replacing any index already there.
+
+        Only one layout of the matrix is written: by row with an ANN index
+        attached, since that is what its queries read, otherwise by column.
+        """
+        with atomic_directory(directory, prefix=".semantic_index-") as staging:
+            matrix = self._full_rows() if self.ann is not None else self._full_matrix()
+            for name in ("data", "indices", "indptr"):
+                np.save(os.path.join(staging, f"{name}.npy"), getattr(matrix, name))
+            np.save(os.path.join(staging, "idf.npy"), self.idf)
+            if self.ann is not None:
+                np.save(os.path.join(staging, "projection.npy"), self.projection)
+                np.save(os.path.join(staging, "projected_terms.npy"), self.projected_terms)
+                self.ann.save(os.path.join(staging, "ann"))
+            MappedJobs.save(staging, self.jobs)
+            MappedVocabulary.save(staging, self.vocabulary)
+            with open(os.path.join(staging, "meta.json"), 'w') as f:
+                json.dump({"fingerprint": self.fingerprint, "shape": list(matrix.shape), "layout": matrix.format}, f)
+
+    @classmethod
+    def load(cls, directory: str) -> "SemanticJobIndex":
+        """Open a saved index with its matrix, jobs, vocabulary (and ANN index, if any) memory-mapped read-only."""
+        # Read every file from one version, even if a writer swaps the link meanwhile
+        directory = os.path.realpath(directory)
+        with open(os.path.join(directory, "meta.json"), 'r') as f:
+            meta = json.load(f)
+        arrays = tuple(
+            np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r')
+            for name in ("data", "indices", "indptr")
+        )
+        layout = sparse.csr_matrix if meta["layout"] == "csr" else sparse.csc_matrix
+        matrix = layout(arrays, shape=tuple(meta["shape"]), copy=False)
+        idf = np.load(os.path.join(directory, "idf.npy"))
+        projection = projected_terms = ann = None
+        if os.path.isdir(os.path.join(directory, "ann")):
+            projection = np.load(os.path.join(directory, "projection.npy"), mmap_mode='r')
+            projected_terms = np.load(os.path.join(directory, "projected_terms.npy"))
+            ann = IVFIndex.load(os.path.join(directory, "ann"))
+        return cls(
+            MappedJobs.load(directory), matrix if matrix.format == "csc" else None, MappedVocabulary.load(directory),
+            idf, meta["fingerprint"], projection, projected_terms, ann, matrix if matrix.format == "csr" else None
+        )
+
+def load_or_build_semantic_index(
+    directory: Optional[str] = SEMANTIC_INDEX_DIR,
+    jobs_path: str = JOBS_PATH,
+    ann_min_jobs: Optional[int] = None,
+    ann_nprobe: int = 16,
+    ann_candidates: int = SemanticJobIndex.ann_candidates
+) -> SemanticJobIndex:
+    """Load the saved index for the current jobs file, building and saving it if missing or stale.
+
+    Catalogs of at least `ann_min_jobs` jobs get an ANN index that searches
+    `ann_nprobe` lists and rescores `ann_candidates` jobs per query; None
+    keeps exact scoring at any size.
+
+    A saved index is current if it was built from a jobs file with the same
+    bytes, which is checked by hashing the file rather than parsing it. Only
+    one process builds a stale index, under a lock beside `directory`; others
+    starting meanwhile wait for it and load what it saved.
+    """
+    fingerprint = catalog_fingerprint(jobs_path)
+
+    def tuned(index: SemanticJobIndex) -> SemanticJobIndex:
+        if index.ann is not None:
+            index.ann.nprobe = ann_nprobe
+            index.ann_candidates = ann_candidates
+        return index
+
+    def wants_ann(jobs: int) -> bool:
+        return ann_min_jobs is not None and jobs >= ann_min_jobs
+
+    def load_current() -> Optional[SemanticJobIndex]:
+        try:
+            index = SemanticJobIndex.load(directory)
+            if index.fingerprint == fingerprint and (index.ann is not None) == wants_ann(len(index.jobs)):
+                return tuned(index)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading semantic index from {directory}: {str(e)}")
+        return None
+
+    def build() -> SemanticJobIndex:
+        with open(jobs_path, 'r') as f:
+            jobs = json.load(f)
+        index = SemanticJobIndex.build(jobs, fingerprint)
+        if wants_ann(len(jobs)):
+            index.attach_ann()
+        return index
+
+    if not directory:
+        return tuned(build())
+    index = load_current()
+    if index is not None:
+        return index
+
+    lock_path = os.path.abspath(directory) + ".build.lock"
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    with file_lock(lock_path):
+        # Another process may have built it while this one waited
+        index = load_current()
+        if index is not None:
+            return index
+        index = build()
+        try:
+            index.save(directory)
+            # Serve from the mapped copy so this worker shares pages with the others
+            return tuned(SemanticJobIndex.load(directory))
+        except Exception as e:
+            print(f"Error saving semantic index to {directory}: {str(e)}")
+    return tuned(index)
@@ -0,0 +1,100 @@
+from typing import Dict, Iterable, List, Optional
+import numpy as np
+
+def normalize_skill(name: str) -> str:
+    """Canonical form of a skill name: lowercase with single spaces."""
+    return " ".join(name.lower().split())
+
+class SkillInterner:
+    """Maps normalized skill names to dense integer ids, assigned in first-seen order."""
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._ids: Dict[str, int] = {}
+        self.names: List[str] = []
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name: str) -> int:
+        """Return the id for a skill, assigning the next id if it is new."""
+        name = normalize_skill(name)
+        skill_id = self._ids.get(name)
+        if skill_id is None:
+            skill_id = self._ids[name] = len(self.names)
+            self.names.append(name)
+        return skill_id
+
+    def get(self, name: str) -> Optional[int]:
+        """The id for a skill, or None if it was never interned."""
+        return self._ids.get(normalize_skill(name))
+
+    def ids(self, names: Iterable[str]) -> List[int]:
+        """Ids of the known skills among `names`, sorted and without duplicates; unknown skills are skipped."""
+        found = set()
+        for name in names:
+            # Most names arrive already normalized, so try them as they are first
+            skill_id = self._ids.get(name)
+            if skill_id is None:
+                skill_id = self._ids.get(normalize_skill(name))
+            if skill_id is not None:
+                found.add(skill_id)
+        return sorted(found)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_skill(name) in self._ids
+
+    def __iter__(self):
+        return iter(self.names)
+
+def words_for(skill_count: int) -> int:
+    """Number of uint64 words a bitset over `skill_count` skills needs."""
+    return max(1, -(-skill_count // 64))
+
+def pack(ids: Iterable[int], words: int) -> np.ndarray:
+    """Pack skill ids into a bitset of `words` uint64 words (bit i of word i // 64)."""
+    return pack_many([ids], words)[0]
+
+def pack_many(id_lists: Iterable[Iterable[int]], words: int) -> np.ndarray:
+    """Pack several skill sets into a (sets x words) uint64 matrix."""
+    rows, ids = [], []
+    row_count = 0
+    for skill_ids in id_lists:
+        skill_ids = list(skill_ids)
+        rows.extend([row_count] * len(skill_ids))
+        ids.extend(skill_ids)
+        row_count += 1
+    bits = np.zeros((row_count, words), dtype=np.uint64)
+
+    if ids:
+        # Global bit positions, sorted and deduplicated, so the bits of each
+        # word are contiguous and can be OR-ed together with one reduceat
+        positions = np.sort(np.array(rows, dtype=np.int64) * (words * 64) + np.array(ids, dtype=np.int64))
+        positions = positions[np.r_[True, positions[1:] != positions[:-1]]]
+        keys = positions >> 6
+        values = np.left_shift(np.uint64(1), (positions & 63).astype(np.uint64))
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        bits.ravel()[keys[starts]] = np.bitwise_or.reduceat(values, starts)
+    return bits
+
+if hasattr(np, "bitwise_count"):
+    def popcount(bits: np.ndarray) -> np.ndarray:
+        """Set bits per row of a uint64 bitset array (summed over the last axis)."""
+        return np.bitwise_count(bits).sum(axis=-1, dtype=np.int64)
+else:
+    # NumPy < 2.0: count through a 256-entry table over the bytes
+    _BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def popcount(bits: np.ndarray) -> np.ndarray:
+        """Set bits per row of a uint64 bitset array (summed over the last axis)."""
+        as_bytes = np.ascontiguousarray(bits).view(np.uint8)
+        return _BYTE_COUNTS[as_bytes].sum(axis=-1, dtype=np.int64)
+
+def intersection_counts(sets: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """|set ∩ query| for every row of a packed (sets x words) matrix."""
+    # Words where the query has no bits cannot contribute; skip them when that saves work
+    used = np.flatnonzero(query)
+    if len(used) * 2 < len(query):
+        return popcount(np.bitwise_and(sets[:, used], query[used]))
+    return popcount(np.bitwise_and(sets, query))
@@ -0,0 +1,239 @@
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+import json
+import os
+import re
+import threading
+import weakref
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+JOBS_PATH = os.path.join(DATA_DIR, "jobs.json")
+VOCABULARY_PATH = os.path.join(DATA_DIR, "skills.txt")
+
+DEFAULT_CATEGORY = "Technical"
+
+# "Cloud platforms (e.g., AWS, Azure)" -> head "Cloud platforms", examples "AWS, Azure"
+_EXAMPLES_PATTERN = re.compile(r'^(?P<head>[^(]*)\((?:e\.g\.,?|i\.e\.,?|such as)?\s*(?P<examples>[^)]*)\)', re.IGNORECASE)
+
+def terms_from_job_skill(skill: str) -> List[str]:
+    """Split a jobs.json requiredSkills entry into the terms to look for in a resume.
+
+    "Programming (e.g., Python, Java)" yields "Programming", "Python" and "Java";
+    "HTML/CSS/JavaScript" yields each of the three.
+    """
+    terms = []
+    match = _EXAMPLES_PATTERN.match(skill)
+    if match:
+        terms.append(match.group('head'))
+        terms.extend(re.split(r',|\bor\b|\band\b', match.group('examples')))
+    else:
+        terms.append(skill)
+
+    expanded = []
+    for term in terms:
+        term = term.strip(" .")
+        # Only split on "/" when it joins single words, not in "UI/UX principles"
+        if "/" in term and " " not in term:
+            expanded.extend(term.split("/"))
+        else:
+            expanded.append(term)
+    # Single letters ("R", "C") are too ambiguous to match in free text
+    return [term.strip() for term in expanded if len(term.strip()) > 1]
+
+def load_vocabulary(path: str) -> List[Tuple[str, str, bool]]:
+    """Read (skill, category, ambiguous) triples from a vocabulary file.
+
+    One skill per line; "[Category]" lines set the category for the lines after
+    them and lines starting with "#" are comments ("C#" is a skill, not a comment).
+    A leading "~" marks a skill that is also a common word or name.
+    """
+    entries = []
+    category = DEFAULT_CATEGORY
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('[') and line.endswith(']'):
+                category = line[1:-1].strip()
+                continue
+            ambiguous = line.startswith('~')
+            entries.append((line.lstrip('~').strip(), category, ambiguous))
+    return entries
+
+def load_job_skills(path: str) -> List[str]:
+    """Terms from every job's requiredSkills in jobs.json."""
+    with open(path, 'r') as f:
+        jobs = json.load(f)
+    terms = []
+    for job in jobs:
+        for skill in job.get('requiredSkills', []):
+            terms.extend(terms_from_job_skill(skill))
+    return terms
+
+# Every live matcher, so their build locks can be reset in a forked child
+_matchers: "weakref.WeakSet[SkillMatcher]" = weakref.WeakSet()
+
+class SkillMatcher:
+    """Find known skills in free text with an Aho-Corasick automaton.
+
+    All terms are matched in a single pass over the text, so the cost depends
+    on the text length and the number of hits, not on the vocabulary size.
+    Matching is case-insensitive, only accepts whole words, and prefers the
+    longest skill where matches overlap ("Spring Boot" over "Spring").
+
+    Ambiguous skills, which are also common words or names ("Swift", "Rust",
+    "Julia"), only match with their exact capitalization and can be left out
+    of a scan with `include_ambiguous=False`.
+    """
+
+    def __init__(self, skills: Iterable[Tuple] = ()):
+        self._skills: List[Tuple[str, str]] = []  # (display name, category) per term
+        self._ambiguous: List[bool] = []  # per term
+        self._terms: Dict[str, int] = {}  # lowercased term -> index into _skills
+        self._built = False
+        self._lock = threading.Lock()
+        _matchers.add(self)
+        # (name, category) pairs or (name, category, ambiguous) triples
+        for name, category, *ambiguous in skills:
+            self.add(name, category, *ambiguous)
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def __contains__(self, name: str) -> bool:
+        return name.lower() in self._terms
+
+    def add(self, name: str, category: str = DEFAULT_CATEGORY, ambiguous: bool = False):
+        """Add a skill; the first spelling, category and ambiguity seen for a term win."""
+        term = name.strip().lower()
+        if not term or term in self._terms:
+            return
+        self._terms[term] = len(self._skills)
+        self._skills.append((name.strip(), category))
+        self._ambiguous.append(ambiguous)
+        self._built = False
+
+    def find(self, text: str, include_ambiguous: bool = True) -> List[Dict[str, str]]:
+        """Return each distinct skill found in the text, in order of first mention."""
+        skills = []
+        seen = set()
+        for _, _, index in self._scan(text, include_ambiguous):
+            if index not in seen:
+                seen.add(index)
+                name, category = self._skills[index]
+                skills.append({"name": name, "category": category})
+        return skills
+
+    def _build(self):
+        """Build the trie, failure links and dictionary-suffix links."""
+        goto: List[Dict[str, int]] = [{}]
+        output: List[int] = [-1]  # index of the term ending at each node, or -1
+        for term, index in self._terms.items():
+            node = 0
+            for char in term:
+                next_node = goto[node].get(char)
+                if next_node is None:
+                    next_node = len(goto)
+                    goto[node][char] = next_node
+                    goto.append({})
+                    output.append(-1)
+                node = next_node
+            output[node] = index
+
+        fail = [0] * len(goto)
+        # Nearest proper suffix node that ends a term, so outputs are reported
+        # without walking every failure link
+        dict_link = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fail_state = goto[state].get(char, 0)
+                fail[child] = fail_state if fail_state != child else 0
+                dict_link[child] = fail[child] if output[fail[child]] >= 0 else dict_link[fail[child]]
+                queue.append(child)
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+        self._dict_link = dict_link
+        self._lengths = [len(term) for term in self._terms]
+        self._built = True
+
+    def _scan(self, text: str, include_ambiguous: bool = True) -> List[Tuple[int, int, int]]:
+        """Return (start, end, skill index) for leftmost-longest whole-word matches."""
+        if not self._built:
+            with self._lock:
+                if not self._built:
+                    self._build()
+        goto, fail, output, dict_link, lengths = self._goto, self._fail, self._output, self._dict_link, self._lengths
+        skills, ambiguous = self._skills, self._ambiguous
+
+        lowered = text.lower()
+        size = len(lowered)
+        matches = []
+        node = 0
+        for position, char in enumerate(lowered):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+
+            hit = node if output[node] >= 0 else dict_link[node]
+            while hit:
+                index = output[hit]
+                end = position + 1
+                start = end - lengths[index]
+                # Whole words only: "Go" must not match inside "Google"
+                if (start == 0 or not lowered[start - 1].isalnum()) and (end == size or not lowered[end].isalnum()):
+                    # "swift delivery" is not Swift; ambiguous skills need their exact spelling
+                    if not ambiguous[index] or (include_ambiguous and text[start:end] == skills[index][0]):
+                        matches.append((start, end, index))
+                hit = dict_link[hit]
+
+        # Keep the longest match at each start and drop matches inside an earlier one
+        matches.sort(key=lambda match: (match[0], -match[1]))
+        selected = []
+        covered_until = 0
+        for start, end, index in matches:
+            if start >= covered_until:
+                selected.append((start, end, index))
+                covered_until = end
+        return selected
+
+def build_skill_matcher(jobs_path: Optional[str] = JOBS_PATH, vocabulary_path: Optional[str] = VOCABULARY_PATH) -> SkillMatcher:
+    """Build a matcher from the vocabulary file and the skills jobs ask for."""
+    matcher = SkillMatcher()
+    if vocabulary_path and os.path.exists(vocabulary_path):
+        for name, category, ambiguous in load_vocabulary(vocabulary_path):
+            matcher.add(name, category, ambiguous)
+    if jobs_path and os.path.exists(jobs_path):
+        for term in load_job_skills(jobs_path):
+            matcher.add(term)
+    return matcher
+
+_default_matcher: Optional[SkillMatcher] = None
+_default_lock = threading.Lock()
+
+def _reset_locks_after_fork():
+    # A fork taken while another thread was building a matcher would leave its
+    # lock held forever; the half-built matcher is still unbuilt, so the child rebuilds it
+    global _default_lock
+    _default_lock = threading.Lock()
+    for matcher in list(_matchers):
+        matcher._lock = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_locks_after_fork)
+
+def get_skill_matcher() -> SkillMatcher:
+    """Return the process-wide matcher over the bundled skill data, building it on first use."""
+    global _default_matcher
+    if _default_matcher is None:
+        with _default_lock:
+            if _default_matcher is None:
+                _default_matcher = build_skill_matcher()
+    return _default_matcher
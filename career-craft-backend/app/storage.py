@@ -0,0 +1,62 @@
+from contextlib import contextmanager
+from typing import Iterator
+import fcntl
+import os
+import shutil
+import tempfile
+
+@contextmanager
+def file_lock(path: str) -> Iterator[None]:
+    """Hold an exclusive lock on `path` (created if missing) for the block, across processes."""
+    with open(path, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+@contextmanager
+def atomic_directory(directory: str, prefix: str = ".staging-") -> Iterator[str]:
+    """Yield an empty staging directory that replaces `directory` when the block completes.
+
+    `directory` is a symlink to the current version, a sibling directory. The
+    staging directory becomes the next version and the link is swapped to it
+    by a single rename, so readers see one version or the other, never a
+    partial or missing one. Writers take turns under a lock file beside the
+    link. The version before the new one is kept, so a reader that resolved
+    the link just before the swap can finish loading; older ones are removed.
+    If the block raises, the staging directory is removed and `directory` is
+    left as it was.
+    """
+    parent, name = os.path.split(os.path.abspath(directory))
+    os.makedirs(parent, exist_ok=True)
+    # Resolved, so versions compare equal to the link's target
+    parent = os.path.realpath(parent)
+    directory = os.path.join(parent, name)
+    versions = f"{prefix}{name}-"
+    with file_lock(directory + ".lock"):
+        staging = tempfile.mkdtemp(dir=parent, prefix=versions)
+        link = staging + ".link"
+        try:
+            yield staging
+            previous = os.path.realpath(directory) if os.path.islink(directory) else None
+            if os.path.isdir(directory) and previous is None:
+                # Written before versions were linked: it becomes the previous version
+                previous = tempfile.mkdtemp(dir=parent, prefix=versions)
+                os.replace(directory, previous)
+            os.symlink(os.path.basename(staging), link)
+            os.replace(link, directory)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            if os.path.lexists(link):
+                os.unlink(link)
+            raise
+
+        for entry in os.listdir(parent):
+            path = os.path.join(parent, entry)
+            if not entry.startswith(versions) or path in (staging, previous):
+                continue
+            if os.path.islink(path):
+                os.unlink(path)
+            else:
+                shutil.rmtree(path, ignore_errors=True)
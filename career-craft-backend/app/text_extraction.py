@@ -0,0 +1,230 @@
+from abc import ABC, abstractmethod
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional, Tuple
+from xml.etree import ElementTree
+import importlib.util
+import io
+import json
+import zipfile
+
+# WordprocessingML namespace used by word/document.xml
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+class ExtractionBackend(ABC):
+    """A text extractor for one file type.
+
+    `open` parses a file once into a document that `count_pages` and
+    `extract_pages` both read, so counting pages does not cost a second parse.
+    Paged formats (PDF) implement `count_pages` and extract the page range
+    [start, end); other formats ignore the range.
+    """
+
+    name = ""
+    extension = ""
+    # Importable module the backend depends on, checked by `is_available`
+    module: Optional[str] = None
+
+    def is_available(self) -> bool:
+        return self.module is None or importlib.util.find_spec(self.module) is not None
+
+    def open(self, stream: BinaryIO) -> Any:
+        """Parse the file into the document the other methods read; by default the stream itself."""
+        return stream
+
+    def count_pages(self, document: Any) -> Optional[int]:
+        return None
+
+    @abstractmethod
+    def extract_pages(self, document: Any, start: int = 0, end: Optional[int] = None) -> str:
+        """Text of pages [start, end) of an opened document (all of it for unpaged formats)."""
+
+    def page_count(self, stream: BinaryIO) -> Optional[int]:
+        return self.count_pages(self.open(stream))
+
+    def extract(self, stream: BinaryIO, start: int = 0, end: Optional[int] = None) -> str:
+        return self.extract_pages(self.open(stream), start, end)
+
+class PyPDF2Backend(ExtractionBackend):
+    name = "pypdf2"
+    extension = ".pdf"
+    module = "PyPDF2"
+
+    def open(self, stream: BinaryIO):
+        import PyPDF2
+        return PyPDF2.PdfReader(stream)
+
+    def count_pages(self, document) -> int:
+        return len(document.pages)
+
+    def extract_pages(self, document, start: int = 0, end: Optional[int] = None) -> str:
+        pages = document.pages
+        end = len(pages) if end is None else min(end, len(pages))
+        return "".join(pages[i].extract_text() for i in range(start, end))
+
+class PypdfBackend(PyPDF2Backend):
+    """PyPDF2's maintained successor, with the same reader API."""
+
+    name = "pypdf"
+    module = "pypdf"
+
+    def open(self, stream: BinaryIO):
+        import pypdf
+        return pypdf.PdfReader(stream)
+
+class PdfminerBackend(ExtractionBackend):
+    """pdfminer.six layout analysis: slower, but keeps reading order on multi-column pages."""
+
+    name = "pdfminer"
+    extension = ".pdf"
+    module = "pdfminer"
+
+    def open(self, stream: BinaryIO) -> list:
+        from pdfminer.pdfpage import PDFPage
+        return list(PDFPage.get_pages(stream))
+
+    def count_pages(self, document: list) -> int:
+        return len(document)
+
+    def extract_pages(self, document: list, start: int = 0, end: Optional[int] = None) -> str:
+        # What pdfminer.high_level.extract_text does, over the already parsed pages
+        from pdfminer.converter import TextConverter
+        from pdfminer.layout import LAParams
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        output = io.StringIO()
+        resources = PDFResourceManager()
+        device = TextConverter(resources, output, laparams=LAParams())
+        interpreter = PDFPageInterpreter(resources, device)
+        for page in document[start:end]:
+            interpreter.process_page(page)
+        device.close()
+        return output.getvalue()
+
+class Docx2txtBackend(ExtractionBackend):
+    name = "docx2txt"
+    extension = ".docx"
+    module = "docx2txt"
+
+    def extract_pages(self, document: BinaryIO, start: int = 0, end: Optional[int] = None) -> str:
+        import docx2txt
+        return docx2txt.process(document)
+
+class DocxXmlBackend(ExtractionBackend):
+    """Stream word/document.xml straight out of the archive.
+
+    Only the main document part is decompressed, never media or other parts,
+    and elements are discarded as soon as they are read, so memory stays flat
+    however large the document is. Output matches docx2txt for the body text
+    (headers and footers are not read).
+    """
+
+    name = "docx_xml"
+    extension = ".docx"
+
+    def extract_pages(self, document: BinaryIO, start: int = 0, end: Optional[int] = None) -> str:
+        parts = []
+        with zipfile.ZipFile(document) as archive, archive.open("word/document.xml") as part:
+            for event, element in ElementTree.iterparse(part, events=("start", "end")):
+                tag = element.tag
+                if event == "start":
+                    if tag == _W + "p":
+                        parts.append("\n\n")
+                    elif tag == _W + "tab":
+                        parts.append("\t")
+                    elif tag in (_W + "br", _W + "cr"):
+                        parts.append("\n")
+                elif tag == _W + "t":
+                    parts.append(element.text or "")
+                elif tag == _W + "p":
+                    element.clear()
+        return "".join(parts).strip()
+
+# Registered backends by name, in default preference order per extension
+BACKENDS: Dict[str, ExtractionBackend] = {}
+
+def register_backend(backend: ExtractionBackend):
+    """Make a backend available to extraction policies by its name."""
+    BACKENDS[backend.name] = backend
+
+def get_backend(name: str) -> ExtractionBackend:
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown extraction backend: {name}")
+    return BACKENDS[name]
+
+def available_backends(extension: str) -> List[ExtractionBackend]:
+    """Installed backends for a file extension, in preference order."""
+    return [b for b in BACKENDS.values() if b.extension == extension and b.is_available()]
+
+for _backend in (PyPDF2Backend(), PypdfBackend(), PdfminerBackend(), DocxXmlBackend(), Docx2txtBackend()):
+    register_backend(_backend)
+
+# (max bytes, max pages, backend name); None means no limit
+Rule = Tuple[Optional[int], Optional[int], str]
+
+DEFAULT_RULES: Dict[str, List[Rule]] = {
+    ".pdf": [(None, None, "pypdf2"), (None, None, "pypdf")],
+    ".docx": [(None, None, "docx_xml"), (None, None, "docx2txt")]
+}
+
+class ExtractionPolicy:
+    """Pick the extraction backend for a file from its type, size and page count.
+
+    Rules are tried in order per extension; the first whose limits fit the file
+    and whose backend is installed wins. Files no rule covers fall back to the
+    first installed backend for the extension.
+    """
+
+    def __init__(self, rules: Optional[Dict[str, List[Rule]]] = None):
+        self.rules = DEFAULT_RULES if rules is None else rules
+
+    def choose(self, extension: str, size: int, page_count: Optional[int] = None) -> ExtractionBackend:
+        for max_bytes, max_pages, name in self.rules.get(extension, []):
+            if max_bytes is not None and size > max_bytes:
+                continue
+            if max_pages is not None and page_count is not None and page_count > max_pages:
+                continue
+            backend = BACKENDS.get(name)
+            if backend is not None and backend.is_available():
+                return backend
+
+        backends = available_backends(extension)
+        if not backends:
+            raise ValueError(f"No text extraction backend installed for {extension} files")
+        return backends[0]
+
+    @classmethod
+    def from_benchmark(cls, results: Iterable[dict], min_quality: float = 0.95) -> "ExtractionPolicy":
+        """Build rules from benchmark results (see benchmarks/bench_extraction.py).
+
+        For each sample file, in order of size, the fastest backend whose text
+        quality reached `min_quality` covers files up to that size and page
+        count; the rule for the largest sample has no upper limit.
+        """
+        samples: Dict[Tuple[str, str], List[dict]] = {}
+        for result in results:
+            samples.setdefault((result["extension"], result["sample"]), []).append(result)
+
+        winners: Dict[str, List[Tuple[int, int, str]]] = {}
+        for (extension, _), runs in samples.items():
+            acceptable = [r for r in runs if r["quality"] >= min_quality]
+            if not acceptable:
+                continue
+            fastest = max(acceptable, key=lambda r: r["bytes_per_second"])
+            winners.setdefault(extension, []).append((fastest["bytes"], fastest.get("pages") or 0, fastest["backend"]))
+
+        rules: Dict[str, List[Rule]] = {}
+        for extension, picks in winners.items():
+            picks.sort()
+            extension_rules = []
+            for size, pages, name in picks:
+                # Neighbouring samples won by the same backend share one rule
+                if extension_rules and extension_rules[-1][2] == name:
+                    extension_rules.pop()
+                extension_rules.append((size, pages or None, name))
+            extension_rules[-1] = (None, None, extension_rules[-1][2])
+            rules[extension] = extension_rules
+        return cls(rules)
+
+    @classmethod
+    def from_benchmark_file(cls, path: str, min_quality: float = 0.95) -> "ExtractionPolicy":
+        """Build rules from a JSON results file written by the benchmark harness."""
+        with open(path, 'r') as f:
+            return cls.from_benchmark(json.load(f), min_quality)
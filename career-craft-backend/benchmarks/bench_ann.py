@@ -0,0 +1,125 @@
+"""Benchmark approximate job search against exact scoring.
+
+IVFIndex alone: synthetic job vectors are clustered around random centres,
+as job families are in a real catalog. For each catalog size it reports
+training time, the exact top-10 query time, and recall@10 and query time per
+nprobe setting.
+
+SemanticJobIndex with an ANN index attached, end to end: synthetic postings
+draw most of their skills from one of a few hundred families. It reports
+recall@5 against exact tf-idf ranking (counting any job that scores at least
+the exact 5th score, since many jobs tie) and query times at the defaults.
+
+Run from the backend directory:
+    python -m benchmarks.bench_ann          # report
+    python -m benchmarks.bench_ann --check  # exit 1 if the default nprobe misses the recall target
+"""
+import sys
+import time
+
+import numpy as np
+
+import random
+
+from app.ann_index import IVFIndex, normalize_rows
+from app.job_recommender import top_k
+from app.semantic_index import SemanticJobIndex
+
+SIZES = (100_000, 500_000)
+DIMS = 128
+CLUSTERS = 2_000
+QUERIES = 200
+PROBES = (1, 4, 8, 16, 32, 64)
+# --check fails when recall at the default settings falls below this
+RECALL_TARGET = 0.85
+SEMANTIC_SIZES = (50_000, 200_000)
+SKILL_VOCABULARY = 3_000
+FAMILIES = 400
+
+
+def clustered(count, rng, centres):
+    points = centres[rng.integers(len(centres), size=count)] + 1.0 * rng.normal(size=(count, DIMS)).astype(np.float32)
+    return normalize_rows(points)
+
+
+def _timed(fn, queries):
+    results, times = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(set(fn(query)[0].tolist()))
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return results, times[len(times) // 2], times[min(len(times) - 1, int(len(times) * 0.99))]
+
+
+def posting_catalog(size, rng, families, vocabulary):
+    return [
+        {"title": f"Job {i}", "keyResponsibilities": [], "category": "Tech",
+         "requiredSkills": rng.sample(rng.choice(families), 6) + rng.sample(vocabulary, 2)}
+        for i in range(size)
+    ]
+
+
+def semantic(size, rng):
+    vocabulary = [f"skill{i}" for i in range(SKILL_VOCABULARY)]
+    families = [rng.sample(vocabulary, 15) for _ in range(FAMILIES)]
+    index = SemanticJobIndex.build(posting_catalog(size, rng, families, vocabulary))
+    start = time.perf_counter()
+    index.attach_ann()
+    attach_s = time.perf_counter() - start
+
+    recalls, exact_times, ann_times = [], [], []
+    for _ in range(QUERIES):
+        family = rng.choice(families)
+        queries = [("\n".join(rng.sample(family, 8) + rng.sample(vocabulary, 2)), 0.7),
+                   ("\n".join(rng.sample(family, 4)), 0.3)]
+        start = time.perf_counter()
+        scores = index.similarities(queries)
+        threshold = scores[top_k(scores, 5)[-1]]
+        exact_times.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        found = index.top(queries, k=5)
+        ann_times.append((time.perf_counter() - start) * 1000)
+        recalls.append(np.mean([score >= threshold - 1e-9 for _, score in found]))
+    print(f"{size:>8} {index.ann.nlist:>6} {attach_s:>9.1f} {np.mean(recalls):>9.3f} "
+          f"{np.median(exact_times):>10.3f} {np.median(ann_times):>8.3f} {np.percentile(ann_times, 99):>8.3f}")
+    return np.mean(recalls)
+
+
+def main(check=False):
+    rng = np.random.default_rng(42)
+    centres = rng.normal(size=(CLUSTERS, DIMS)).astype(np.float32)
+    worst_recall = 1.0
+    for size in SIZES:
+        vectors = clustered(size, rng, centres)
+        queries = clustered(QUERIES, rng, centres)
+        start = time.perf_counter()
+        index = IVFIndex.train(vectors)
+        index.add(vectors)
+        index.compact()
+        build_s = time.perf_counter() - start
+
+        exact, exact_p50, _ = _timed(lambda q: index.search_exact(q, k=10), queries)
+        print(f"{size} jobs, nlist {index.nlist}: build {build_s:.1f} s, exact p50 {exact_p50:.2f} ms")
+        print(f"{'nprobe':>8} {'recall@10':>10} {'p50 ms':>8} {'p99 ms':>8}")
+        for nprobe in PROBES:
+            found, p50, p99 = _timed(lambda q: index.search(q, k=10, nprobe=nprobe), queries)
+            recall = np.mean([len(got & want) / len(want) for got, want in zip(found, exact)])
+            if nprobe == index.nprobe:
+                worst_recall = min(worst_recall, recall)
+            print(f"{nprobe:>8} {recall:>10.3f} {p50:>8.3f} {p99:>8.3f}")
+
+    print(f"\nSemanticJobIndex, nprobe {index.nprobe}, {SemanticJobIndex.ann_candidates} candidates rescored")
+    print(f"{'jobs':>8} {'nlist':>6} {'attach s':>9} {'recall@5':>9} {'exact p50':>10} {'ann p50':>8} {'ann p99':>8}")
+    postings_rng = random.Random(42)
+    for size in SEMANTIC_SIZES:
+        worst_recall = min(worst_recall, semantic(size, postings_rng))
+
+    print(f"worst recall at the default settings: {worst_recall:.3f} (target {RECALL_TARGET})")
+    if check and worst_recall < RECALL_TARGET:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(check="--check" in sys.argv[1:]))
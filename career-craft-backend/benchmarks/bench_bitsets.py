@@ -0,0 +1,51 @@
+"""Benchmark ranking many resumes against one job: Python sets vs packed bitsets.
+
+The set path is the legacy approach: intersect each resume's set of skill
+strings with the job's. The bitset path interns skills to integer ids, packs
+each resume into uint64 words and counts overlaps with popcounts
+(JobRecommender.score_resumes). Packing is timed separately, since stored
+resumes would be packed once.
+
+Run from the backend directory:
+    python -m benchmarks.bench_bitsets
+"""
+import random
+import time
+
+from app.skill_bitset import SkillInterner, intersection_counts, pack, pack_many, words_for
+
+VOCABULARY_SIZE = 5_000
+JOB_SKILLS = 12
+SIZES = (1_000, 10_000, 100_000)
+
+
+def main():
+    rng = random.Random(42)
+    vocabulary = [f"skill {i}" for i in range(VOCABULARY_SIZE)]
+    interner = SkillInterner(vocabulary)
+    words = words_for(len(interner))
+    job = set(rng.sample(vocabulary, JOB_SKILLS))
+    job_bits = pack(interner.ids(job), words)
+
+    print(f"{'resumes':>8} {'sets ms':>9} {'pack ms':>9} {'popcount ms':>12}")
+    for size in SIZES:
+        resumes = [set(rng.sample(vocabulary, rng.randint(5, 30))) for _ in range(size)]
+
+        start = time.perf_counter()
+        expected = [len(resume & job) / len(job) for resume in resumes]
+        sets_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        resume_bits = pack_many((interner.ids(resume) for resume in resumes), words)
+        pack_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        got = intersection_counts(resume_bits, job_bits) / len(job)
+        popcount_ms = (time.perf_counter() - start) * 1000
+
+        assert got.tolist() == expected
+        print(f"{size:>8} {sets_ms:>9.2f} {pack_ms:>9.2f} {popcount_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
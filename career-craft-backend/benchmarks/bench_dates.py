@@ -0,0 +1,61 @@
+"""Micro-benchmark per-entry date extraction: DateScanner vs the legacy three-pattern scan.
+
+Run from the backend directory:
+    python -m benchmarks.bench_dates
+"""
+import re
+import timeit
+from datetime import datetime
+
+from dateutil import parser as date_parser
+
+from app.date_scanner import DateScanner
+
+LEGACY_PATTERNS = [
+    r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|'
+    r'Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|'
+    r'Dec(?:ember)?)[,\s]+\d{4}',
+    r'\d{1,2}/\d{4}',
+    r'\d{4}'
+]
+
+
+def legacy_extract_dates(text):
+    """The original ResumeParser._extract_dates, kept for comparison."""
+    dates = []
+    for pattern in LEGACY_PATTERNS:
+        for match in re.finditer(pattern, text):
+            try:
+                dates.append(date_parser.parse(match.group()))
+            except Exception:
+                continue
+    dates.sort()
+    if not dates:
+        return {'start_date': datetime.now().replace(month=1, day=1), 'end_date': None}
+    return {'start_date': dates[0], 'end_date': dates[-1] if len(dates) > 1 else None}
+
+
+def make_entries(count):
+    """Experience entries in the shapes PDF extraction typically produces."""
+    shapes = [
+        "Acme Corp\nSenior Engineer\nJan 2019 - Mar 2022\n- Cut p99 latency by 40% across 1200 hosts",
+        "Globex Inc.\nData Analyst\n06/2016 - 12/2018\n- Built 2500 dashboards for 3000 users",
+        "Initech\nIntern\nSummer 2015\n- Migrated 4000 records; phone (555) 123-4567",
+        "Umbrella Ltd\nResearcher\nSeptember 2012 - August 2014\n- Published 3 papers",
+    ]
+    return [shapes[i % len(shapes)] for i in range(count)]
+
+
+def main():
+    scanner = DateScanner()
+    entries = make_entries(40)  # an experience-heavy resume
+    runs = 50
+    legacy = timeit.timeit(lambda: [legacy_extract_dates(e) for e in entries], number=runs)
+    fast = timeit.timeit(lambda: [scanner.extract(e) for e in entries], number=runs)
+    per_entry = runs * len(entries)
+    print(f"legacy:  {legacy / per_entry * 1e6:8.1f} us/entry")
+    print(f"scanner: {fast / per_entry * 1e6:8.1f} us/entry  ({legacy / fast:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
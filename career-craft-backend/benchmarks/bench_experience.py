@@ -0,0 +1,85 @@
+"""Adversarial benchmark for splitting experience sections into entries.
+
+Compares the line-based ExperienceSplitter with the legacy lookahead split on
+inputs that make the legacy regex rescan the rest of the section at every
+newline. Each input is timed at doubling sizes; a linear splitter roughly
+doubles its time per step, a quadratic one roughly quadruples it.
+
+Run from the backend directory:
+    python -m benchmarks.bench_experience          # report
+    python -m benchmarks.bench_experience --check  # exit 1 if the splitter scales superlinearly
+"""
+import re
+import sys
+import timeit
+
+from app.resume_parser import ExperienceSplitter
+
+EXPERIENCE_PATTERN = r'experience|employment|work history|work experience'
+LEGACY_PATTERN = re.compile(r'\n(?=[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s*(?:Ltd\.?|Inc\.?|Corp\.?)?)')
+
+# --check fails when time grows more than this many times faster than input
+# size between the smallest and largest run (linear ~1, quadratic ~8)
+MAX_SUPERLINEAR = 2.0
+
+
+def legacy_split(section):
+    """The original extract_experience split, kept for comparison."""
+    return LEGACY_PATTERN.split(section)
+
+
+def capitalized_lines(size):
+    """One capitalized name per line: each lookahead runs through every later line."""
+    return "Work Experience" + "\nAcme Corp" * size
+
+
+def capitalized_runs(size):
+    """Long runs of capitalized words broken by occasional newlines, as PDF extraction produces."""
+    run = " ".join(["Senior Software Engineer Acme"] * 10)
+    return "Work Experience" + f"\n{run}" * (size // 10)
+
+
+def spaced_names(size):
+    """Capitalized words separated by blank lines and indentation."""
+    return "Work Experience" + "\n\n  Globex Inc.\n" * size
+
+
+def realistic(size):
+    """Well-formed entries, as a baseline."""
+    entry = "\nAcme Corp\nSoftware Engineer\nJan 2019 - Mar 2022\n- Built billing services\n- Cut latency by 40%"
+    return "Work Experience" + entry * (size // 5)
+
+
+INPUTS = [capitalized_lines, capitalized_runs, spaced_names, realistic]
+SIZES = (500, 1000, 2000, 4000)
+
+
+def _time(fn, text):
+    return min(timeit.repeat(lambda: fn(text), number=1, repeat=5))
+
+
+def main(check=False):
+    splitter = ExperienceSplitter(EXPERIENCE_PATTERN)
+    worst = 0.0
+    print(f"{'input':>18} {'lines':>6} {'chars':>8} {'legacy ms':>10} {'splitter ms':>12} {'growth':>7}")
+    for make in INPUTS:
+        previous = first = None
+        for size in SIZES:
+            text = make(size)
+            legacy = _time(legacy_split, text)
+            split = _time(splitter.split, text)
+            growth = f"{split / previous:.1f}x" if previous else "-"
+            previous = split
+            first = first or split
+            print(f"{make.__name__:>18} {text.count(chr(10)):>6} {len(text):>8} "
+                  f"{legacy * 1000:>10.2f} {split * 1000:>12.3f} {growth:>7}")
+        worst = max(worst, (previous / first) / (SIZES[-1] / SIZES[0]))
+
+    print(f"worst splitter time growth relative to input growth: {worst:.2f} (limit {MAX_SUPERLINEAR:.1f})")
+    if check and worst > MAX_SUPERLINEAR:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(check="--check" in sys.argv[1:]))
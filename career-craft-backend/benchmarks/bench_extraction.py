@@ -0,0 +1,183 @@
+"""Benchmark harness for PDF/DOCX text extraction backends.
+
+Records throughput and text quality (token F1 against the known text) for
+every installed backend on a synthetic corpus of resumes of growing size,
+and prints the extraction policy those results produce.
+
+Run from the backend directory:
+    python -m benchmarks.bench_extraction
+    python -m benchmarks.bench_extraction --dir samples/ --json results.json
+
+Files passed with --dir need a sidecar .txt with the expected text
+(resume.pdf -> resume.txt). Results written with --json can be loaded with
+ExtractionPolicy.from_benchmark_file, e.g. via EXTRACTION_BENCHMARK_FILE.
+"""
+import argparse
+import io
+import json
+import os
+import time
+import zipfile
+from collections import Counter
+
+from app.text_extraction import ExtractionPolicy, available_backends
+
+RESUME_LINES = [
+    "Jane Doe jane@example.com 555 123 4567",
+    "Work Experience",
+    "Acme Corp Senior Software Engineer Jan 2019 - Mar 2022",
+    "- Built billing services in Python and PostgreSQL",
+    "- Cut p99 latency by 40 percent across 1200 hosts",
+    "Education",
+    "Bachelor of Science in Computer Science State University GPA 3.80",
+    "Skills",
+    "Python, SQL, Docker, Kubernetes, AWS, Leadership",
+]
+
+
+def build_pdf(pages):
+    """Build a PDF with several lines of text per page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for lines in pages:
+        shown = " T* ".join(f"({line}) Tj" for line in lines)
+        stream = f"BT /F1 10 Tf 12 TL 50 750 Td {shown} ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        content_id = len(objects)
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{i} 0 R" for i in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF".encode()
+    return out
+
+
+def build_docx(paragraphs, media_bytes=0):
+    """Build a DOCX with one paragraph per line and an optional media part of `media_bytes`."""
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", '<?xml version="1.0"?><Types/>')
+        archive.writestr("word/document.xml", document)
+        if media_bytes:
+            archive.writestr("word/media/image1.png", os.urandom(media_bytes), zipfile.ZIP_STORED)
+    return buffer.getvalue()
+
+
+def synthetic_corpus():
+    """(sample name, extension, bytes, pages, expected text) for generated resumes."""
+    corpus = []
+    for pages in (1, 4, 16, 64):
+        page_lines = [RESUME_LINES] * pages
+        corpus.append((f"pdf-{pages}p", ".pdf", build_pdf(page_lines), pages, " ".join(RESUME_LINES * pages)))
+    for repeats, media in ((1, 0), (8, 0), (64, 0), (8, 4 << 20)):
+        name = f"docx-{repeats}x" + (f"-{media >> 20}mb-media" if media else "")
+        lines = RESUME_LINES * repeats
+        corpus.append((name, ".docx", build_docx(lines, media), None, " ".join(lines)))
+    return corpus
+
+
+def directory_corpus(path):
+    """Samples from a directory of .pdf/.docx files with .txt ground truth beside them."""
+    corpus = []
+    for entry in sorted(os.listdir(path)):
+        stem, extension = os.path.splitext(entry)
+        truth = os.path.join(path, stem + ".txt")
+        if extension not in (".pdf", ".docx"):
+            continue
+        if not os.path.exists(truth):
+            print(f"skipping {entry}: no {stem}.txt with the expected text")
+            continue
+        with open(os.path.join(path, entry), "rb") as f:
+            data = f.read()
+        with open(truth, "r") as f:
+            expected = f.read()
+        pages = None
+        if extension == ".pdf":
+            pages = available_backends(".pdf")[0].page_count(io.BytesIO(data))
+        corpus.append((entry, extension, data, pages, expected))
+    return corpus
+
+
+def token_f1(extracted, expected):
+    """Token-level F1 between extracted and expected text (order-insensitive)."""
+    got = Counter(extracted.lower().split())
+    want = Counter(expected.lower().split())
+    overlap = sum((got & want).values())
+    if not overlap:
+        return 0.0
+    precision = overlap / sum(got.values())
+    recall = overlap / sum(want.values())
+    return 2 * precision * recall / (precision + recall)
+
+
+def run(corpus, repeat=3):
+    results = []
+    for sample, extension, data, pages, expected in corpus:
+        for backend in available_backends(extension):
+            best = float("inf")
+            text = ""
+            for _ in range(repeat):
+                start = time.perf_counter()
+                text = backend.extract(io.BytesIO(data), 0, pages)
+                best = min(best, time.perf_counter() - start)
+            results.append({
+                "sample": sample,
+                "extension": extension,
+                "backend": backend.name,
+                "bytes": len(data),
+                "pages": pages,
+                "seconds": best,
+                "bytes_per_second": len(data) / best,
+                "quality": round(token_f1(text, expected), 4),
+            })
+    return results
+
+
+def main():
+    args = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    args.add_argument("--dir", help="directory of sample files with .txt ground truth")
+    args.add_argument("--json", help="write results to this file")
+    args.add_argument("--min-quality", type=float, default=0.95)
+    options = args.parse_args()
+
+    corpus = directory_corpus(options.dir) if options.dir else synthetic_corpus()
+    results = run(corpus)
+
+    print(f"{'sample':>22} {'backend':>9} {'KB':>8} {'pages':>5} {'ms':>9} {'MB/s':>7} {'quality':>7}")
+    for r in results:
+        print(f"{r['sample']:>22} {r['backend']:>9} {r['bytes'] / 1024:>8.1f} {r['pages'] or '-':>5} "
+              f"{r['seconds'] * 1000:>9.2f} {r['bytes_per_second'] / 1e6:>7.1f} {r['quality']:>7.3f}")
+
+    policy = ExtractionPolicy.from_benchmark(results, options.min_quality)
+    print("\npolicy rules (max bytes, max pages, backend):")
+    for extension, rules in policy.rules.items():
+        for rule in rules:
+            print(f"  {extension}: {rule}")
+
+    if options.json:
+        with open(options.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Measure cold start and per-worker memory with the shared NLP model registry.
+
+Compares forked workers that each load en_core_web_sm themselves against
+workers forked from a master that called nlp_registry.preload(). Linux only
+(reads /proc/<pid>/smaps_rollup); needs en_core_web_sm installed.
+
+Run from the backend directory:
+    python -m benchmarks.bench_nlp_registry
+"""
+import os
+import time
+
+WORKERS = 4
+
+
+def proportional_rss_mb():
+    """Proportional set size: shared pages are split across the processes using them."""
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def run_workers(preloaded):
+    from app import nlp_registry
+    from app.resume_parser import ResumeParser
+
+    if preloaded:
+        nlp_registry.preload()
+
+    pipes = []
+    for _ in range(WORKERS):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            started = time.perf_counter()
+            parser = ResumeParser()
+            parser.nlp("Jane Doe is a software engineer based in Seattle.")
+            ready = time.perf_counter() - started
+            os.write(write_fd, f"{ready:.4f} {proportional_rss_mb():.1f}".encode())
+            time.sleep(1)  # keep siblings alive while they measure
+            os._exit(0)
+        os.close(write_fd)
+        pipes.append((pid, read_fd))
+
+    results = []
+    for pid, read_fd in pipes:
+        results.append(tuple(float(v) for v in os.read(read_fd, 64).split()))
+        os.waitpid(pid, 0)
+    return results
+
+
+def main():
+    for preloaded in (False, True):
+        pid = os.fork()
+        if pid == 0:
+            results = run_workers(preloaded)
+            ready = sum(r[0] for r in results) / len(results)
+            pss = sum(r[1] for r in results) / len(results)
+            label = "preloaded master" if preloaded else "load per worker "
+            print(f"{label}: first parse ready in {ready * 1000:7.1f} ms, worker PSS {pss:6.1f} MB")
+            os._exit(0)
+        os.waitpid(pid, 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark job recommendation scoring as the catalog grows.
+
+Compares three paths on synthetic catalogs built by sampling skills from a
+vocabulary:
+    legacy  - the original per-job Python loop and full sort (smaller catalogs only)
+    brute   - the compiled matrix, but scoring every job (dense query, row-major)
+    indexed - JobRecommender, which reads only the query skills' posting lists
+and times incremental add_job/remove_job on each catalog.
+
+Run from the backend directory:
+    python -m benchmarks.bench_recommendations          # report
+    python -m benchmarks.bench_recommendations --check  # exit 1 if p99 at the largest size is over budget
+"""
+import random
+import sys
+import time
+
+from app.job_recommender import JobRecommender, top_k
+
+SIZES = (50, 1_000, 10_000, 100_000, 300_000)
+# Catalog sizes the legacy loop is still timed on
+LEGACY_MAX = 10_000
+VOCABULARY_SIZE = 5_000
+SKILLS_PER_JOB = (4, 12)
+QUERIES = 50
+# --check fails when the p99 query time at the largest size exceeds this
+BUDGET_MS = 10.0
+
+
+def synthetic_catalog(size, rng):
+    vocabulary = [f"skill {i}" for i in range(VOCABULARY_SIZE)]
+    return [
+        {"title": f"Job {i}", "keyResponsibilities": [], "category": "Tech",
+         "requiredSkills": rng.sample(vocabulary, rng.randint(*SKILLS_PER_JOB))}
+        for i in range(size)
+    ]
+
+
+def queries(rng):
+    return [
+        ({f"skill {rng.randrange(VOCABULARY_SIZE)}" for _ in range(rng.randint(5, 30))},
+         {f"skill {rng.randrange(VOCABULARY_SIZE)}" for _ in range(rng.randint(3, 15))})
+        for _ in range(QUERIES)
+    ]
+
+
+def legacy_top(jobs, resume_skills, target_skills, k=5):
+    """The original _get_job_recommendations scoring, kept for comparison."""
+    job_scores = []
+    for job in jobs:
+        job_skills = set(skill.lower() for skill in job["requiredSkills"])
+        skill_match = len(resume_skills.intersection(job_skills)) / len(job_skills) if job_skills else 0
+        target_match = len(target_skills.intersection(job_skills)) / len(target_skills) if target_skills else 0
+        job_scores.append((job, (skill_match * 0.7) + (target_match * 0.3)))
+    job_scores.sort(key=lambda x: x[1], reverse=True)
+    return job_scores[:k]
+
+
+def brute_force(recommender):
+    """Score every job through the same matrix, without pruning to posting lists."""
+    by_row = recommender.matrix.tocsr()
+
+    def top(resume_skills, target_skills, k=5):
+        ids = recommender.vocabulary.ids
+        query = recommender._query(ids(resume_skills), ids(target_skills), len(set(target_skills))).toarray().ravel()
+        scores = by_row @ query
+        return [(recommender.jobs[i], float(scores[i])) for i in top_k(scores, k)]
+    return top
+
+
+def _update_ms(recommender, rng, count=200):
+    """Mean milliseconds per add_job followed by remove_job."""
+    new_jobs = synthetic_catalog(count, rng)
+    start = time.perf_counter()
+    for job in new_jobs:
+        recommender.remove_job(recommender.add_job(job))
+    return (time.perf_counter() - start) * 1000 / count
+
+
+def _percentiles(fn, workload):
+    times = []
+    for resume_skills, target_skills in workload:
+        start = time.perf_counter()
+        fn(resume_skills, target_skills)
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return times[len(times) // 2], times[min(len(times) - 1, int(len(times) * 0.99))]
+
+
+def main(check=False):
+    rng = random.Random(42)
+    workload = queries(rng)
+    worst_p99 = 0.0
+    print(f"{'jobs':>8} {'compile ms':>11} {'legacy p50':>11} {'brute p50':>10} {'indexed p50':>12} "
+          f"{'indexed p99':>12} {'update ms':>10}")
+    for size in SIZES:
+        jobs = synthetic_catalog(size, rng)
+        start = time.perf_counter()
+        recommender = JobRecommender(jobs)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        legacy = "-"
+        if size <= LEGACY_MAX:
+            legacy = f"{_percentiles(lambda r, t: legacy_top(jobs, r, t), workload[:10])[0]:.2f}"
+        brute = _percentiles(brute_force(recommender), workload)[0]
+        p50, p99 = _percentiles(recommender.top, workload)
+        update = _update_ms(recommender, rng)
+        worst_p99 = p99
+        print(f"{size:>8} {compile_ms:>11.1f} {legacy:>11} {brute:>10.3f} {p50:>12.3f} {p99:>12.3f} {update:>10.3f}")
+
+    print(f"p99 at {SIZES[-1]} jobs: {worst_p99:.2f} ms (budget {BUDGET_MS:.0f} ms)")
+    if check and worst_p99 > BUDGET_MS:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(check="--check" in sys.argv[1:]))
@@ -0,0 +1,82 @@
+"""Benchmark the single-pass section segmenter against the legacy per-section scans.
+
+Run from the backend directory:
+    python -m benchmarks.bench_sections
+"""
+import re
+import timeit
+
+from app.resume_parser import SectionSegmenter
+
+SECTIONS = {
+    'education': r'education|academic|qualification',
+    'experience': r'experience|employment|work history|work experience',
+    'skills': r'skills|technical skills|competencies',
+    'projects': r'projects|personal projects',
+    'achievements': r'achievements|accomplishments|honors'
+}
+
+
+def legacy_extract_section(text, section_pattern):
+    """The original ResumeParser._extract_section, kept for comparison."""
+    pattern = re.compile(section_pattern, re.IGNORECASE)
+    matches = list(pattern.finditer(text))
+
+    if not matches:
+        return None
+
+    start_idx = matches[0].start()
+
+    next_section_start = len(text)
+    for section_pattern in SECTIONS.values():
+        pattern = re.compile(section_pattern, re.IGNORECASE)
+        matches = list(pattern.finditer(text[start_idx + 1:]))
+        if matches:
+            next_start = start_idx + 1 + matches[0].start()
+            next_section_start = min(next_section_start, next_start)
+
+    return text[start_idx:next_section_start].strip()
+
+
+def legacy_parse(text):
+    return {
+        name: legacy_extract_section(text, SECTIONS[name])
+        for name in ('education', 'experience', 'skills')
+    }
+
+
+def make_resume(entries):
+    """Build a long, academic-portfolio style resume with `entries` jobs and papers."""
+    lines = ["Jane Doe", "jane@example.com", "", "Education"]
+    lines += [f"PhD in Physics, University {i}, 20{i % 100:02d}" for i in range(entries // 10 + 1)]
+    lines.append("Work History")
+    for i in range(entries):
+        lines += [
+            f"Company {i} Inc.",
+            "Research Engineer",
+            "Jan 2015 - Mar 2018",
+            "- Built data pipelines and mentored junior researchers",
+            "- Published results in peer reviewed venues",
+        ]
+    lines.append("Skills")
+    lines += ["Python, C++, Statistics, Leadership"] * (entries // 5 + 1)
+    lines.append("Personal Projects")
+    lines += [f"Project {i}: simulation toolkit" for i in range(entries // 5 + 1)]
+    lines.append("Honors")
+    lines += [f"Award {i}" for i in range(entries // 10 + 1)]
+    return "\n".join(lines)
+
+
+def main():
+    segmenter = SectionSegmenter(SECTIONS)
+    print(f"{'entries':>8} {'chars':>9} {'legacy ms':>10} {'single-pass ms':>15} {'speedup':>8}")
+    for entries in (10, 100, 1000, 5000):
+        text = make_resume(entries)
+        runs = max(3, 2000 // entries)
+        legacy = timeit.timeit(lambda: legacy_parse(text), number=runs) / runs
+        single = timeit.timeit(lambda: segmenter.segment(text), number=runs) / runs
+        print(f"{entries:>8} {len(text):>9} {legacy * 1000:>10.3f} {single * 1000:>15.3f} {legacy / single:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
-from fastapi import FastAPI, File, UploadFile, Depends, HTTPException, status, Form, Body
+from fastapi import FastAPI, File, UploadFile, Depends, HTTPException, status, Form, Body, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, PlainTextResponse
 from sqlalchemy.orm import Session
 from typing import List
 import tempfile
@@ -14,11 +14,18 @@ from app.models import Base  # Add this import
 from app import models  # Add this import
 from app.schemas import (
     UserCreate, User, Resume, ResumeCreate, ResumeFeedback,
-    JobRecommendation
+    JobRecommendation, ParseJob
 )
-from app.resume_parser import ResumeParser
+from app.parse_cache import ParseCache
+from app.text_extraction import ExtractionPolicy
+from app.metrics import REGISTRY, ParseTimings
+from app.job_queue import ParseJobQueue, JOB_PENDING, JOB_FAILED
 from app.resume_generator import ResumeGenerator
 from app.resume_analyzer import ResumeAnalyzer
+from app.llm_cache import LLMResponseCache
+from app.semantic_index import SEMANTIC_INDEX_DIR, load_or_build_semantic_index
+from app.llm_gateway import CircuitBreaker, FakeProvider, LLMGateway, OpenAIProvider
+from openai import AsyncOpenAI
 from app.utils import get_current_user
 
 # Initialize Firebase Admin - Update the path to your service account key
@@ -42,10 +49,121 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Parsing only needs NER and sentence boundaries
+NLP_PARSE_PROFILE = os.getenv("NLP_PARSE_PROFILE", "ner_sentencizer")
+
+# Text extraction backends are picked per file; results from
+# benchmarks/bench_extraction.py --json can tune the choice
+EXTRACTION_BENCHMARK_FILE = os.getenv("EXTRACTION_BENCHMARK_FILE")
+extraction_policy = (
+    ExtractionPolicy.from_benchmark_file(EXTRACTION_BENCHMARK_FILE)
+    if EXTRACTION_BENCHMARK_FILE else ExtractionPolicy()
+)
+
 # Initialize components
-resume_parser = ResumeParser()
+parse_cache = ParseCache(
+    max_entries=int(os.getenv("PARSE_CACHE_SIZE", "256")),
+    cache_dir=os.getenv("PARSE_CACHE_DIR") or None
+)
 resume_generator = ResumeGenerator()
-resume_analyzer = ResumeAnalyzer()
+
+# LLM calls: per-call deadline, a hedged second attempt for slow responses, and a
+# circuit breaker that makes the analyzer fall back at once while OpenAI is failing.
+# LLM_PROVIDER=fake answers locally with canned responses (offline development).
+llm_provider = (
+    FakeProvider() if os.getenv("LLM_PROVIDER", "openai") == "fake"
+    else OpenAIProvider(AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY")), os.getenv("OPENAI_MODEL", "gpt-3.5-turbo"))
+)
+llm_gateway = LLMGateway(
+    llm_provider,
+    timeout=float(os.getenv("LLM_TIMEOUT_SECONDS", "30")),
+    hedge_after=float(os.getenv("LLM_HEDGE_AFTER_SECONDS", "10")) or None,
+    max_attempts=int(os.getenv("LLM_MAX_ATTEMPTS", "2")),
+    # Provider calls in flight at once; size to the account's rate limit.
+    # Identical concurrent requests share one call regardless.
+    max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "16")) or None,
+    breaker=CircuitBreaker(
+        failure_threshold=int(os.getenv("LLM_BREAKER_FAILURES", "5")),
+        reset_timeout=float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30"))
+    ),
+    # Repeat analyses of the same resume and job description skip the provider.
+    # LLM_CACHE_DB persists responses in SQLite across restarts and workers.
+    cache=LLMResponseCache(
+        max_entries=int(os.getenv("LLM_CACHE_SIZE", "1024")),
+        ttl_seconds=float(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600))) or None,
+        db_path=os.getenv("LLM_CACHE_DB") or None,
+        max_disk_bytes=int(os.getenv("LLM_CACHE_MAX_DISK_MB", "64")) << 20
+    ) if os.getenv("LLM_CACHE", "1").lower() not in ("0", "false") else None
+)
+
+# TF-IDF job matching, so "python" matches "Programming (e.g., Python, Java)".
+# The index is built once and memory-mapped from SEMANTIC_INDEX_DIR by every worker;
+# SEMANTIC_MATCHING=0 falls back to exact skill matching. Catalogs of at least
+# SEMANTIC_ANN_MIN_JOBS jobs are searched approximately: SEMANTIC_ANN_PROBES
+# partitions per query, the best SEMANTIC_ANN_CANDIDATES of them rescored exactly
+# (more of either: better recall, slower queries).
+semantic_index = None
+if os.getenv("SEMANTIC_MATCHING", "1").lower() not in ("0", "false"):
+    semantic_index = load_or_build_semantic_index(
+        os.getenv("SEMANTIC_INDEX_DIR", SEMANTIC_INDEX_DIR),
+        ann_min_jobs=int(os.getenv("SEMANTIC_ANN_MIN_JOBS", "200000")) or None,
+        ann_nprobe=int(os.getenv("SEMANTIC_ANN_PROBES", "16")),
+        ann_candidates=int(os.getenv("SEMANTIC_ANN_CANDIDATES", "512"))
+    )
+resume_analyzer = ResumeAnalyzer(gateway=llm_gateway, semantic_index=semantic_index)
+
+# Clients allowed to scrape /metrics (local Prometheus or curl by default)
+METRICS_ALLOWED_HOSTS = set(os.getenv("METRICS_ALLOWED_HOSTS", "127.0.0.1,::1,localhost").split(","))
+
+# Bulk upload settings
+MAX_BULK_UPLOAD_FILES = int(os.getenv("MAX_BULK_UPLOAD_FILES", "500"))
+
+def _persist_parsed_resume(db: Session, job: models.ParseJob, resume_data: ResumeCreate) -> models.Resume:
+    """Save a resume parsed by the background queue for the job's owner."""
+    db_resume = _build_parsed_resume(resume_data, job.user_id, job.job_description)
+    db.add(db_resume)
+    return db_resume
+
+# Upload parsing runs in sandboxed worker processes so it never blocks the event loop
+parse_queue = ParseJobQueue(
+    persist=_persist_parsed_resume,
+    max_workers=int(os.getenv("PARSE_WORKERS", "0")) or None,
+    parser_kwargs={
+        "max_pdf_pages": int(os.getenv("PDF_MAX_PAGES", "100")),
+        "nlp_profile": NLP_PARSE_PROFILE,
+        "extraction_policy": extraction_policy
+    },
+    cache=parse_cache,
+    # Load the pipeline once in the parse workers' fork server, so the workers
+    # share its pages copy-on-write instead of each loading a copy
+    preload_nlp=os.getenv("NLP_PRELOAD", "").lower() in ("1", "true"),
+    # Bounds on each parse, so a crafted or corrupt file fails fast on its own
+    sandbox_limits={
+        "cpu_seconds": float(os.getenv("PARSE_CPU_SECONDS", "30")),
+        "max_job_rss_mb": int(os.getenv("PARSE_MAX_JOB_RSS_MB", "512")),
+        "wall_seconds": float(os.getenv("PARSE_WALL_SECONDS", "60")),
+        "max_jobs_per_worker": int(os.getenv("PARSE_WORKER_MAX_JOBS", "100"))
+    },
+    # Pending jobs from other hosts are presumed lost after this long
+    stale_after_seconds=float(os.getenv("PARSE_STALE_SECONDS", "3600"))
+)
+
+@app.on_event("startup")
+def start_components():
+    """Fail parse jobs left pending by processes that are gone."""
+    parse_queue.recover()
+
+@app.on_event("shutdown")
+def shutdown_components():
+    """Release worker pools held by long-lived components."""
+    parse_queue.shutdown()
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics(request: Request):
+    """Parse stage histograms in the Prometheus text format."""
+    if request.client is None or request.client.host not in METRICS_ALLOWED_HOSTS:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Metrics are only served locally")
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4")
 
 @app.post("/api/users", response_model=User)
 async def create_user(user: UserCreate, db: Session = Depends(get_db)):
@@ -69,112 +187,216 @@ async def create_user(user: UserCreate, db: Session = Depends(get_db)):
             detail="Invalid Firebase token"
         )
 
-@app.post("/api/resumes/upload", response_model=Resume)
+ALLOWED_UPLOAD_TYPES = {
+    "application/pdf": ".pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx"
+}
+
+def _upload_filename(file: UploadFile) -> str:
+    """Name an upload, making sure its extension matches the declared content type."""
+    file_extension = ALLOWED_UPLOAD_TYPES[file.content_type]
+    name = os.path.basename(file.filename or "upload")
+    if not name.lower().endswith(file_extension):
+        name += file_extension
+    return name
+
+def _build_parsed_resume(resume_data: ResumeCreate, user_id: int, job_description: str) -> models.Resume:
+    """Build the database models for a parsed resume."""
+    return models.Resume(
+        user_id=user_id,
+        title=resume_data.title or "Uploaded Resume",
+        summary=resume_data.summary,
+        contact_info=resume_data.contact_info,
+        target_job_description=job_description,
+        education=[
+            models.Education(
+                institution=edu.institution,
+                degree=edu.degree,
+                field_of_study=edu.field_of_study,
+                start_date=edu.start_date,
+                end_date=edu.end_date,
+                gpa=edu.gpa
+            ) for edu in resume_data.education or []
+        ],
+        experience=[
+            models.Experience(
+                company=exp.company,
+                position=exp.position,
+                start_date=exp.start_date,
+                end_date=exp.end_date,
+                description=exp.description,
+                highlights=exp.highlights
+            ) for exp in resume_data.experience or []
+        ],
+        skills=[
+            models.Skill(
+                name=skill.name,
+                category=skill.category,
+                proficiency_level=skill.proficiency_level
+            ) for skill in resume_data.skills or []
+        ],
+        projects=[
+            models.Project(
+                title=proj.title,
+                description=proj.description,
+                technologies=proj.technologies or [],
+                url=proj.url,
+                start_date=proj.start_date,
+                end_date=proj.end_date
+            ) for proj in resume_data.projects or []
+        ],
+        achievements=[
+            models.Achievement(
+                title=ach.title,
+                description=ach.description,
+                date=ach.date
+            ) for ach in resume_data.achievements or []
+        ],
+        resume_type="Parsed Resume",
+        updated_at=datetime.now()
+    )
+
+
+@app.post("/api/resumes/upload", response_model=ParseJob, status_code=status.HTTP_202_ACCEPTED)
 async def upload_resume(
     file: UploadFile = File(...),
     job_description: str = Form(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Upload and parse a resume file."""
+    """Upload a resume file and queue it for parsing.
+
+    Returns a parse job; poll /api/resumes/upload/jobs/{job_id} until it completes.
+    """
     if not job_description:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Job description is required"
         )
 
-    allowed_types = {
-        "application/pdf": ".pdf",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx"
-    }
-
-    if file.content_type not in allowed_types:
+    if file.content_type not in ALLOWED_UPLOAD_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only PDF and DOCX files are supported"
         )
 
     try:
-        # Create temp directory if it doesn't exist
-        os.makedirs("temp", exist_ok=True)
+        # The upload is handed to the parse worker as bytes; nothing is written to disk
+        filename = _upload_filename(file)
+        timings = ParseTimings(os.path.splitext(filename)[1].lower())
+        with timings.stage("read_upload"):
+            content = await file.read()
+        timings.size = len(content)
+        timings.record()
+        return parse_queue.submit(db, current_user.id, content, filename, job_description)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(e)
+        )
 
-        # Save uploaded file with correct extension
-        file_extension = allowed_types[file.content_type]
-        temp_path = f"temp/upload_{datetime.now().timestamp()}{file_extension}"
+@app.get("/api/resumes/upload/jobs/{job_id}", response_model=ParseJob)
+async def get_parse_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the status of a resume parse job."""
+    job = parse_queue.get(db, job_id, current_user.id)
 
-        with open(temp_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Parse job not found"
+        )
 
-        # Parse resume
-        resume_data = resume_parser.parse_resume(temp_path)
+    return job
 
-        # Create a new Resume object
-        db_resume = models.Resume(
-            user_id=current_user.id,
-            title=resume_data.title or "Uploaded Resume",
-            summary=resume_data.summary,
-            contact_info=resume_data.contact_info,
-            target_job_description=job_description,
-            education=[
-                models.Education(
-                    institution=edu.institution,
-                    degree=edu.degree,
-                    field_of_study=edu.field_of_study,
-                    start_date=edu.start_date,
-                    end_date=edu.end_date,
-                    gpa=edu.gpa
-                ) for edu in resume_data.education or []
-            ],
-            experience=[
-                models.Experience(
-                    company=exp.company,
-                    position=exp.position,
-                    start_date=exp.start_date,
-                    end_date=exp.end_date,
-                    description=exp.description,
-                    highlights=exp.highlights
-                ) for exp in resume_data.experience or []
-            ],
-            skills=[
-                models.Skill(
-                    name=skill.name,
-                    category=skill.category,
-                    proficiency_level=skill.proficiency_level
-                ) for skill in resume_data.skills or []
-            ],
-            projects=[
-                models.Project(
-                    title=proj.title,
-                    description=proj.description,
-                    technologies=proj.technologies or [],
-                    url=proj.url,
-                    start_date=proj.start_date,
-                    end_date=proj.end_date
-                ) for proj in resume_data.projects or []
-            ],
-            achievements=[
-                models.Achievement(
-                    title=ach.title,
-                    description=ach.description,
-                    date=ach.date
-                ) for ach in resume_data.achievements or []
-            ],
-            resume_type="Parsed Resume",
-            updated_at=datetime.now()
+@app.get("/api/resumes/upload/jobs/{job_id}/result", response_model=Resume)
+async def get_parse_job_result(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the resume produced by a completed parse job."""
+    job = parse_queue.get(db, job_id, current_user.id)
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Parse job not found"
         )
 
-        # Save to database
-        db.add(db_resume)
-        db.commit()
-        db.refresh(db_resume)
+    if job.status == JOB_PENDING:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Resume is still being parsed"
+        )
 
-        # Clean up temp file
-        os.unlink(temp_path)
+    if job.status == JOB_FAILED:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=job.error or "Resume parsing failed"
+        )
 
-        return db_resume
+    return db.query(models.Resume).filter(
+        models.Resume.id == job.resume_id,
+        models.Resume.user_id == current_user.id
+    ).first()
+
+@app.post("/api/resumes/bulk-upload", response_model=List[Resume])
+def bulk_upload_resumes(
+    files: List[UploadFile] = File(...),
+    job_description: str = Form(None),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Upload and parse a batch of resume files (e.g. a career-center cohort).
+
+    Files are parsed by the sandboxed parse workers, under the same limits as
+    single uploads; files that fail are left out of the response. Declared as
+    a plain function so waiting for the workers blocks a threadpool thread
+    rather than the event loop.
+    """
+    if not job_description:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Job description is required"
+        )
+
+    if len(files) > MAX_BULK_UPLOAD_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_BULK_UPLOAD_FILES} files can be uploaded at once"
+        )
+
+    if any(file.content_type not in ALLOWED_UPLOAD_TYPES for file in files):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only PDF and DOCX files are supported"
+        )
+
+    try:
+        db_resumes = []
+        uploads = ((file.file.read(), _upload_filename(file)) for file in files)
+        for resume_data in parse_queue.parse_many(uploads):
+            db_resume = _build_parsed_resume(resume_data, current_user.id, job_description)
+            db.add(db_resume)
+            db_resumes.append(db_resume)
+
+        # One commit for the whole batch, recorded as a single persist observation
+        timings = ParseTimings("bulk")
+        with timings.stage("persist"):
+            db.commit()
+        timings.record()
+        for db_resume in db_resumes:
+            db.refresh(db_resume)
+
+        return db_resumes
 
     except Exception as e:
+        db.rollback()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e)
@@ -323,7 +545,7 @@ async def analyze_resume(
             detail="Resume not found"
         )
     
-    feedback = resume_analyzer.analyze_resume(resume, job_description)
+    feedback = await resume_analyzer.analyze_resume(resume, job_description)
     return feedback
 
 @app.post("/api/resumes/{resume_id}/generate")
@@ -382,7 +604,7 @@ async def get_job_recommendations(
             detail="Resume not found"
         )
     
-    recommendations = resume_analyzer._get_job_recommendations(
+    recommendations = await resume_analyzer._get_job_recommendations(
         resume,
         resume.target_job_description
     )
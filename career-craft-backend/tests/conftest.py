@@ -0,0 +1,62 @@
+# tests/conftest.py
+import pytest
+import spacy
+from app import nlp_registry
+from app.resume_parser import ResumeParser
+
+
+def _blank_nlp(*args, **kwargs):
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    return nlp
+
+
+def _build_pdf(pages):
+    """Build a minimal PDF with one line of text per page."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        content_id = len(objects)
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{i} 0 R" for i in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        out += f"{offset:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF".encode()
+    return out
+
+
+@pytest.fixture
+def make_pdf():
+    return _build_pdf
+
+
+@pytest.fixture
+def blank_spacy(monkeypatch):
+    """Stand in for en_core_web_sm, which is not installed in the test environment."""
+    monkeypatch.setattr(spacy, "load", _blank_nlp)
+    nlp_registry.clear()
+    yield
+    nlp_registry.clear()
+
+
+@pytest.fixture
+def parser(blank_spacy):
+    parser = ResumeParser(pdf_workers=2, parallel_page_threshold=2)
+    yield parser
+    parser.close()
@@ -0,0 +1,144 @@
+# tests/test_ann_index.py
+import json
+
+import numpy as np
+import pytest
+
+from app.ann_index import IVFIndex, normalize_rows
+from app.semantic_index import SemanticJobIndex, load_or_build_semantic_index
+from app.skill_matcher import JOBS_PATH
+
+
+def _clustered(count, dim=32, clusters=64, seed=0):
+    """Unit vectors scattered around random cluster centres, like job families."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(clusters, dim))
+    points = centres[rng.integers(clusters, size=count)] + 0.6 * rng.normal(size=(count, dim))
+    return normalize_rows(points)
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    vectors = _clustered(20_000)
+    index = IVFIndex.train(vectors, nlist=128)
+    index.add(vectors)
+    queries = _clustered(200, seed=1)
+    exact = [set(index.search_exact(query, k=10)[0].tolist()) for query in queries]
+    return index, vectors, queries, exact
+
+
+def _recall(index, queries, exact, nprobe):
+    found = [set(index.search(query, k=10, nprobe=nprobe)[0].tolist()) for query in queries]
+    return np.mean([len(got & want) / len(want) for got, want in zip(found, exact)])
+
+
+def test_recall_against_exact_search_rises_with_probes(corpus):
+    """The recall-vs-exact benchmark: recall@10 over 200 queries per probe setting."""
+    index, _, queries, exact = corpus
+    recalls = [_recall(index, queries, exact, nprobe) for nprobe in (1, 4, 16, 128)]
+
+    assert recalls == sorted(recalls)
+    assert recalls[2] >= 0.95
+    assert recalls[3] == 1.0
+
+
+def test_search_returns_best_first_with_exact_scores(corpus):
+    index, vectors, queries, _ = corpus
+    ids, scores = index.search(queries[0], k=10)
+
+    assert list(scores) == sorted(scores, reverse=True)
+    assert np.allclose(scores, vectors[ids] @ queries[0], atol=1e-5)
+
+
+def test_added_vectors_are_found_before_and_after_compaction():
+    vectors = _clustered(2_000)
+    index = IVFIndex.train(vectors, nlist=16, nprobe=2)
+    index.add(vectors)
+    extra = _clustered(10, seed=2)
+
+    ids = index.add(extra)
+    assert list(ids) == list(range(2_000, 2_010))
+    assert len(index) == 2_010
+    for vector_id, vector in zip(ids, extra):
+        assert index.search(vector, k=1)[0][0] == vector_id
+
+    index.compact()
+    assert len(index.ids) == 2_010
+    for vector_id, vector in zip(ids, extra):
+        assert index.search(vector, k=1)[0][0] == vector_id
+
+
+def test_saved_index_is_memory_mapped_and_equivalent(tmp_path):
+    vectors = _clustered(2_000)
+    index = IVFIndex.train(vectors, nlist=16, nprobe=4)
+    index.add(vectors[:1_500])
+    index.add(vectors[1_500:])
+    index.save(str(tmp_path / "ann"))
+    loaded = IVFIndex.load(str(tmp_path / "ann"))
+
+    assert isinstance(loaded.vectors, np.memmap) and not loaded.vectors.flags.writeable
+    assert loaded.nprobe == 4 and len(loaded) == 2_000
+    query = _clustered(1, seed=3)[0]
+    assert np.array_equal(loaded.search(query, k=10)[0], index.search(query, k=10)[0])
+    # New vectors are buffered beside the read-only mapping
+    assert loaded.add(query)[0] == 2_000
+    assert loaded.search(query, k=1)[0][0] == 2_000
+
+
+def test_compacting_a_mapped_index_keeps_the_mapping(tmp_path):
+    vectors = _clustered(2_000)
+    index = IVFIndex.train(vectors, nlist=16, nprobe=16)
+    index.compact_after = 8
+    index.add(vectors)
+    index.save(str(tmp_path / "ann"))
+    loaded = IVFIndex.load(str(tmp_path / "ann"))
+    extra = _clustered(50, seed=4)
+
+    for vector in extra:
+        loaded.add(vector)
+
+    assert isinstance(loaded.vectors, np.memmap) and len(loaded) == 2_050
+    assert all(len(blocks) <= 1 + loaded.compact_after for blocks in loaded._pending_ids)
+    for vector_id, vector in enumerate(extra, start=2_000):
+        assert loaded.search(vector, k=1)[0][0] == vector_id
+    loaded.save(str(tmp_path / "ann"))
+    assert len(IVFIndex.load(str(tmp_path / "ann")).ids) == 2_050
+
+
+def test_semantic_index_with_ann_matches_exact_ranking_when_probing_everything(tmp_path):
+    with open(JOBS_PATH) as f:
+        jobs = json.load(f)
+    index = SemanticJobIndex.build(jobs)
+    queries = [("python machine learning", 0.7), ("data analysis", 0.3)]
+    exact = index.top(queries, k=5)
+    index.attach_ann(nlist=4, nprobe=1)
+
+    # Candidates are rescored exactly, so with every job a candidate the ranking is the exact one
+    assert index.top(queries, k=5, nprobe=4) == exact
+    assert len(index.top(queries, k=5)) == 5
+
+    job_id = index.add_job({
+        "title": "Robotics Engineer", "category": "Tech", "keyResponsibilities": ["Program robots"],
+        "requiredSkills": ["Python", "Machine Learning", "C++"]
+    })
+    best, score = index.top([("python machine learning c++", 1.0)], k=1, nprobe=4)[0]
+    assert best["title"] == "Robotics Engineer"
+    assert score == pytest.approx(index.similarities([("python machine learning c++", 1.0)])[job_id])
+
+    index.save(str(tmp_path / "index"))
+    loaded = SemanticJobIndex.load(str(tmp_path / "index"))
+    assert isinstance(loaded.projection, np.memmap) and loaded.rows.shape[0] == job_id + 1
+    assert loaded.top(queries, k=5, nprobe=4) == index.top(queries, k=5, nprobe=4)
+    # Only the row layout is saved; the column one is derived when exact scoring asks for it
+    assert loaded._matrix is None and len(list((tmp_path / "index").glob("*indptr.npy"))) == 1
+    assert len(loaded.jobs) == job_id + 1 and loaded.matrix.shape[0] == job_id + 1
+    assert np.allclose(loaded.similarities(queries), index.similarities(queries))
+
+
+def test_large_catalogs_are_loaded_with_an_ann_index(tmp_path):
+    directory = str(tmp_path / "index")
+
+    assert load_or_build_semantic_index(directory, JOBS_PATH, ann_min_jobs=None).ann is None
+    index = load_or_build_semantic_index(directory, JOBS_PATH, ann_min_jobs=10, ann_nprobe=3, ann_candidates=20)
+    assert index.ann is not None and index.ann.nprobe == 3 and index.ann_candidates == 20
+    assert load_or_build_semantic_index(directory, JOBS_PATH, ann_min_jobs=10).ann.nprobe == 16
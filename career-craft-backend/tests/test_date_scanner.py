@@ -0,0 +1,42 @@
+# tests/test_date_scanner.py
+from datetime import datetime
+import pytest
+from dateutil import parser as date_parser
+from app.date_scanner import DateScanner, _parse_token
+
+NOW = datetime(2026, 10, 31, 15, 30)
+
+
+@pytest.fixture
+def scanner():
+    return DateScanner(now=lambda: NOW)
+
+
+@pytest.mark.parametrize("token", ["Feb 2020", "Feb, 2020", "September 2021", "Sept 2021", "2/2020", "12/2019", "2020"])
+def test_fast_path_matches_dateutil(scanner, token):
+    default = NOW.replace(hour=0, minute=0)
+    assert scanner.scan(token) == [date_parser.parse(token, default=default)]
+
+
+def test_month_and_year_are_not_double_counted(scanner):
+    dates = scanner.extract("Acme Corp\nJan 2019 - Mar 2022")
+
+    assert dates == {'start_date': datetime(2019, 1, 31), 'end_date': datetime(2022, 3, 31)}
+
+
+def test_non_year_numbers_are_ignored(scanner):
+    assert scanner.scan("Call (555) 123-4567 or visit suite 12345") == []
+
+
+def test_unusual_tokens_fall_back_to_dateutil(scanner, monkeypatch):
+    _parse_token.cache_clear()
+    calls = []
+    monkeypatch.setattr(date_parser, "parse", lambda token, default: calls.append(token))
+
+    # Month 13 is out of range for the lookup table, so dateutil gets the final say
+    assert scanner.scan("13/2020 and 14/2020 and 13/2020") == []
+    assert calls == ["13/2020", "14/2020"]  # repeated tokens are memoized
+
+
+def test_no_dates_defaults_to_start_of_year(scanner):
+    assert scanner.extract("No dates here") == {'start_date': NOW.replace(month=1, day=1), 'end_date': None}
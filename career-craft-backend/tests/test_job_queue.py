@@ -0,0 +1,239 @@
+# tests/test_job_queue.py
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app import models
+from app.database import Base
+from app.job_queue import ParseJobQueue, JOB_COMPLETED, JOB_FAILED, JOB_PENDING
+from app.parse_cache import ParseCache
+
+
+def _persist(db, job, resume_data):
+    db_resume = models.Resume(user_id=job.user_id, title=resume_data.title, summary=resume_data.summary)
+    db.add(db_resume)
+    return db_resume
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = factory()
+    db.add(models.User(id=1, email="jane@example.com", firebase_uid="uid-1"))
+    db.commit()
+    db.close()
+    return factory
+
+
+# en_core_web_sm is not installed here, and workers start in fresh processes
+# that don't see conftest's monkeypatch, so they load a blank pipeline themselves
+BLANK_PARSER = {"model_name": "blank:en", "nlp_profile": "sentencizer"}
+
+
+@pytest.fixture
+def queue(session_factory):
+    queue = ParseJobQueue(
+        persist=_persist, max_workers=2, parser_kwargs=BLANK_PARSER, cache=ParseCache(),
+        session_factory=session_factory
+    )
+    yield queue
+    queue.shutdown()
+
+
+def _wait_for(session_factory, job_id, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        db = session_factory()
+        job = db.get(models.ParseJob, job_id)
+        db.close()
+        if job.status != JOB_PENDING:
+            return job
+        time.sleep(0.05)
+    pytest.fail("parse job did not finish")
+
+
+def test_upload_is_parsed_in_background(queue, session_factory, make_pdf):
+    db = session_factory()
+    job = queue.submit(db, 1, make_pdf(["Jane Doe writes Python."]), "resume.pdf", "Backend engineer")
+    db.close()
+    assert job.status == JOB_PENDING
+
+    job = _wait_for(session_factory, job.id)
+    assert job.status == JOB_COMPLETED
+
+    db = session_factory()
+    resume = db.get(models.Resume, job.resume_id)
+    assert resume.title == "Uploaded Resume - resume.pdf"
+    assert resume.summary == "Jane Doe writes Python."
+    db.close()
+
+
+def test_repeat_upload_completes_from_cache(queue, session_factory, make_pdf):
+    data = make_pdf(["Jane Doe writes Python."])
+
+    db = session_factory()
+    _wait_for(session_factory, queue.submit(db, 1, data, "first.pdf", "Backend engineer").id)
+    job = queue.submit(db, 1, data, "second.pdf", "Backend engineer")
+
+    assert job.status == JOB_COMPLETED
+    assert queue.cache.stats()["hits"] == 1
+    assert db.get(models.Resume, job.resume_id).title == "Uploaded Resume - second.pdf"
+    db.close()
+
+
+def test_failed_parse_is_recorded(queue, session_factory):
+    db = session_factory()
+    job = queue.submit(db, 1, b"not a pdf", "broken.pdf", "Backend engineer")
+    db.close()
+
+    job = _wait_for(session_factory, job.id)
+    assert job.status == JOB_FAILED
+    assert job.error
+
+
+def test_bulk_parse_runs_in_workers_and_skips_failures(queue, make_pdf):
+    failures = []
+    first = make_pdf(["Jane Doe writes Python."])
+    files = [(first, "first.pdf"), (b"not a pdf", "broken.pdf"), (make_pdf(["John Roe"]), "last.pdf"),
+             (first, "again.pdf")]
+
+    resumes = list(queue.parse_many(files, on_error=lambda filename, error: failures.append(filename)))
+
+    assert [resume.title for resume in resumes] == [
+        "Uploaded Resume - first.pdf", "Uploaded Resume - last.pdf", "Uploaded Resume - again.pdf"
+    ]
+    assert resumes[0].summary == "Jane Doe writes Python."
+    assert failures == ["broken.pdf"]
+
+
+def test_recover_fails_jobs_interrupted_by_restart(queue, session_factory):
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    old = datetime.now(timezone.utc) - timedelta(hours=2)
+    db = session_factory()
+    db.add_all([
+        models.ParseJob(id="orphan", user_id=1, status=JOB_PENDING, filename="a.pdf",
+                        owner=f"{queue.host}:{dead.pid}:boot"),
+        models.ParseJob(id="restarted", user_id=1, status=JOB_PENDING, filename="b.pdf",
+                        owner=f"{queue.host}:{os.getpid()}:earlier-boot"),
+        models.ParseJob(id="abandoned", user_id=1, status=JOB_PENDING, filename="c.pdf",
+                        owner="other-host:1:boot", created_at=old),
+        models.ParseJob(id="legacy", user_id=1, status=JOB_PENDING, filename="d.pdf", created_at=old),
+    ])
+    db.commit()
+    db.close()
+
+    queue.recover()
+
+    db = session_factory()
+    for job_id in ("orphan", "restarted", "abandoned", "legacy"):
+        assert db.get(models.ParseJob, job_id).status == JOB_FAILED
+    db.close()
+
+
+def test_recover_leaves_sibling_workers_jobs_pending(queue, session_factory):
+    sibling = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+    try:
+        db = session_factory()
+        db.add_all([
+            models.ParseJob(id="sibling", user_id=1, status=JOB_PENDING, filename="a.pdf",
+                            owner=f"{queue.host}:{sibling.pid}:boot"),
+            models.ParseJob(id="other-host", user_id=1, status=JOB_PENDING, filename="b.pdf",
+                            owner="other-host:1:boot"),
+            models.ParseJob(id="own", user_id=1, status=JOB_PENDING, filename="c.pdf", owner=queue.owner),
+        ])
+        db.commit()
+        db.close()
+
+        queue.recover()
+
+        db = session_factory()
+        for job_id in ("sibling", "other-host", "own"):
+            assert db.get(models.ParseJob, job_id).status == JOB_PENDING
+        db.close()
+    finally:
+        sibling.kill()
+        sibling.wait()
+
+
+def test_worker_stage_timings_are_recorded_with_persist(queue, session_factory, make_pdf):
+    from app.metrics import PARSE_STAGE_SECONDS
+
+    def persist_count():
+        return sum(s["count"] for key, s in PARSE_STAGE_SECONDS.snapshot().items() if key[0] == "persist")
+
+    def extract_count():
+        return sum(s["count"] for key, s in PARSE_STAGE_SECONDS.snapshot().items() if key[0] == "extract_text")
+
+    persisted, extracted = persist_count(), extract_count()
+    db = session_factory()
+    _wait_for(session_factory, queue.submit(db, 1, make_pdf(["Jane Doe"]), "cv.pdf", "Backend engineer").id)
+    db.close()
+
+    deadline = time.time() + 5
+    while persist_count() == persisted and time.time() < deadline:
+        time.sleep(0.01)
+    assert persist_count() == persisted + 1
+    assert extract_count() == extracted + 1
+
+
+def _parse_forever(data, filename):
+    while True:
+        pass
+
+
+def test_runaway_parse_fails_only_its_job(session_factory, make_pdf):
+    from app import job_queue
+
+    queue = ParseJobQueue(
+        persist=_persist, max_workers=1, parser_kwargs=BLANK_PARSER, session_factory=session_factory,
+        sandbox_limits={"cpu_seconds": 0.2, "wall_seconds": 10}
+    )
+    parse_in_worker = job_queue._parse_in_worker
+    db = session_factory()
+    try:
+        job_queue._parse_in_worker = _parse_forever
+        stuck_id = queue.submit(db, 1, b"%PDF-1.4 crafted", "crafted.pdf", "Backend engineer").id
+        job_queue._parse_in_worker = parse_in_worker
+        fine_id = queue.submit(db, 1, make_pdf(["Jane Doe"]), "resume.pdf", "Backend engineer").id
+
+        stuck = _wait_for(session_factory, stuck_id)
+        assert stuck.status == JOB_FAILED
+        assert stuck.error == "Parsing this file took too long and was stopped"
+        assert _wait_for(session_factory, fine_id).status == JOB_COMPLETED
+    finally:
+        job_queue._parse_in_worker = parse_in_worker
+        db.close()
+        queue.shutdown()
+
+
+def _preloaded_in_worker():
+    import gc
+    import sys
+    return "app.parse_preload" in sys.modules and gc.get_freeze_count() > 0
+
+
+# Runs in a fresh interpreter: the fork server is per process, and this suite's
+# other pools have already started it without the preload
+PRELOAD_SCRIPT = """
+from app.job_queue import ParseJobQueue
+from tests.test_job_queue import BLANK_PARSER, _persist, _preloaded_in_worker
+queue = ParseJobQueue(persist=_persist, max_workers=1, parser_kwargs=BLANK_PARSER, preload_nlp=True)
+print(queue._get_executor().submit(_preloaded_in_worker).result(timeout=60))
+queue.shutdown()
+"""
+
+
+def test_preload_loads_the_pipeline_in_the_fork_server():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "DATABASE_URL": os.environ.get("DATABASE_URL", "sqlite://")}
+    result = subprocess.run([sys.executable, "-c", PRELOAD_SCRIPT], cwd=root, env=env,
+                            capture_output=True, text=True, timeout=120)
+
+    assert result.stdout.strip().splitlines()[-1] == "True", result.stderr
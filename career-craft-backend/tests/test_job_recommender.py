@@ -0,0 +1,146 @@
+# tests/test_job_recommender.py
+import json
+import random
+
+import numpy as np
+import pytest
+
+from app.job_recommender import JobRecommender, get_job_recommender, top_k
+from app.skill_matcher import JOBS_PATH
+
+
+def legacy_top(jobs, resume_skills, target_skills, k=5):
+    """The original per-job loop and full sort, for comparison."""
+    job_scores = []
+    for job in jobs:
+        job_skills = set(skill.lower() for skill in job["requiredSkills"])
+        skill_match = len(resume_skills.intersection(job_skills)) / len(job_skills) if job_skills else 0
+        target_match = len(target_skills.intersection(job_skills)) / len(target_skills) if target_skills else 0
+        job_scores.append((job, (skill_match * 0.7) + (target_match * 0.3)))
+    job_scores.sort(key=lambda x: x[1], reverse=True)
+    return job_scores[:k]
+
+
+def _job(title, *skills):
+    return {"title": title, "keyResponsibilities": [], "requiredSkills": list(skills), "category": "Tech"}
+
+
+def test_matches_legacy_ranking_on_bundled_jobs():
+    with open(JOBS_PATH) as f:
+        jobs = json.load(f)
+    recommender = JobRecommender(jobs)
+    skills = sorted(recommender.vocabulary)
+    rng = random.Random(7)
+
+    for _ in range(200):
+        resume_skills = set(rng.sample(skills, rng.randint(0, 15)))
+        target_skills = set(rng.sample(skills, rng.randint(0, 8))) | {"not a catalog skill"}
+        expected = legacy_top(jobs, resume_skills, target_skills)
+        got = recommender.top(resume_skills, target_skills)
+
+        assert [job["title"] for job, _ in got] == [job["title"] for job, _ in expected]
+        assert [round(s * 100, 2) for _, s in got] == [round(s * 100, 2) for _, s in expected]
+
+
+def test_scores_follow_the_weighted_formula():
+    recommender = JobRecommender([
+        _job("Backend", "Python", "SQL", "python"),
+        _job("Frontend", "JavaScript", "CSS", "HTML", "React"),
+        _job("Empty"),
+    ])
+
+    scores = recommender.scores({"python", "css"}, {"sql", "react", "go", "css"})
+    assert np.allclose(scores, [0.7 * 1 / 2 + 0.3 * 1 / 4, 0.7 * 1 / 4 + 0.3 * 2 / 4, 0.0])
+
+
+def test_empty_target_skills_score_on_resume_only():
+    recommender = JobRecommender([_job("Backend", "Python", "SQL")])
+    assert np.allclose(recommender.scores({"python"}, set()), [0.35])
+
+
+def test_top_k_breaks_ties_by_catalog_order():
+    scores = np.array([0.1, 0.5, 0.5, 0.0, 0.5, 0.9, 0.5])
+    assert top_k(scores, 3).tolist() == [5, 1, 2]
+    assert top_k(scores, 10).tolist() == [5, 1, 2, 4, 6, 0, 3]
+    assert top_k(scores, 0).tolist() == []
+    assert top_k(np.zeros(4), 2).tolist() == [0, 1]
+
+
+def test_default_recommender_is_shared():
+    assert get_job_recommender() is get_job_recommender()
+    assert len(get_job_recommender().jobs) == 50
+
+
+def test_unmatched_jobs_fill_remaining_places_in_catalog_order():
+    recommender = JobRecommender([_job("A", "Go"), _job("B", "Rust"), _job("C", "Python"), _job("D", "Java")])
+
+    top = recommender.top({"python"}, {"haskell"}, k=3)
+    assert [(job["title"], round(score, 2)) for job, score in top] == [("C", 0.7), ("A", 0.0), ("B", 0.0)]
+
+
+def _bundled_jobs():
+    with open(JOBS_PATH) as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("compact_after", [1000, 3])
+def test_incremental_updates_rank_like_a_fresh_build(compact_after):
+    jobs = _bundled_jobs()
+    recommender = JobRecommender(jobs[:20], compact_after=compact_after)
+    for job in jobs[20:]:
+        recommender.add_job(job)
+    rng = random.Random(3)
+    removed = rng.sample(range(len(jobs)), 15)
+    for job_id in removed:
+        recommender.remove_job(job_id)
+
+    remaining = [job for job_id, job in enumerate(jobs) if job_id not in removed]
+    fresh = JobRecommender(remaining)
+    skills = sorted(fresh.vocabulary)
+    for _ in range(100):
+        resume_skills = set(rng.sample(skills, rng.randint(0, 15)))
+        target_skills = set(rng.sample(skills, rng.randint(0, 8)))
+        got = recommender.top(resume_skills, target_skills)
+        expected = fresh.top(resume_skills, target_skills)
+        assert [(job["title"], score) for job, score in got] == [(job["title"], score) for job, score in expected]
+
+
+def test_added_job_with_new_skills_is_found_before_compaction():
+    recommender = JobRecommender([_job("A", "Go")])
+    job_id = recommender.add_job(_job("B", "Zig", "Go"))
+
+    assert recommender.top({"zig"}, {"zig"}, k=1)[0] == (recommender.jobs[job_id], 0.65)
+    recommender.compact()
+    assert recommender.top({"zig"}, {"zig"}, k=1)[0][0]["title"] == "B"
+
+
+def test_removed_jobs_are_never_recommended():
+    recommender = JobRecommender([_job("A", "Go"), _job("B", "Go"), _job("C", "Rust")])
+    recommender.remove_job(0)
+
+    assert [job["title"] for job, _ in recommender.top({"go"}, set(), k=3)] == ["B", "C"]
+    assert recommender.scores({"go"}, set()).tolist() == [0.0, 0.7, 0.0]
+    with pytest.raises(KeyError):
+        recommender.remove_job(0)
+
+
+def test_score_resumes_matches_catalog_scores():
+    jobs = _bundled_jobs()
+    recommender = JobRecommender(jobs)
+    skills = list(recommender.vocabulary)
+    rng = random.Random(5)
+    resumes = [set(rng.sample(skills, rng.randint(0, 20))) | {"not a catalog skill"} for _ in range(40)]
+    target_skills = set(rng.sample(skills, 6)) | {"also unknown"}
+
+    for job_id in (0, 17, 49):
+        batch = recommender.score_resumes(job_id, resumes, target_skills)
+        assert batch.tolist() == [recommender.scores(r, target_skills)[job_id] for r in resumes]
+
+
+def test_skills_are_normalized_before_matching():
+    recommender = JobRecommender([_job("A", "Machine  Learning", "Python")])
+
+    assert recommender.scores({"machine learning", " PYTHON"}, set()).tolist() == [0.7]
+    assert recommender.score_resumes(0, [["Machine Learning"], []]).tolist() == [0.35, 0.0]
+    with pytest.raises(KeyError):
+        recommender.score_resumes(1, [])
@@ -0,0 +1,45 @@
+# tests/test_json_repair.py
+import pytest
+
+from app.json_repair import JSONRepairError, repair_json
+
+
+def test_valid_json_is_parsed_as_is():
+    assert repair_json('{"a": [1, 2], "b": "x, }"}') == {"a": [1, 2], "b": "x, }"}
+
+
+def test_prose_and_code_fences_are_stripped():
+    text = 'Sure! Here it is:\n```json\n{"overall_score": 70}\n```\nLet me know.'
+    assert repair_json(text) == {"overall_score": 70}
+    assert repair_json('Result: {"overall_score": 70} -- done') == {"overall_score": 70}
+
+
+def test_trailing_commas_and_smart_quotes():
+    text = '{“suggestions”: [“Add metrics”, “Use verbs”,], “missing_skills”: [],}'
+    assert repair_json(text) == {"suggestions": ["Add metrics", "Use verbs"], "missing_skills": []}
+
+
+def test_smart_quotes_inside_strings_are_kept():
+    text = '{"suggestions": ["Use “action verbs”",], "overall_score": 70}'
+    assert repair_json(text) == {"suggestions": ["Use “action verbs”"], "overall_score": 70}
+    assert repair_json('{“quote”: “say "hi"”,}') == {"quote": 'say "hi"'}
+
+
+def test_python_literals():
+    assert repair_json('{"ok": True, "missing": None}') == {"ok": True, "missing": None}
+
+
+def test_truncated_output_is_closed():
+    text = '{"overall_score": 80, "suggestions": ["Add metrics", "Quantify imp'
+    assert repair_json(text) == {"overall_score": 80, "suggestions": ["Add metrics", "Quantify imp"]}
+    assert repair_json('{"improvement_areas": {"skills": ["Docker",') == {"improvement_areas": {"skills": ["Docker"]}}
+
+
+def test_braces_inside_strings_do_not_end_the_object():
+    assert repair_json('note {"text": "use {braces}", "n": 1} trailing }') == {"text": "use {braces}", "n": 1}
+
+
+@pytest.mark.parametrize("text", ["", "no json here", '{"overall_score": }'])
+def test_unrecoverable_text_raises(text):
+    with pytest.raises(JSONRepairError):
+        repair_json(text)
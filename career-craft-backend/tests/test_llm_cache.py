@@ -0,0 +1,154 @@
+# tests/test_llm_cache.py
+import asyncio
+import threading
+import time
+
+from app.llm_cache import LLM_CACHE_LOOKUPS, LLMResponseCache
+from app.llm_gateway import FakeProvider, LLMGateway
+
+MESSAGES = [{"role": "system", "content": "Extract key skills and requirements."},
+            {"role": "user", "content": "Backend engineer"}]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_key_covers_model_prompt_and_parameters():
+    cache = LLMResponseCache()
+    key = cache.key_for("gpt-3.5-turbo", MESSAGES, 500, 0.3)
+
+    assert key == LLMResponseCache().key_for("gpt-3.5-turbo", [dict(m) for m in MESSAGES], 500, 0.3)
+    assert key != cache.key_for("gpt-4", MESSAGES, 500, 0.3)
+    assert key != cache.key_for("gpt-3.5-turbo", MESSAGES, 500, 0.7)
+    assert key != cache.key_for("gpt-3.5-turbo", MESSAGES[:1], 500, 0.3)
+
+
+def test_lru_eviction_and_hit_rate():
+    cache = LLMResponseCache(max_entries=2)
+    cache.put("a", "one")
+    cache.put("b", "two")
+    assert cache.get("a") == "one"  # "a" becomes most recently used
+    cache.put("c", "three")
+
+    assert cache.get("b") is None
+    assert cache.get("c") == "three"
+    assert cache.stats() == {
+        "hits": 2, "disk_hits": 0, "misses": 1, "hit_rate": 2 / 3, "entries": 2, "max_entries": 2
+    }
+
+
+def test_entries_expire_in_both_tiers(tmp_path):
+    clock = FakeClock()
+    path = str(tmp_path / "llm.sqlite3")
+    cache = LLMResponseCache(ttl_seconds=60, db_path=path, clock=clock)
+    cache.put("key", "response")
+
+    clock.now += 59
+    assert cache.get("key") == "response"
+    assert LLMResponseCache(ttl_seconds=60, db_path=path, clock=clock).get("key") == "response"
+
+    clock.now += 2
+    assert cache.get("key") is None
+    assert LLMResponseCache(ttl_seconds=60, db_path=path, clock=clock).get("key") is None
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    path = str(tmp_path / "llm.sqlite3")
+    LLMResponseCache(db_path=path).put("key", "response")
+
+    restarted = LLMResponseCache(db_path=path)
+    assert restarted.get("key") == "response"
+    assert restarted.get("key") == "response"
+    assert restarted.stats()["disk_hits"] == 1
+    assert restarted.stats()["hits"] == 1
+
+
+def test_disk_tier_evicts_least_recently_used_over_size_limit(tmp_path):
+    clock = FakeClock()
+    path = str(tmp_path / "llm.sqlite3")
+    cache = LLMResponseCache(max_entries=1, db_path=path, max_disk_bytes=25, clock=clock)
+    for key in ("a", "b"):
+        cache.put(key, "x" * 10)
+        clock.now += 1
+    assert cache.get("a") == "x" * 10  # read from disk, refreshing "a"
+    clock.now += 1
+    cache.put("c", "x" * 10)
+
+    disk = LLMResponseCache(max_entries=1, db_path=path, clock=clock)
+    assert disk.get("a") is not None
+    assert disk.get("b") is None
+    assert disk.get("c") is not None
+
+
+def test_gateway_answers_repeats_from_cache():
+    provider = FakeProvider(latency=0.2)
+    gateway = LLMGateway(provider, cache=LLMResponseCache())
+    before = LLM_CACHE_LOOKUPS.snapshot().get(("memory",), 0)
+
+    first = asyncio.run(gateway.complete(MESSAGES, max_tokens=500, temperature=0.3))
+    started = time.perf_counter()
+    second = asyncio.run(gateway.complete(MESSAGES, max_tokens=500, temperature=0.3))
+
+    assert time.perf_counter() - started < 0.05
+    assert first == second
+    assert provider.calls == 1
+    assert LLM_CACHE_LOOKUPS.snapshot()[("memory",)] == before + 1
+
+
+class ThreadRecordingCache(LLMResponseCache):
+    """Records which threads touched SQLite."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.disk_threads = set()
+
+    def _read_from_disk(self, key, now):
+        self.disk_threads.add(threading.get_ident())
+        return super()._read_from_disk(key, now)
+
+    def _write_to_disk(self, key, response, expires_at, now):
+        self.disk_threads.add(threading.get_ident())
+        super()._write_to_disk(key, response, expires_at, now)
+
+
+def test_gateway_keeps_sqlite_off_the_event_loop(tmp_path):
+    path = str(tmp_path / "llm.db")
+    provider = FakeProvider()
+
+    async def complete_on_fresh_gateway():
+        cache = ThreadRecordingCache(db_path=path)
+        result = await LLMGateway(provider, cache=cache).complete(MESSAGES)
+        return result, cache.disk_threads, threading.get_ident()
+
+    # asyncio.run waits for the background write before returning
+    first, disk_threads, loop_thread = asyncio.run(complete_on_fresh_gateway())
+    assert disk_threads and loop_thread not in disk_threads
+
+    # A new process's cache answers from disk, again off the loop
+    second, disk_threads, loop_thread = asyncio.run(complete_on_fresh_gateway())
+    assert second == first and provider.calls == 1
+    assert disk_threads and loop_thread not in disk_threads
+
+
+def test_failures_are_not_cached():
+    provider = FakeProvider(fail=lambda call: call == 0)
+    gateway = LLMGateway(provider, max_attempts=1, cache=LLMResponseCache())
+
+    assert asyncio.run(_complete_twice(gateway)) == [None, "communication\nproblem-solving"]
+    assert provider.calls == 2
+
+
+async def _complete_twice(gateway):
+    results = []
+    for _ in range(2):
+        try:
+            results.append(await gateway.complete(MESSAGES))
+        except Exception:
+            results.append(None)
+    return results
+
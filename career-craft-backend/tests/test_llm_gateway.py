@@ -0,0 +1,205 @@
+# tests/test_llm_gateway.py
+import asyncio
+import time
+
+import pytest
+
+from app.llm_gateway import LLM_COALESCED_REQUESTS, CircuitBreaker, FakeProvider, LLMGateway, LLMUnavailable
+
+MESSAGES = [{"role": "system", "content": "Extract key skills and requirements."},
+            {"role": "user", "content": "Backend engineer"}]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_deadline_raises_unavailable():
+    gateway = LLMGateway(FakeProvider(latency=5), timeout=0.1, hedge_after=None)
+
+    started = time.perf_counter()
+    with pytest.raises(LLMUnavailable, match="deadline"):
+        asyncio.run(gateway.complete(MESSAGES))
+    assert time.perf_counter() - started < 1
+
+
+def test_slow_attempt_is_hedged():
+    # The first attempt hangs; the hedge started after 0.05s answers at once
+    provider = FakeProvider(latency=lambda call: 5 if call == 0 else 0)
+    gateway = LLMGateway(provider, timeout=2, hedge_after=0.05)
+
+    started = time.perf_counter()
+    result = asyncio.run(gateway.complete(MESSAGES))
+
+    assert time.perf_counter() - started < 1
+    assert result == "communication\nproblem-solving"
+    assert provider.calls == 2
+
+
+def test_failed_attempt_is_retried():
+    provider = FakeProvider(fail=lambda call: call == 0)
+    gateway = LLMGateway(provider, hedge_after=None, max_attempts=2)
+
+    assert asyncio.run(gateway.complete(MESSAGES)) == "communication\nproblem-solving"
+    assert provider.calls == 2
+
+
+def test_attempts_are_bounded():
+    provider = FakeProvider(fail=lambda call: True)
+    gateway = LLMGateway(provider, hedge_after=None, max_attempts=3)
+
+    with pytest.raises(LLMUnavailable, match="fake provider error"):
+        asyncio.run(gateway.complete(MESSAGES))
+    assert provider.calls == 3
+
+
+def test_breaker_opens_then_recovers_through_a_probe():
+    clock = FakeClock()
+    provider = FakeProvider(fail=lambda call: call < 2)
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30, clock=clock)
+    gateway = LLMGateway(provider, hedge_after=None, max_attempts=1, breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(LLMUnavailable):
+            asyncio.run(gateway.complete(MESSAGES))
+    assert gateway.is_degraded
+
+    # While open, calls fail fast without reaching the provider
+    with pytest.raises(LLMUnavailable, match="degraded"):
+        asyncio.run(gateway.complete(MESSAGES))
+    assert provider.calls == 2
+
+    clock.now = 31
+    assert not gateway.is_degraded
+    assert asyncio.run(gateway.complete(MESSAGES)) == "communication\nproblem-solving"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_failed_probe_reopens_breaker():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 10
+    assert breaker.allow()
+    # Only one probe at a time
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.is_open
+
+
+class ConcurrencyProbe(FakeProvider):
+    """Fake provider that records the most calls it saw running at once."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.active = 0
+        self.peak = 0
+
+    async def complete(self, messages, max_tokens, temperature, json_mode=False):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            return await super().complete(messages, max_tokens, temperature, json_mode)
+        finally:
+            self.active -= 1
+
+
+def _prompt(text):
+    return [{"role": "system", "content": "Extract key skills and requirements."},
+            {"role": "user", "content": text}]
+
+
+def test_identical_concurrent_requests_share_one_call():
+    provider = FakeProvider(latency=0.1)
+    gateway = LLMGateway(provider)
+    before = LLM_COALESCED_REQUESTS.snapshot().get((), 0)
+
+    async def burst():
+        return await asyncio.gather(*(gateway.complete(MESSAGES) for _ in range(5)))
+
+    assert asyncio.run(burst()) == ["communication\nproblem-solving"] * 5
+    assert provider.calls == 1
+    assert LLM_COALESCED_REQUESTS.snapshot()[()] == before + 4
+    assert gateway._inflight == {}
+
+
+def test_different_requests_are_not_coalesced():
+    provider = FakeProvider(latency=0.05)
+    gateway = LLMGateway(provider)
+
+    async def burst():
+        return await asyncio.gather(
+            gateway.complete(MESSAGES, temperature=0.3),
+            gateway.complete(MESSAGES, temperature=0.7),
+            gateway.complete(_prompt("Data engineer"), temperature=0.3)
+        )
+
+    asyncio.run(burst())
+    assert provider.calls == 3
+
+
+def test_shared_failure_reaches_every_waiter_and_is_not_reused():
+    provider = FakeProvider(latency=0.05, fail=lambda call: call == 0)
+    gateway = LLMGateway(provider, max_attempts=1)
+
+    async def burst():
+        return await asyncio.gather(*(gateway.complete(MESSAGES) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(burst())
+    assert all(isinstance(result, LLMUnavailable) for result in results)
+    assert provider.calls == 1
+    assert asyncio.run(gateway.complete(MESSAGES)) == "communication\nproblem-solving"
+
+
+def test_cancelled_waiter_does_not_cancel_the_shared_call():
+    provider = FakeProvider(latency=0.1)
+    gateway = LLMGateway(provider)
+
+    async def scenario():
+        impatient = asyncio.ensure_future(gateway.complete(MESSAGES))
+        patient = asyncio.ensure_future(gateway.complete(MESSAGES))
+        await asyncio.sleep(0.02)
+        impatient.cancel()
+        return await patient
+
+    assert asyncio.run(scenario()) == "communication\nproblem-solving"
+    assert provider.calls == 1
+
+
+def test_concurrency_limit_queues_bursts():
+    provider = ConcurrencyProbe(latency=0.05)
+    gateway = LLMGateway(provider, max_concurrency=2, hedge_after=None)
+
+    async def burst():
+        return await asyncio.gather(*(gateway.complete(_prompt(f"role {i}")) for i in range(6)))
+
+    assert len(asyncio.run(burst())) == 6
+    assert provider.peak == 2
+    assert provider.calls == 6
+
+
+def test_slow_call_is_not_hedged_without_a_free_slot():
+    provider = FakeProvider(latency=lambda call: 0.2 if call == 0 else 0)
+    gateway = LLMGateway(provider, max_concurrency=1, hedge_after=0.01)
+
+    async def burst():
+        return await asyncio.gather(gateway.complete(_prompt("slow")), gateway.complete(_prompt("queued")))
+
+    asyncio.run(burst())
+    assert provider.calls == 2
+
+
+def test_json_mode_is_part_of_the_request_identity():
+    provider = FakeProvider(latency=0.05)
+    gateway = LLMGateway(provider)
+
+    async def burst():
+        return await asyncio.gather(gateway.complete(MESSAGES), gateway.complete(MESSAGES, json_mode=True))
+
+    asyncio.run(burst())
+    assert provider.calls == 2
@@ -0,0 +1,74 @@
+# tests/test_metrics.py
+from app.metrics import PARSE_STAGE_SECONDS, Counter, Histogram, MetricsRegistry, ParseTimings, bound_label
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("stage_seconds", "Stage time.", ("stage",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, stage="contact")
+
+    series = histogram.snapshot()[("contact",)]
+    assert series["buckets"] == {0.1: 1, 1.0: 3}
+    assert series["count"] == 4
+    assert series["sum"] == 4.05
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("stage_seconds", "Stage time.", ("stage", "file_type"), buckets=(0.5,))
+    assert registry.histogram("stage_seconds", "Stage time.", ("stage", "file_type")) is histogram
+    histogram.observe(0.25, stage="skills", file_type="pdf")
+
+    assert registry.render().splitlines() == [
+        "# HELP stage_seconds Stage time.",
+        "# TYPE stage_seconds histogram",
+        'stage_seconds_bucket{stage="skills",file_type="pdf",le="0.5"} 1',
+        'stage_seconds_bucket{stage="skills",file_type="pdf",le="+Inf"} 1',
+        'stage_seconds_sum{stage="skills",file_type="pdf"} 0.25',
+        'stage_seconds_count{stage="skills",file_type="pdf"} 1',
+    ]
+
+
+def test_page_and_size_tags_are_bucketed():
+    timings = ParseTimings(".pdf", size=300 << 10, pages=3)
+
+    assert timings.tags() == {"file_type": "pdf", "pages": "4", "size_bytes": "1048576"}
+    assert bound_label(500, (1, 2)) == "+Inf"
+    assert bound_label(None, (1, 2)) == ""
+
+
+def test_parse_records_every_stage(parser, make_pdf):
+    before = PARSE_STAGE_SECONDS.snapshot()
+    parser.parse_resume(make_pdf(["Jane Doe writes Python."]), "cv.pdf")
+    after = PARSE_STAGE_SECONDS.snapshot()
+
+    recorded = {
+        key[0] for key, series in after.items()
+        if series["count"] > before.get(key, {"count": 0})["count"]
+    }
+    assert recorded == {"extract_text", "sections", "contact", "education", "experience", "skills", "summary"}
+    assert all(key[1:] == ("pdf", "1", "65536") for key in after if key[0] in recorded)
+
+
+def test_caller_supplied_timings_are_not_recorded(parser, make_pdf):
+    before = PARSE_STAGE_SECONDS.snapshot()
+    timings = ParseTimings()
+    parser.parse_resume(make_pdf(["Jane Doe"]), "cv.pdf", timings)
+
+    assert PARSE_STAGE_SECONDS.snapshot() == before
+    assert timings.file_type == ".pdf" and timings.pages == 1
+    assert set(timings.stages) >= {"extract_text", "contact", "summary"}
+
+
+def test_counter_renders_totals_per_label_set():
+    counter = Counter("lookups", "Cache lookups.", ("result",))
+    counter.inc(result="miss")
+    counter.inc(result="memory")
+    counter.inc(2, result="memory")
+
+    assert counter.render() == [
+        "# HELP lookups Cache lookups.",
+        "# TYPE lookups counter",
+        'lookups_total{result="memory"} 3',
+        'lookups_total{result="miss"} 1',
+    ]
@@ -0,0 +1,68 @@
+# tests/test_nlp_registry.py
+import gc
+import pytest
+import spacy
+from app import nlp_registry
+from app.resume_parser import ResumeParser
+
+
+def test_models_are_loaded_lazily_and_once(blank_spacy, monkeypatch):
+    loads = []
+    original = spacy.load
+    monkeypatch.setattr(spacy, "load", lambda name, **kwargs: loads.append(name) or original(name, **kwargs))
+
+    first = ResumeParser()
+    second = ResumeParser()
+    assert loads == []
+
+    assert first.nlp is second.nlp
+    assert loads == ["en_core_web_sm"]
+    assert nlp_registry.loaded_models() == [("en_core_web_sm", "full")]
+
+
+def test_preload_freezes_loaded_objects(blank_spacy):
+    try:
+        nlp_registry.preload(profiles=("full", "sentencizer"))
+        assert nlp_registry.loaded_models() == [("en_core_web_sm", "full"), ("en_core_web_sm", "sentencizer")]
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    """A small saved pipeline with the component names en_core_web_sm uses."""
+    nlp = spacy.blank("en")
+    nlp.add_pipe("tok2vec")
+    nlp.add_pipe("attribute_ruler")
+    ruler = nlp.add_pipe("entity_ruler", name="ner")
+    nlp.initialize()
+    ruler.add_patterns([{"label": "GPE", "pattern": "Seattle"}])
+    nlp.to_disk(tmp_path)
+    nlp_registry.clear()
+    yield str(tmp_path)
+    nlp_registry.clear()
+
+
+def test_ner_sentencizer_profile_keeps_only_what_parsing_needs(model_dir):
+    nlp = nlp_registry.get_nlp(model_dir, "ner_sentencizer")
+
+    # tok2vec had no listeners left once the tagger and parser were excluded
+    assert nlp.pipe_names == ["sentencizer", "ner"]
+    doc = nlp("Jane lives in Seattle. She writes Python.")
+    assert [ent.text for ent in doc.ents] == ["Seattle"]
+    assert [sent.text for sent in doc.sents] == ["Jane lives in Seattle.", "She writes Python."]
+
+
+def test_profiles_are_cached_separately(model_dir):
+    full = nlp_registry.get_nlp(model_dir, "full")
+    sentences = nlp_registry.get_nlp(model_dir, "sentencizer")
+
+    assert full.pipe_names == ["tok2vec", "attribute_ruler", "ner"]
+    assert sentences.pipe_names == ["sentencizer"]
+    assert nlp_registry.get_nlp(model_dir, "full") is full
+
+
+def test_unknown_profile_is_rejected(model_dir):
+    with pytest.raises(ValueError):
+        nlp_registry.get_nlp(model_dir, "tiny")
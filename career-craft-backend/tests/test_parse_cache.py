@@ -0,0 +1,67 @@
+# tests/test_parse_cache.py
+from app.parse_cache import ParseCache
+from app.schemas import ResumeCreate
+
+
+def _resume(title="Uploaded Resume - a.pdf"):
+    return ResumeCreate(
+        title=title,
+        summary="Engineer",
+        contact_info={"email": "jane@example.com"},
+        target_job_description="",
+        education=[],
+        experience=[],
+        skills=[],
+        projects=[],
+        achievements=[]
+    )
+
+
+def test_lru_eviction_and_counters():
+    cache = ParseCache(max_entries=2)
+    keys = [cache.key_for(data) for data in (b"one", b"two", b"three")]
+
+    cache.put(keys[0], _resume())
+    cache.put(keys[1], _resume())
+    assert cache.get(keys[0]) is not None  # keys[0] becomes most recently used
+    cache.put(keys[2], _resume())
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+    assert cache.stats() == {"hits": 2, "disk_hits": 0, "misses": 1, "entries": 2, "max_entries": 2}
+
+
+def test_disk_tier_survives_restart(tmp_path):
+    key = ParseCache().key_for(b"%PDF-1.4 resume")
+    ParseCache(cache_dir=str(tmp_path)).put(key, _resume())
+
+    restarted = ParseCache(cache_dir=str(tmp_path))
+    assert restarted.get(key) == _resume()
+    assert restarted.get(key) == _resume()
+    assert restarted.stats()["disk_hits"] == 1
+    assert restarted.stats()["hits"] == 1
+
+
+def test_cached_entries_are_isolated_from_callers():
+    cache = ParseCache()
+    key = cache.key_for(b"resume")
+    cache.put(key, _resume())
+
+    cache.get(key).contact_info["email"] = "changed@example.com"
+    assert cache.get(key).contact_info["email"] == "jane@example.com"
+
+
+def test_parser_skips_extraction_on_repeat_upload(parser, tmp_path, monkeypatch, make_pdf):
+    parser.cache = ParseCache()
+    first = tmp_path / "first.pdf"
+    second = tmp_path / "second.pdf"
+    first.write_bytes(make_pdf(["Jane Doe writes Python."]))
+    second.write_bytes(first.read_bytes())
+
+    parsed = parser.parse_resume(str(first))
+    monkeypatch.setattr(parser, "extract_text", lambda path: (_ for _ in ()).throw(AssertionError("re-parsed")))
+    repeat = parser.parse_resume(str(second))
+
+    assert repeat.title == "Uploaded Resume - second.pdf"
+    assert repeat.summary == parsed.summary
+    assert parser.cache.stats()["hits"] == 1
@@ -0,0 +1,154 @@
+# tests/test_parse_sandbox.py
+import os
+import time
+
+import pytest
+
+from app.exceptions import FileProcessingException
+from app.parse_sandbox import SandboxPool
+
+
+def _pid():
+    return os.getpid()
+
+
+def _spin():
+    while True:
+        pass
+
+
+def _balloon():
+    hog = bytearray(256 << 20)
+    hog[::4096] = b"x" * len(hog[::4096])
+    time.sleep(5)
+    return len(hog)
+
+
+def _allocate(size):
+    hog = bytearray(size)
+    return len(hog)
+
+
+def _spin_swallowing_errors():
+    # Like a parser that skips any entry it fails on
+    while True:
+        try:
+            sum(range(10000))
+        except Exception:
+            pass
+
+
+def _spin_swallowing_everything():
+    started = time.process_time()
+    try:
+        while time.process_time() - started < 1:
+            pass
+    except BaseException:
+        pass
+    return "finished"
+
+
+def _crash():
+    os._exit(1)
+
+
+def _sleep():
+    time.sleep(5)
+
+
+def _fail():
+    raise ValueError("Unsupported file format")
+
+
+def _hang_once(marker):
+    """Initializer that deadlocks the first worker only."""
+    if not os.path.exists(marker):
+        open(marker, "w").close()
+        time.sleep(60)
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def make(**limits):
+        pool = SandboxPool(max_workers=1, **limits)
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.shutdown(cancel_futures=True)
+
+
+def test_cpu_limit_fails_job_and_pool_keeps_working(make_pool):
+    pool = make_pool(cpu_seconds=0.2, wall_seconds=10)
+
+    with pytest.raises(FileProcessingException, match="took too long"):
+        pool.submit(_spin).result(timeout=10)
+    assert pool.submit(_pid).result(timeout=10) != os.getpid()
+
+
+def test_cpu_limit_is_not_swallowed_by_the_job(make_pool):
+    pool = make_pool(cpu_seconds=0.2, wall_seconds=10)
+
+    with pytest.raises(FileProcessingException, match="took too long"):
+        pool.submit(_spin_swallowing_errors).result(timeout=10)
+    with pytest.raises(FileProcessingException, match="took too long"):
+        pool.submit(_spin_swallowing_everything).result(timeout=10)
+
+
+def test_address_space_cap_stops_allocations_between_polls(make_pool):
+    pool = make_pool(max_job_rss_mb=64, wall_seconds=10)
+
+    # Returns before the parent's RSS poll could see it, so only the cap can stop it
+    with pytest.raises(FileProcessingException, match="too much memory"):
+        pool.submit(_allocate, 1 << 30).result(timeout=10)
+    assert pool.submit(_allocate, 1 << 20).result(timeout=10) == 1 << 20
+
+
+def test_memory_limit_kills_runaway_job(make_pool):
+    pool = make_pool(max_job_rss_mb=64, wall_seconds=10)
+
+    with pytest.raises(FileProcessingException, match="too much memory"):
+        pool.submit(_balloon).result(timeout=10)
+    assert pool.submit(_pid).result(timeout=10)
+
+
+def test_wall_clock_limit_and_crashes_fail_fast(make_pool):
+    pool = make_pool(wall_seconds=0.3)
+
+    started = time.monotonic()
+    with pytest.raises(FileProcessingException, match="took too long"):
+        pool.submit(_sleep).result(timeout=10)
+    assert time.monotonic() - started < 3
+
+    with pytest.raises(FileProcessingException, match="crashed"):
+        pool.submit(_crash).result(timeout=10)
+    assert pool.submit(_pid).result(timeout=10)
+
+
+def test_parse_errors_pass_through_without_replacing_worker(make_pool):
+    pool = make_pool()
+    pid = pool.submit(_pid).result(timeout=10)
+
+    with pytest.raises(ValueError, match="Unsupported"):
+        pool.submit(_fail).result(timeout=10)
+    assert pool.submit(_pid).result(timeout=10) == pid
+
+
+def test_workers_are_recycled_after_max_jobs(make_pool):
+    pool = make_pool(max_jobs_per_worker=2)
+
+    pids = [pool.submit(_pid).result(timeout=10) for _ in range(4)]
+    assert pids[0] == pids[1] != pids[2] == pids[3]
+
+
+def test_worker_hung_in_start_up_is_replaced(make_pool, tmp_path):
+    pool = make_pool(initializer=_hang_once, initargs=(str(tmp_path / "hung"),), wall_seconds=1)
+
+    started = time.monotonic()
+    with pytest.raises(FileProcessingException, match="took too long"):
+        pool.submit(_pid).result(timeout=10)
+    assert time.monotonic() - started < 5
+    assert pool.submit(_pid).result(timeout=10) != os.getpid()
@@ -0,0 +1,177 @@
+# tests/test_resume_analyzer.py
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.llm_cache import LLMResponseCache
+from app.llm_gateway import CircuitBreaker, FakeProvider, LLMGateway
+from app.resume_analyzer import ResumeAnalyzer
+from app.semantic_index import SemanticJobIndex
+
+FEEDBACK_JSON = json.dumps({
+    "overall_score": 72.0,
+    "suggestions": ["Quantify impact"],
+    "missing_skills": ["Docker"],
+    "improvement_areas": {"experience": ["Add metrics"]}
+})
+
+
+class RecordingProvider(FakeProvider):
+    """Fake provider that also logs when each call starts."""
+
+    def __init__(self, **kwargs):
+        super().__init__(responses={
+            "JSON": FEEDBACK_JSON,
+            "Extract key skills": "python (e.g., django)\nprogramming (e.g., python, java)"
+        }, **kwargs)
+        self.log = []
+
+    async def complete(self, messages, max_tokens, temperature, json_mode=False):
+        self.log.append(("start", messages[0]["content"], json_mode))
+        return await super().complete(messages, max_tokens, temperature, json_mode)
+
+
+def _resume():
+    return SimpleNamespace(
+        contact_info={"email": "jane@example.com"},
+        summary="Backend engineer",
+        education=[],
+        experience=[],
+        skills=[SimpleNamespace(name="Programming (e.g., Python, Java)", category="Technical")],
+        projects=[],
+        achievements=[]
+    )
+
+
+def _analyzer(provider, **gateway_options):
+    return ResumeAnalyzer(gateway=LLMGateway(provider, **gateway_options))
+
+
+def test_skill_extraction_runs_alongside_analysis():
+    completions = RecordingProvider(latency=0.2)
+    analyzer = _analyzer(completions)
+
+    started = time.perf_counter()
+    feedback = asyncio.run(analyzer.analyze_resume(_resume(), "Backend engineer, Python"))
+    elapsed = time.perf_counter() - started
+
+    # One round trip: structured feedback and skill extraction run side by side
+    assert elapsed < 0.35
+    assert completions.log == [
+        ("start", "You are an expert resume reviewer and career counselor. Reply with a single JSON object.", True),
+        ("start", "Extract key skills and requirements.", False)
+    ]
+    assert feedback.overall_score == 72.0
+    assert feedback.missing_skills == ["Docker"]
+    assert feedback.job_recommendations[0].required_skills[0] == "Programming (e.g., Python, Java)"
+
+
+def test_analysis_failure_still_returns_recommendations():
+    provider = RecordingProvider()
+    provider.fail = lambda call: "expert resume reviewer" in provider.prompts[call]
+    analyzer = _analyzer(provider, max_attempts=1)
+
+    feedback = asyncio.run(analyzer.analyze_resume(_resume(), "Backend engineer"))
+
+    assert feedback.overall_score == 0.0
+    assert feedback.suggestions == ["Error analyzing resume. Please try again."]
+    assert len(feedback.job_recommendations) == 5
+
+
+def test_skill_extraction_failure_leaves_feedback_intact():
+    provider = RecordingProvider()
+    provider.fail = lambda call: "Extract key skills" in provider.prompts[call]
+    analyzer = _analyzer(provider, max_attempts=1)
+
+    feedback = asyncio.run(analyzer.analyze_resume(_resume(), "Backend engineer"))
+
+    assert feedback.overall_score == 72.0
+    assert feedback.job_recommendations == []
+
+
+def test_open_breaker_falls_back_without_calling_provider():
+    provider = RecordingProvider(latency=5)
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure()
+    analyzer = _analyzer(provider, breaker=breaker)
+
+    started = time.perf_counter()
+    feedback = asyncio.run(analyzer.analyze_resume(_resume(), "Backend engineer"))
+
+    assert time.perf_counter() - started < 0.5
+    assert provider.calls == 0
+    assert feedback.suggestions == ["Error analyzing resume. Please try again."]
+
+
+def test_repeat_analysis_makes_no_provider_calls():
+    provider = RecordingProvider()
+    analyzer = ResumeAnalyzer(gateway=LLMGateway(provider, cache=LLMResponseCache()))
+
+    first = asyncio.run(analyzer.analyze_resume(_resume(), "Backend engineer, Python"))
+    calls = provider.calls
+    second = asyncio.run(analyzer.analyze_resume(_resume(), "Backend engineer, Python"))
+
+    assert calls == 2
+    assert provider.calls == calls
+    assert second == first
+
+
+def test_malformed_feedback_is_repaired_without_another_call():
+    provider = RecordingProvider()
+    provider.responses["JSON"] = (
+        'Here is the feedback:\n```json\n{"overall_score": 120, "suggestions": ["Quantify impact",],'
+        ' "missing_skills": ["Docker"], "improvement_areas": {"experience": ["Add metrics"]}}\n```'
+    )
+    analyzer = _analyzer(provider)
+
+    feedback = asyncio.run(analyzer.analyze_resume(_resume(), "Backend engineer"))
+
+    assert provider.calls == 2
+    assert feedback.overall_score == 100.0
+    assert feedback.suggestions == ["Quantify impact"]
+    assert feedback.improvement_areas == {"experience": ["Add metrics"]}
+
+
+def test_unrecoverable_feedback_falls_back():
+    provider = RecordingProvider()
+    provider.responses["JSON"] = "I could not review this resume."
+    analyzer = _analyzer(provider)
+
+    feedback = asyncio.run(analyzer.analyze_resume(_resume(), "Backend engineer"))
+
+    assert feedback.overall_score == 50.0
+    assert feedback.suggestions == ["Unable to generate detailed feedback. Please try again."]
+    assert len(feedback.job_recommendations) == 5
+
+
+def test_semantic_index_ranks_jobs_that_exact_matching_misses():
+    index = SemanticJobIndex.build(ResumeAnalyzer(gateway=LLMGateway(FakeProvider())).recommender.jobs)
+    resume = _resume()
+    resume.skills = [SimpleNamespace(name="Python", category="Technical")]
+    provider = RecordingProvider()
+    provider.responses["Extract key skills"] = "python\ngit"
+
+    exact = _analyzer(provider)
+    semantic = ResumeAnalyzer(gateway=LLMGateway(provider), semantic_index=index)
+
+    assert asyncio.run(exact.analyze_resume(resume, "Python developer")).job_recommendations[0].match_score == 0.0
+    best = asyncio.run(semantic.analyze_resume(resume, "Python developer")).job_recommendations[0]
+    assert best.title == "Software Engineer"
+    assert best.match_score > 0
+
+
+def test_recommender_is_not_built_when_a_semantic_index_is_configured(monkeypatch):
+    from app import resume_analyzer
+
+    index = SemanticJobIndex.build(ResumeAnalyzer(gateway=LLMGateway(FakeProvider())).recommender.jobs)
+    monkeypatch.setattr(resume_analyzer, "get_job_recommender", lambda: pytest.fail("recommender was built"))
+    resume = _resume()
+    resume.skills = [SimpleNamespace(name="Python", category="Technical")]
+    provider = RecordingProvider()
+    provider.responses["Extract key skills"] = "python\ngit"
+    analyzer = ResumeAnalyzer(gateway=LLMGateway(provider), semantic_index=index)
+
+    assert len(asyncio.run(analyzer.analyze_resume(resume, "Python developer")).job_recommendations) == 5
@@ -0,0 +1,197 @@
+# tests/test_resume_parser.py
+import pytest
+
+
+@pytest.fixture
+def long_pdf(tmp_path, make_pdf):
+    path = tmp_path / "portfolio.pdf"
+    path.write_bytes(make_pdf([f"Page{i}" for i in range(12)]))
+    return str(path)
+
+
+def test_parallel_pdf_extraction_keeps_page_order(parser, long_pdf):
+    text = parser.extract_text_from_pdf(long_pdf)
+
+    assert parser._pdf_pool is not None
+    assert [chunk for chunk in text.split("Page") if chunk] == [str(i) for i in range(12)]
+
+
+def test_short_pdf_is_extracted_serially(parser, tmp_path, make_pdf):
+    path = tmp_path / "short.pdf"
+    path.write_bytes(make_pdf(["Hello", "World"]))
+
+    assert parser.extract_text_from_pdf(str(path)) == "HelloWorld"
+    assert parser._pdf_pool is None
+
+
+def test_pdf_page_cap(parser, long_pdf):
+    parser.max_pdf_pages = 3
+
+    assert parser.extract_text_from_pdf(long_pdf) == "Page0Page1Page2"
+
+
+SAMPLE_RESUME = """Jane Doe
+jane@example.com | (555) 123-4567
+
+Education
+Bachelor of Science, State University
+GPA: 3.80
+
+Work Experience
+Acme Corp
+Software Engineer
+Jan 2019 - Mar 2022
+- Built billing services
+
+Skills
+Python, SQL | Docker
+
+Projects
+Resume parser
+"""
+
+
+def test_segment_sections_single_pass(parser):
+    sections = parser.segment_sections(SAMPLE_RESUME)
+
+    assert set(sections) == {'education', 'experience', 'skills', 'projects'}
+    assert sections['education'].startswith("Education\nBachelor")
+    assert sections['experience'].startswith("Work Experience\nAcme Corp")
+    assert sections['skills'] == "Skills\nPython, SQL | Docker"
+
+
+def test_segment_sections_matches_legacy_scan(parser):
+    from benchmarks.bench_sections import legacy_extract_section, make_resume
+
+    text = make_resume(50)
+    sections = parser.segment_sections(text)
+    for name in ('education', 'experience', 'skills', 'achievements'):
+        assert sections.get(name) == legacy_extract_section(text, parser.sections[name])
+
+    # The legacy scan cut "Personal Projects" short at the nested "Projects" match
+    assert legacy_extract_section(text, parser.sections['projects']) == "Personal"
+    assert sections['projects'].startswith("Personal Projects\nProject 0")
+
+
+def test_extractors_share_section_map(parser, monkeypatch):
+    sections = parser.segment_sections(SAMPLE_RESUME)
+    monkeypatch.setattr(parser, "segment_sections", lambda text: pytest.fail("rescanned"))
+
+    assert [s["name"] for s in parser.extract_skills(SAMPLE_RESUME, sections)] == ["Skills", "Python", "SQL", "Docker"]
+    assert isinstance(parser.extract_education(SAMPLE_RESUME, sections), list)
+    assert isinstance(parser.extract_experience(SAMPLE_RESUME, sections), list)
+
+
+def test_parse_runs_nlp_pipeline_once(parser, tmp_path, make_pdf):
+    ruler = parser.nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([{"label": "GPE", "pattern": "Seattle"}])
+    calls = []
+    nlp = parser.nlp
+    parser.nlp = lambda text: calls.append(text) or nlp(text)
+
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(make_pdf(["Jane Doe lives in Seattle. She writes Python."]))
+    resume = parser.parse_resume(str(path))
+
+    assert len(calls) == 1
+    assert resume.contact_info["location"] == "Seattle"
+    assert resume.summary == "Jane Doe lives in Seattle. She writes Python."
+
+
+def test_parse_many_matches_single_file_parsing(parser, tmp_path, make_pdf):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"resume_{i}.pdf"
+        path.write_bytes(make_pdf([f"Candidate {i} writes Python. Skills", "Python, SQL"]))
+        paths.append(str(path))
+
+    batch = list(parser.parse_many(iter(paths), batch_size=2))
+
+    assert [resume.title for resume in batch] == [f"Uploaded Resume - resume_{i}.pdf" for i in range(5)]
+    assert batch == [parser.parse_resume(path) for path in paths]
+
+
+def test_parse_many_skips_unreadable_files(parser, tmp_path, make_pdf):
+    paths = []
+    for name in ("first.pdf", "corrupt.pdf", "last.pdf"):
+        path = tmp_path / name
+        path.write_bytes(b"%PDF-1.4 not really a pdf" if name == "corrupt.pdf" else make_pdf([f"{name} writes Python."]))
+        paths.append(str(path))
+    failures = []
+
+    batch = list(parser.parse_many(paths, batch_size=2, on_error=lambda name, error: failures.append(name)))
+
+    assert [resume.title for resume in batch] == ["Uploaded Resume - first.pdf", "Uploaded Resume - last.pdf"]
+    assert failures == ["corrupt.pdf"]
+
+
+def test_parse_from_in_memory_sources(parser, make_pdf):
+    import io
+
+    data = make_pdf(["Jane Doe writes Python."])
+    by_bytes = parser.parse_resume(data, "jane.pdf")
+
+    assert by_bytes.title == "Uploaded Resume - jane.pdf"
+    assert parser.parse_resume(memoryview(data), "jane.pdf") == by_bytes
+    # Without a filename the type is sniffed from the magic bytes
+    assert parser.parse_resume(io.BytesIO(data)).summary == by_bytes.summary
+
+
+def test_parse_docx_from_file_like(parser):
+    import io
+    from docx import Document
+
+    document = Document()
+    document.add_paragraph("Jane Doe writes Python.")
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    resume = parser.parse_resume(buffer, "jane.docx")
+    assert resume.summary.strip() == "Jane Doe writes Python."
+
+
+def test_parallel_pdf_extraction_from_bytes(parser, make_pdf):
+    data = make_pdf([f"Page{i}" for i in range(6)])
+
+    assert parser.extract_text_from_pdf(data) == "".join(f"Page{i}" for i in range(6))
+    assert parser._pdf_pool is not None
+
+
+def test_experience_entries_split_by_line(parser):
+    entries = parser.extract_experience(SAMPLE_RESUME)
+
+    assert len(entries) == 1
+    assert entries[0]["company"] == "Acme Corp"
+    assert entries[0]["position"] == "Software Engineer"
+    assert (entries[0]["start_date"].year, entries[0]["end_date"].year) == (2019, 2022)
+    assert entries[0]["highlights"] == ["Built billing services"]
+
+
+def test_experience_splitter_entry_boundaries(parser):
+    section = "\n".join([
+        "Work Experience",
+        "Acme Corp",
+        "Software Engineer",
+        "Jan 2019 - Mar 2022",
+        "Led a team of five engineers on payments.",
+        "Globex Inc.  06/2016 - 12/2018",
+        "Data Analyst",
+        "Built dashboards",
+        "Initech",
+        "Intern",
+        "- Migrated records"
+    ])
+
+    assert [entry[:2] for entry in parser.experience_splitter.split(section)] == [
+        ["Acme Corp", "Software Engineer"],
+        ["Globex Inc.  06/2016 - 12/2018", "Data Analyst"],
+        ["Initech", "Intern"]
+    ]
+
+
+def test_experience_splitter_handles_capitalized_runs(parser):
+    from benchmarks.bench_experience import capitalized_lines, capitalized_runs
+
+    # Inputs that made the legacy lookahead split quadratic
+    assert len(parser.experience_splitter.split(capitalized_lines(20000))) == 1
+    assert len(parser.experience_splitter.split(capitalized_runs(20000))) == 1
@@ -0,0 +1,152 @@
+# tests/test_semantic_index.py
+import json
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from app.semantic_index import SemanticJobIndex, job_document, load_or_build_semantic_index
+from app.skill_matcher import JOBS_PATH
+
+
+@pytest.fixture(scope="module")
+def jobs():
+    with open(JOBS_PATH) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="module")
+def index(jobs):
+    return SemanticJobIndex.build(jobs)
+
+
+def test_skill_matches_jobs_that_mention_it_inside_a_phrase(index):
+    top = index.top([("python", 1.0)], k=5)
+
+    mentions = [job for job, score in top if score > 0]
+    assert {job["title"] for job in mentions} == {"Data Scientist", "Software Engineer", "AI/ML Engineer", "DevOps Engineer"}
+    assert all("python" in " ".join(job["requiredSkills"]).lower() for job in mentions)
+
+
+def test_query_vectors_match_the_fitted_vectorizer(index, jobs):
+    vectorizer = SemanticJobIndex._vectorizer()
+    vectorizer.fit([job_document(job) for job in jobs])
+    text = "Python python Git, team leadership and C++"
+
+    expected = vectorizer.transform([text]).toarray()[0]
+    columns, weights = index.vectorize(text)
+    got = np.zeros(len(expected))
+    got[columns] = weights
+    assert np.allclose(got, expected)
+
+
+def test_weighted_queries_sum_cosines(index):
+    combined = index.similarities([("python", 0.7), ("patient care", 0.3)])
+    separate = 0.7 * index.similarities([("python", 1.0)]) + 0.3 * index.similarities([("patient care", 1.0)])
+    assert np.allclose(combined, separate)
+
+
+def test_unknown_terms_score_nothing(index):
+    assert not index.similarities([("zzzz qqqq", 1.0), ("", 0.5)]).any()
+    assert [job["title"] for job, _ in index.top([("zzzz", 1.0)], k=2)] == [index.jobs[0]["title"], index.jobs[1]["title"]]
+
+
+def test_saved_index_is_memory_mapped_and_equivalent(index, tmp_path):
+    index.save(str(tmp_path / "index"))
+    loaded = SemanticJobIndex.load(str(tmp_path / "index"))
+
+    base = loaded.matrix.data
+    while not isinstance(base, np.memmap):
+        base = base.base
+    assert not loaded.matrix.data.flags.writeable
+    queries = [("python sql", 0.7), ("data analysis", 0.3)]
+    assert np.allclose(loaded.similarities(queries), index.similarities(queries))
+
+
+def test_saved_jobs_and_vocabulary_are_mapped_not_parsed(jobs, tmp_path):
+    index = SemanticJobIndex.build(jobs)
+    index.save(str(tmp_path / "index"))
+    loaded = SemanticJobIndex.load(str(tmp_path / "index"))
+
+    with open(tmp_path / "index" / "meta.json") as f:
+        assert set(json.load(f)) == {"fingerprint", "shape", "layout"}
+    assert isinstance(loaded.jobs.stored.blob, np.memmap) and isinstance(loaded.vocabulary.terms.blob, np.memmap)
+    assert list(loaded.jobs) == jobs and loaded.jobs[-1] == jobs[-1]
+    assert dict(loaded.vocabulary) == index.vocabulary
+    assert "python" in loaded.vocabulary and "not a term" not in loaded.vocabulary
+    assert loaded.vectorize("Python and SQL")[0].tolist() == index.vectorize("Python and SQL")[0].tolist()
+
+
+def test_added_jobs_are_stacked_once_per_batch(jobs, tmp_path):
+    SemanticJobIndex.build(jobs).save(str(tmp_path / "index"))
+    index = SemanticJobIndex.load(str(tmp_path / "index"))
+    added = [dict(job) for job in jobs[:3]]
+
+    ids = [index.add_job(job) for job in added]
+    scores = index.similarities([("python", 1.0)])
+    stacked = index._added
+    assert stacked.shape[0] == 3 and index._added_rows == []
+    assert np.allclose(scores[ids], scores[:3])
+    index.similarities([("sql", 1.0)])
+    assert index._added is stacked
+    # The memory-mapped matrix is left as it was
+    assert index.matrix.shape[0] == len(jobs) and not index.matrix.data.flags.writeable
+
+
+def test_index_is_rebuilt_when_jobs_change(jobs, tmp_path):
+    jobs_path = tmp_path / "jobs.json"
+    jobs_path.write_text(json.dumps(jobs[:10]))
+    directory = str(tmp_path / "index")
+
+    first = load_or_build_semantic_index(directory, str(jobs_path))
+    assert len(first.jobs) == 10
+    assert load_or_build_semantic_index(directory, str(jobs_path)).fingerprint == first.fingerprint
+
+    jobs_path.write_text(json.dumps(jobs[:12]))
+    assert len(load_or_build_semantic_index(directory, str(jobs_path)).jobs) == 12
+
+
+def test_current_index_is_loaded_without_rebuilding(jobs, tmp_path, monkeypatch):
+    jobs_path = tmp_path / "jobs.json"
+    jobs_path.write_text(json.dumps(jobs[:10]))
+    directory = str(tmp_path / "index")
+    load_or_build_semantic_index(directory, str(jobs_path))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("rebuilt a current index")
+
+    monkeypatch.setattr(SemanticJobIndex, "build", fail)
+    # Touching the file without changing its bytes keeps the index current
+    jobs_path.write_text(json.dumps(jobs[:10]))
+    assert len(load_or_build_semantic_index(directory, str(jobs_path)).jobs) == 10
+
+
+def _load_or_build_in_worker(directory, jobs_path, log_path):
+    build = SemanticJobIndex.build.__func__
+
+    def logged_build(cls, *args, **kwargs):
+        with open(log_path, "a") as f:
+            f.write("built\n")
+        return build(cls, *args, **kwargs)
+
+    SemanticJobIndex.build = classmethod(logged_build)
+    assert len(load_or_build_semantic_index(directory, jobs_path).jobs) == 10
+
+
+def test_only_one_worker_builds_a_missing_index(jobs, tmp_path):
+    jobs_path = tmp_path / "jobs.json"
+    jobs_path.write_text(json.dumps(jobs[:10]))
+    log_path = tmp_path / "builds.log"
+    log_path.touch()
+    context = multiprocessing.get_context("fork")
+    workers = [
+        context.Process(target=_load_or_build_in_worker, args=(str(tmp_path / "index"), str(jobs_path), str(log_path)))
+        for _ in range(4)
+    ]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+
+    assert all(process.exitcode == 0 for process in workers)
+    assert log_path.read_text() == "built\n"
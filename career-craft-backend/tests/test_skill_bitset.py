@@ -0,0 +1,47 @@
+# tests/test_skill_bitset.py
+import random
+
+import numpy as np
+
+from app.skill_bitset import (
+    SkillInterner, intersection_counts, normalize_skill, pack, pack_many, popcount, words_for
+)
+
+
+def test_interner_assigns_dense_ids_to_normalized_names():
+    interner = SkillInterner(["Python", "  Machine   Learning ", "python"])
+
+    assert len(interner) == 2
+    assert interner.get("PYTHON") == 0
+    assert interner.get("machine learning") == 1
+    assert interner.get("rust") is None
+    assert "Machine Learning" in interner
+    assert interner.ids(["rust", "Machine Learning", "python", "Python"]) == [0, 1]
+    assert list(interner) == ["python", "machine learning"]
+    assert normalize_skill("\tNode.JS \n") == "node.js"
+
+
+def test_pack_sets_one_bit_per_id_across_words():
+    bits = pack([0, 63, 64, 130], words_for(131))
+
+    assert bits.dtype == np.uint64
+    assert bits.tolist() == [1 | (1 << 63), 1, 1 << 2]
+    assert popcount(bits) == 4
+
+
+def test_pack_many_keeps_empty_sets():
+    bits = pack_many([[1, 2], [], [70]], words_for(71))
+
+    assert bits.shape == (3, 2)
+    assert popcount(bits).tolist() == [2, 0, 1]
+
+
+def test_intersection_counts_match_python_sets():
+    rng = random.Random(11)
+    size = 300
+    sets = [set(rng.sample(range(size), rng.randint(0, 40))) for _ in range(50)]
+    query = set(rng.sample(range(size), 25))
+    words = words_for(size)
+
+    counts = intersection_counts(pack_many(sets, words), pack(query, words))
+    assert counts.tolist() == [len(s & query) for s in sets]
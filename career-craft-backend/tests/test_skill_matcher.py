@@ -0,0 +1,118 @@
+# tests/test_skill_matcher.py
+import os
+
+from app.skill_matcher import SkillMatcher, build_skill_matcher, load_vocabulary, terms_from_job_skill
+
+
+def _names(skills):
+    return [skill["name"] for skill in skills]
+
+
+def test_finds_whole_words_case_insensitively():
+    matcher = SkillMatcher([("Go", "Technical"), ("SQL", "Technical"), ("C++", "Technical")])
+
+    assert _names(matcher.find("Used GO, sql and c++ at Google; NoSQL too")) == ["Go", "SQL", "C++"]
+
+
+def test_prefers_longest_overlapping_skill():
+    matcher = SkillMatcher([
+        ("Spring", "Technical"),
+        ("Spring Boot", "Technical"),
+        ("Boot", "Technical"),
+        ("Machine learning", "Technical"),
+        ("Learning", "Technical")
+    ])
+
+    assert _names(matcher.find("Spring Boot services; machine learning")) == ["Spring Boot", "Machine learning"]
+    assert _names(matcher.find("Spring release, continuous learning")) == ["Spring", "Learning"]
+
+
+def test_matches_terms_sharing_suffixes():
+    # "he", "she" and "hers" exercise failure and dictionary-suffix links
+    matcher = SkillMatcher([("he", "X"), ("she", "X"), ("hers", "X"), ("ushers", "X")])
+
+    assert _names(matcher.find("ushers she he hers")) == ["ushers", "she", "he", "hers"]
+
+
+def test_first_spelling_wins_and_order_follows_text():
+    matcher = SkillMatcher([("PostgreSQL", "Technical"), ("Leadership", "Soft Skills")])
+    matcher.add("postgresql", "Other")
+
+    assert len(matcher) == 2
+    assert matcher.find("Leadership of a PostgreSQL migration, more postgresql") == [
+        {"name": "Leadership", "category": "Soft Skills"},
+        {"name": "PostgreSQL", "category": "Technical"}
+    ]
+
+
+def test_terms_from_job_skill():
+    assert terms_from_job_skill("Programming (e.g., Python, Java)") == ["Programming", "Python", "Java"]
+    assert terms_from_job_skill("HTML/CSS/JavaScript") == ["HTML", "CSS", "JavaScript"]
+    assert terms_from_job_skill("UI/UX principles") == ["UI/UX principles"]
+    assert terms_from_job_skill("Data analysis (e.g., Python, R)") == ["Data analysis", "Python"]
+
+
+def test_vocabulary_file(tmp_path):
+    path = tmp_path / "skills.txt"
+    path.write_text("# comment\nPython\n\n[Soft Skills]\nTeamwork\n[Technical]\nC#\n~Swift\n")
+
+    assert load_vocabulary(str(path)) == [
+        ("Python", "Technical", False), ("Teamwork", "Soft Skills", False),
+        ("C#", "Technical", False), ("Swift", "Technical", True)
+    ]
+
+
+def test_bundled_matcher_covers_job_skills():
+    matcher = build_skill_matcher()
+
+    assert "Python" in matcher and "Kubernetes" in matcher and "Empathy" in matcher
+    assert _names(matcher.find("Deployed Django apps to Kubernetes on AWS")) == ["Django", "Kubernetes", "AWS"]
+
+
+def test_parser_picks_up_skills_outside_skills_section(parser):
+    text = "Experience\nAcme\nBuilt Django services on Kubernetes\n\nSkills\nPython, Django\n"
+    skills = parser.extract_skills(text)
+
+    assert _names(skills) == ["Skills", "Python", "Django", "Kubernetes"]
+    assert skills[-1] == {"name": "Kubernetes", "category": "Technical", "proficiency_level": None}
+
+
+def test_ambiguous_skills_need_exact_case_and_can_be_excluded():
+    matcher = SkillMatcher([("Swift", "Technical", True), ("Python", "Technical")])
+
+    assert _names(matcher.find("swift delivery in python")) == ["Python"]
+    assert _names(matcher.find("Swift and Python")) == ["Swift", "Python"]
+    assert _names(matcher.find("Swift and Python", include_ambiguous=False)) == ["Python"]
+
+
+def test_parser_ignores_common_words_outside_skill_sections(parser):
+    text = (
+        "Julia Ruby\njulia@example.com | 12 Swift Street\n\n"
+        "Summary\nVolunteer at a nonprofit organization; check my outlook, rest and unity. Swift delivery.\n\n"
+        "Experience\nAcme\nShipped iOS apps in Swift\n\n"
+        "Skills\nPython\n"
+    )
+
+    names = _names(parser.extract_skills(text))
+    assert "Swift" in names and "Python" in names
+    assert not {"Julia", "Ruby", "Organization", "Outlook", "REST", "Unity"} & set(names)
+
+
+def test_bundled_vocabulary_marks_common_words_ambiguous():
+    matcher = build_skill_matcher()
+
+    assert _names(matcher.find("Julia Ruby: nonprofit organization, outlook, rest, unity, Swift delivery",
+                               include_ambiguous=False)) == []
+
+
+def test_build_locks_are_reset_in_forked_children():
+    from app import skill_matcher
+
+    matcher = SkillMatcher([("Python", "Technical")])
+    with skill_matcher._default_lock, matcher._lock:
+        pid = os.fork()
+        if pid == 0:
+            # Child: locks held by the parent's thread must be free here
+            os._exit(0 if not skill_matcher._default_lock.locked() and not matcher._lock.locked() else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
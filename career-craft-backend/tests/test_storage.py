@@ -0,0 +1,84 @@
+# tests/test_storage.py
+import multiprocessing
+import os
+
+import pytest
+
+from app.storage import atomic_directory
+
+
+def test_directory_is_replaced_only_when_the_block_completes(tmp_path):
+    directory = str(tmp_path / "index")
+    with atomic_directory(directory) as staging:
+        open(os.path.join(staging, "v1"), "w").close()
+    assert os.listdir(directory) == ["v1"]
+
+    with pytest.raises(RuntimeError):
+        with atomic_directory(directory) as staging:
+            open(os.path.join(staging, "v2"), "w").close()
+            raise RuntimeError("write failed")
+    assert os.listdir(directory) == ["v1"]
+
+    with atomic_directory(directory) as staging:
+        open(os.path.join(staging, "v3"), "w").close()
+    assert os.listdir(directory) == ["v3"]
+    with atomic_directory(directory) as staging:
+        open(os.path.join(staging, "v4"), "w").close()
+    assert os.listdir(directory) == ["v4"]
+    # Only the link, its lock, the current version and the one before it are left
+    versions = [entry for entry in os.listdir(tmp_path) if entry.startswith(".staging-index-")]
+    assert os.path.islink(directory) and os.readlink(directory) in versions and len(versions) == 2
+    assert sorted(set(os.listdir(tmp_path)) - set(versions)) == ["index", "index.lock"]
+
+
+def test_directory_written_before_versioning_is_replaced(tmp_path):
+    directory = tmp_path / "index"
+    directory.mkdir()
+    (directory / "old").touch()
+
+    with atomic_directory(str(directory)) as staging:
+        open(os.path.join(staging, "new"), "w").close()
+
+    assert os.path.islink(directory) and os.listdir(directory) == ["new"]
+
+
+def test_reader_of_the_previous_version_can_finish_after_a_swap(tmp_path):
+    directory = str(tmp_path / "index")
+    _swap(directory, "first", 1)
+    resolved = os.path.realpath(directory)
+
+    _swap(directory, "second", 1)
+
+    with open(os.path.join(resolved, "version")) as f:
+        assert f.read() == "first-0"
+    with open(os.path.join(directory, "version")) as f:
+        assert f.read() == "second-0"
+
+
+def _swap(directory, writer, swaps):
+    for swap in range(swaps):
+        with atomic_directory(directory) as staging:
+            with open(os.path.join(staging, "version"), "w") as f:
+                f.write(f"{writer}-{swap}")
+
+
+def test_concurrent_writers_and_readers_never_see_a_missing_directory(tmp_path):
+    directory = str(tmp_path / "index")
+    _swap(directory, "first", 1)
+    context = multiprocessing.get_context("fork")
+    writers = [context.Process(target=_swap, args=(directory, writer, 50)) for writer in range(4)]
+    for process in writers:
+        process.start()
+
+    checks = 0
+    while any(process.is_alive() for process in writers):
+        # The link is swapped in one rename, so there is no moment without it
+        assert os.path.islink(directory)
+        checks += 1
+    for process in writers:
+        process.join()
+
+    assert checks and all(process.exitcode == 0 for process in writers)
+    with open(os.path.join(directory, "version")) as f:
+        assert f.read().endswith("-49")
+    assert len([entry for entry in os.listdir(tmp_path) if entry.startswith(".staging-index-")]) == 2
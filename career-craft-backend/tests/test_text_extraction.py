@@ -0,0 +1,138 @@
+# tests/test_text_extraction.py
+import io
+import zipfile
+
+import pytest
+
+from app.text_extraction import (
+    BACKENDS, DocxXmlBackend, ExtractionBackend, ExtractionPolicy, get_backend
+)
+from app.resume_parser import ResumeParser
+from benchmarks.bench_extraction import build_docx
+
+
+def _docx_with_layout():
+    document = (
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+        '<w:p><w:r><w:t>Jane</w:t></w:r><w:r><w:tab/><w:t>Doe</w:t></w:r></w:p>'
+        '<w:p><w:r><w:t>Line one</w:t><w:br/><w:t>Line two</w:t></w:r></w:p>'
+        '<w:p/><w:p><w:r><w:t xml:space="preserve"> Skills </w:t></w:r></w:p>'
+        '</w:body></w:document>'
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", document)
+        archive.writestr("word/media/image1.png", b"\x89PNG" + b"\0" * 1024)
+    return buffer.getvalue()
+
+
+def test_streaming_docx_reader_matches_docx2txt():
+    data = _docx_with_layout()
+
+    expected = get_backend("docx2txt").extract(io.BytesIO(data))
+    assert get_backend("docx_xml").extract(io.BytesIO(data)) == expected
+    assert expected.startswith("Jane\tDoe\n\nLine one\nLine two")
+
+
+def test_streaming_docx_reader_only_opens_document_part(monkeypatch):
+    data = build_docx(["Python"], media_bytes=1 << 16)
+    opened = []
+    original_open = zipfile.ZipFile.open
+
+    def recording_open(self, name, *args, **kwargs):
+        opened.append(getattr(name, "filename", name))
+        return original_open(self, name, *args, **kwargs)
+
+    monkeypatch.setattr(zipfile.ZipFile, "open", recording_open)
+    DocxXmlBackend().extract(io.BytesIO(data))
+
+    assert opened == ["word/document.xml"]
+
+
+@pytest.mark.parametrize("name", ["pypdf2", "pypdf"])
+def test_pdf_backends_extract_page_ranges(make_pdf, name):
+    data = make_pdf(["Alpha", "Beta", "Gamma"])
+    backend = get_backend(name)
+
+    assert backend.page_count(io.BytesIO(data)) == 3
+    assert backend.extract(io.BytesIO(data), 1, 3) == "BetaGamma"
+    assert backend.extract(io.BytesIO(data)) == "AlphaBetaGamma"
+
+
+def test_policy_rules_by_size_and_pages():
+    policy = ExtractionPolicy({
+        ".pdf": [(1000, 2, "pypdf"), (None, None, "pypdf2")],
+        ".docx": [(None, None, "docx_xml")]
+    })
+
+    assert policy.choose(".pdf", 500, 1).name == "pypdf"
+    assert policy.choose(".pdf", 500, 5).name == "pypdf2"
+    assert policy.choose(".pdf", 5000, 1).name == "pypdf2"
+    assert policy.choose(".docx", 10 ** 9).name == "docx_xml"
+
+
+def test_policy_skips_uninstalled_backends(monkeypatch):
+    class Missing(ExtractionBackend):
+        name = "missing"
+        extension = ".pdf"
+        module = "not_a_real_pdf_module"
+
+        def extract_pages(self, document, start=0, end=None):
+            return ""
+
+    monkeypatch.setitem(BACKENDS, "missing", Missing())
+    policy = ExtractionPolicy({".pdf": [(None, None, "missing")]})
+
+    assert policy.choose(".pdf", 100, 1).name == "pypdf2"
+    with pytest.raises(ValueError):
+        policy.choose(".txt", 100)
+
+
+def test_backends_must_implement_extract_pages():
+    class Incomplete(ExtractionBackend):
+        name = "incomplete"
+        extension = ".pdf"
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_parser_opens_each_pdf_once(blank_spacy, make_pdf, monkeypatch):
+    backend = get_backend("pypdf")
+    opened = []
+    original_open = backend.open
+    monkeypatch.setattr(backend, "open", lambda stream: opened.append(stream) or original_open(stream))
+    parser = ResumeParser(pdf_workers=1, extraction_policy=ExtractionPolicy({".pdf": [(None, None, "pypdf")]}))
+
+    assert parser.extract_text_from_pdf(make_pdf(["Alpha", "Beta"])) == "AlphaBeta"
+    assert len(opened) == 1
+
+
+def test_policy_from_benchmark_picks_fastest_acceptable():
+    def result(sample, backend, size, speed, quality):
+        return {"sample": sample, "extension": ".pdf", "backend": backend, "bytes": size,
+                "pages": size // 1000, "bytes_per_second": speed, "quality": quality}
+
+    results = [
+        result("small", "pypdf", 1000, 9.0, 0.99), result("small", "pypdf2", 1000, 5.0, 0.99),
+        result("medium", "pypdf", 8000, 9.0, 0.99), result("medium", "pypdf2", 8000, 5.0, 0.99),
+        # The fastest backend garbles the large file, so the slower one wins
+        result("large", "pypdf", 64000, 9.0, 0.50), result("large", "pypdf2", 64000, 5.0, 0.98),
+    ]
+
+    assert ExtractionPolicy.from_benchmark(results).rules == {
+        ".pdf": [(8000, 8, "pypdf"), (None, None, "pypdf2")]
+    }
+
+
+def test_parser_extracts_with_chosen_backend(blank_spacy, make_pdf):
+    policy = ExtractionPolicy({".pdf": [(None, None, "pypdf")]})
+    parser = ResumeParser(pdf_workers=2, parallel_page_threshold=2, extraction_policy=policy)
+    try:
+        data = make_pdf([f"Page{i}" for i in range(4)])
+
+        assert parser.extract_text_from_pdf(data) == "Page0Page1Page2Page3"
+        assert parser._pdf_pool is not None
+        assert parser.extract_text(build_docx(["Jane Doe", "Python"]), "cv.docx") == "Jane Doe\n\nPython"
+    finally:
+        parser.close()
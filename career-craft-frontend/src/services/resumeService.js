@@ -153,13 +153,35 @@ export const resumeService = {
         body: formData,
       });
       
-      return handleResponse(response);
+      // Parsing happens in the background; wait for the job to finish
+      const job = await handleResponse(response);
+      return await this.waitForParseJob(job.id);
     } catch (error) {
       console.error('Upload resume error:', error);
       throw error;
     }
   },
 
+  async waitForParseJob(jobId, { intervalMs = 1000, timeoutMs = 120000 } = {}) {
+    const deadline = Date.now() + timeoutMs;
+    while (Date.now() < deadline) {
+      const headers = await getHeaders();
+      const response = await fetch(`${API_URL}/api/resumes/upload/jobs/${jobId}`, { headers });
+      const job = await handleResponse(response);
+
+      if (job.status === 'completed') {
+        const result = await fetch(`${API_URL}/api/resumes/upload/jobs/${jobId}/result`, { headers });
+        return handleResponse(result);
+      }
+      if (job.status === 'failed') {
+        throw new Error(job.error || 'Failed to parse resume');
+      }
+
+      await new Promise((resolve) => setTimeout(resolve, intervalMs));
+    }
+    throw new Error('Timed out waiting for resume to be parsed');
+  },
+
   async getJobRecommendations(resumeId) {
     try {
       const response = await fetch(`${API_URL}/api/jobs/recommendations?resume_id=${resumeId}`, { 